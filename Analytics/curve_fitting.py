@@ -0,0 +1,407 @@
+"""Nelson-Siegel, Svensson and spline fits of the nominal Treasury curve.
+
+Every fit works on a (dates x tenors) yield matrix at once; NaN marks a
+missing tenor on a given date. For a fixed decay parameter the parametric
+models are linear in their betas, so each date is a small weighted least
+squares solve, batched across dates. The decay parameters are chosen by a
+coarse grid and then refined per date with a bracketed golden-section
+search seeded from the grid optimum, or from ``initial_lambda`` (e.g. the
+previous run's fit) where it is finite; only unseeded dates pay for the grid.
+
+CMT yields are treated as continuously compounded zero rates for the fit.
+Discount, par (semi-annual coupons) and instantaneous forward curves are
+then derived from the fitted zero curve at any maturities.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Analytics.yield_curve_analytics import TENOR_ORDER, _snapshots
+from Signals import state_paths
+from Signals.json_utils import write_json
+
+
+TENOR_YEARS: Dict[str, float] = {
+    "3M": 0.25,
+    "6M": 0.5,
+    "1Y": 1.0,
+    "2Y": 2.0,
+    "3Y": 3.0,
+    "5Y": 5.0,
+    "7Y": 7.0,
+    "10Y": 10.0,
+    "20Y": 20.0,
+    "30Y": 30.0,
+}
+OUTPUT_MATURITIES = [0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 15.0, 20.0, 25.0, 30.0]
+FIT_ANCHORS = ["current", "last_week", "last_month", "last_6m", "start_of_year"]
+MODELS = ("nelson_siegel", "svensson", "spline")
+
+NS_LAMBDA_GRID = np.geomspace(0.1, 15.0, 40)
+SV_LAMBDA_GRID = np.geomspace(0.1, 15.0, 16)
+REFINE_ITERATIONS = 30
+SVENSSON_ROUNDS = 2
+MIN_POINTS = {"nelson_siegel": 4, "svensson": 6, "spline": 2}
+COUPON_FREQUENCY = 2
+_RIDGE = 1e-10
+_GOLDEN = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# --- curve objects -----------------------------------------------------------
+
+
+class _CurveFit(ABC):
+    """Shared discount/par derivations; subclasses provide zero and forward."""
+
+    model = ""
+
+    @abstractmethod
+    def zero(self, maturities: Sequence[float]) -> np.ndarray:
+        """Zero rates (percent), dates x maturities."""
+
+    @abstractmethod
+    def forward(self, maturities: Sequence[float]) -> np.ndarray:
+        """Instantaneous forward rates (percent), dates x maturities."""
+
+    def discount(self, maturities: Sequence[float]) -> np.ndarray:
+        tau = np.asarray(maturities, dtype="float64")
+        return np.exp(-self.zero(tau) / 100 * tau)
+
+    def par(self, maturities: Sequence[float]) -> np.ndarray:
+        """Par yield (percent) with coupons every ``1 / COUPON_FREQUENCY`` years."""
+        tau = np.asarray(maturities, dtype="float64")
+        step = 1.0 / COUPON_FREQUENCY
+        columns = []
+        for maturity in tau:
+            # Coupon dates counted back from maturity; the first period is a stub.
+            times = maturity - step * np.arange(int(np.ceil(maturity / step - 1e-9)))
+            times = np.sort(times[times > 1e-9])
+            accruals = np.diff(np.concatenate([[0.0], times]))
+            discounts = self.discount(times)
+            annuity = discounts @ accruals
+            columns.append((1.0 - discounts[:, -1]) / annuity * 100)
+        return np.stack(columns, axis=1) if columns else np.empty((0, 0))
+
+
+class ParametricFit(_CurveFit):
+    """Nelson-Siegel (3 betas, 1 lambda) or Svensson (4 betas, 2 lambdas)."""
+
+    def __init__(self, model: str, betas: np.ndarray, lambdas: np.ndarray, rmse_bps: np.ndarray) -> None:
+        self.model = model
+        self.betas = betas
+        self.lambdas = lambdas
+        self.rmse_bps = rmse_bps
+
+    def zero(self, maturities: Sequence[float]) -> np.ndarray:
+        tau = np.asarray(maturities, dtype="float64")
+        return np.einsum("dtk,dk->dt", _loadings(self.model, tau, self.lambdas), self.betas)
+
+    def forward(self, maturities: Sequence[float]) -> np.ndarray:
+        tau = np.asarray(maturities, dtype="float64")
+        x1 = tau[None, :] / self.lambdas[:, :1]
+        terms = [np.ones_like(x1), np.exp(-x1), x1 * np.exp(-x1)]
+        if self.model == "svensson":
+            x2 = tau[None, :] / self.lambdas[:, 1:2]
+            terms.append(x2 * np.exp(-x2))
+        return np.einsum("kdt,dk->dt", np.stack(terms), self.betas)
+
+    def params(self, row: int) -> Optional[Dict[str, float]]:
+        if np.isnan(self.betas[row]).any():
+            return None
+        out = {f"beta{idx}": float(value) for idx, value in enumerate(self.betas[row])}
+        for idx, value in enumerate(self.lambdas[row], start=1):
+            out[f"lambda{idx}" if self.model == "svensson" else "lambda"] = float(value)
+        return out
+
+
+class SplineFit(_CurveFit):
+    """Natural cubic spline through the observed tenors, flat beyond the ends."""
+
+    model = "spline"
+
+    def __init__(self, n_dates: int, groups: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]) -> None:
+        self.n_dates = n_dates
+        self.groups = groups  # (date rows, knots, yields, second derivatives)
+        # The spline interpolates, so fitted dates have zero error by construction.
+        self.rmse_bps = np.full(n_dates, np.nan)
+        for rows, _, _, _ in groups:
+            self.rmse_bps[rows] = 0.0
+
+    def _evaluate(self, maturities: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        tau = np.asarray(maturities, dtype="float64")
+        value = np.full((self.n_dates, len(tau)), np.nan)
+        slope = np.full((self.n_dates, len(tau)), np.nan)
+        for rows, knots, y, m in self.groups:
+            t = np.clip(tau, knots[0], knots[-1])
+            inside = (tau >= knots[0]) & (tau <= knots[-1])
+            i = np.clip(np.searchsorted(knots, t, side="right") - 1, 0, len(knots) - 2)
+            h = knots[i + 1] - knots[i]
+            a = (knots[i + 1] - t) / h
+            b = (t - knots[i]) / h
+            y0, y1, m0, m1 = y[:, i], y[:, i + 1], m[:, i], m[:, i + 1]
+            value[rows] = a * y0 + b * y1 + ((a**3 - a) * m0 + (b**3 - b) * m1) * h**2 / 6
+            d = (y1 - y0) / h + (-(3 * a**2 - 1) * m0 + (3 * b**2 - 1) * m1) * h / 6
+            slope[rows] = np.where(inside, d, 0.0)
+        return value, slope
+
+    def zero(self, maturities: Sequence[float]) -> np.ndarray:
+        return self._evaluate(maturities)[0]
+
+    def forward(self, maturities: Sequence[float]) -> np.ndarray:
+        tau = np.asarray(maturities, dtype="float64")
+        value, slope = self._evaluate(tau)
+        return value + tau[None, :] * slope
+
+
+# --- parametric fitting ------------------------------------------------------
+
+
+def _loadings(model: str, tau: np.ndarray, lambdas: np.ndarray) -> np.ndarray:
+    """Factor loadings (dates x tenors x betas) for per-date decay parameters."""
+    def _pair(lam: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        x = tau[None, :] / lam[:, None]
+        slope = -np.expm1(-x) / x
+        return slope, slope - np.exp(-x)
+
+    slope1, curve1 = _pair(lambdas[:, 0])
+    columns = [np.ones_like(slope1), slope1, curve1]
+    if model == "svensson":
+        columns.append(_pair(lambdas[:, 1])[1])
+    return np.stack(columns, axis=-1)
+
+
+def _solve(loadings: np.ndarray, yields: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched weighted least squares -> (betas, sum of squared errors)."""
+    gram = np.einsum("dt,dti,dtj->dij", weights, loadings, loadings)
+    gram += _RIDGE * np.eye(loadings.shape[-1])
+    rhs = np.einsum("dt,dti,dt->di", weights, loadings, yields)
+    betas = np.linalg.solve(gram, rhs[..., None])[..., 0]
+    residual = (yields - np.einsum("dti,di->dt", loadings, betas)) * weights
+    return betas, np.einsum("dt,dt->d", residual, residual)
+
+
+def _sse(model: str, tau: np.ndarray, lambdas: np.ndarray, yields: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    return _solve(_loadings(model, tau, lambdas), yields, weights)[1]
+
+
+def _golden_refine(
+    objective, low: np.ndarray, high: np.ndarray, iterations: int = REFINE_ITERATIONS
+) -> np.ndarray:
+    """Per-date golden-section minimisation in log space between low and high."""
+    a, b = np.log(low), np.log(high)
+    c = b - _GOLDEN * (b - a)
+    d = a + _GOLDEN * (b - a)
+    fc, fd = objective(np.exp(c)), objective(np.exp(d))
+    for _ in range(iterations):
+        left = fc < fd
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+        c, d = b - _GOLDEN * (b - a), a + _GOLDEN * (b - a)
+        fc, fd = objective(np.exp(c)), objective(np.exp(d))
+    return np.exp((a + b) / 2)
+
+
+def _grid_bracket(grid: np.ndarray, best: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return grid[np.maximum(best - 1, 0)], grid[np.minimum(best + 1, len(grid) - 1)]
+
+
+def _seeds(initial: Optional[np.ndarray], shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """(starting decay parameters, rows without a usable seed) from ``initial``."""
+    if initial is None:
+        return np.full(shape, np.nan), np.ones(shape[0], dtype=bool)
+    start = np.broadcast_to(np.asarray(initial, dtype="float64"), shape).copy()
+    usable = np.isfinite(start) & (start > 0)
+    cold = ~usable.reshape(shape[0], -1).all(axis=1)
+    return start, cold
+
+
+def _prepare(maturities: Sequence[float], yields: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    tau = np.asarray(maturities, dtype="float64")
+    values = np.atleast_2d(np.asarray(yields, dtype="float64"))
+    weights = (~np.isnan(values)).astype("float64")
+    return tau, np.nan_to_num(values), weights
+
+
+def _finish(model: str, betas: np.ndarray, lambdas: np.ndarray, sse: np.ndarray, weights: np.ndarray) -> ParametricFit:
+    counts = weights.sum(axis=1)
+    usable = counts >= MIN_POINTS[model]
+    betas = np.where(usable[:, None], betas, np.nan)
+    lambdas = np.where(usable[:, None], lambdas, np.nan)
+    rmse = np.where(usable, np.sqrt(sse / np.maximum(counts, 1)) * 100, np.nan)
+    return ParametricFit(model, betas, lambdas, rmse)
+
+
+def fit_nelson_siegel(
+    maturities: Sequence[float],
+    yields: np.ndarray,
+    initial_lambda: Optional[np.ndarray] = None,
+    grid: np.ndarray = NS_LAMBDA_GRID,
+) -> ParametricFit:
+    """Fit every row of ``yields`` (percent, NaN = missing) in one batch."""
+    tau, values, weights = _prepare(maturities, yields)
+    n_dates = len(values)
+
+    def objective(lam: np.ndarray) -> np.ndarray:
+        return _sse("nelson_siegel", tau, lam[:, None], values, weights)
+
+    start, cold = _seeds(initial_lambda, (n_dates,))
+    low, high = start / 1.5, start * 1.5
+    if cold.any():
+        rows = int(cold.sum())
+        scores = np.stack(
+            [_sse("nelson_siegel", tau, np.full((rows, 1), lam), values[cold], weights[cold]) for lam in grid]
+        )
+        low[cold], high[cold] = _grid_bracket(grid, np.argmin(scores, axis=0))
+    lam = _golden_refine(objective, low, high)[:, None]
+    betas, sse = _solve(_loadings("nelson_siegel", tau, lam), values, weights)
+    return _finish("nelson_siegel", betas, lam, sse, weights)
+
+
+def fit_svensson(
+    maturities: Sequence[float],
+    yields: np.ndarray,
+    initial_lambdas: Optional[np.ndarray] = None,
+    grid: np.ndarray = SV_LAMBDA_GRID,
+) -> ParametricFit:
+    """Svensson fit: grid over (lambda1 < lambda2), then coordinate refinement."""
+    tau, values, weights = _prepare(maturities, yields)
+    n_dates = len(values)
+
+    def objective(lam1: np.ndarray, lam2: np.ndarray) -> np.ndarray:
+        return _sse("svensson", tau, np.stack([lam1, lam2], axis=1), values, weights)
+
+    start, cold = _seeds(initial_lambdas, (n_dates, 2))
+    lam1, lam2 = start[:, 0], start[:, 1]
+    if cold.any():
+        rows = int(cold.sum())
+        pairs = [(i, j) for i in range(len(grid)) for j in range(i + 1, len(grid))]
+        scores = np.stack(
+            [
+                _sse("svensson", tau, np.tile([grid[i], grid[j]], (rows, 1)), values[cold], weights[cold])
+                for i, j in pairs
+            ]
+        )
+        best = np.array(pairs)[np.argmin(scores, axis=0)]
+        lam1[cold], lam2[cold] = grid[best[:, 0]], grid[best[:, 1]]
+    for _ in range(SVENSSON_ROUNDS):
+        fixed2 = lam2
+        lam1 = _golden_refine(lambda lam: objective(lam, fixed2), lam1 / 1.5, lam1 * 1.5)
+        fixed1 = lam1
+        lam2 = _golden_refine(lambda lam: objective(fixed1, lam), lam2 / 1.5, lam2 * 1.5)
+    lambdas = np.stack([lam1, lam2], axis=1)
+    betas, sse = _solve(_loadings("svensson", tau, lambdas), values, weights)
+    return _finish("svensson", betas, lambdas, sse, weights)
+
+
+def fit_spline(maturities: Sequence[float], yields: np.ndarray) -> SplineFit:
+    """Natural cubic spline per date, solved in batches of identical tenor masks."""
+    tau = np.asarray(maturities, dtype="float64")
+    values = np.atleast_2d(np.asarray(yields, dtype="float64"))
+    present = ~np.isnan(values)
+    groups = []
+    patterns, inverse = np.unique(present, axis=0, return_inverse=True)
+    for pattern_idx, pattern in enumerate(patterns):
+        if pattern.sum() < MIN_POINTS["spline"]:
+            continue
+        rows = np.flatnonzero(inverse.ravel() == pattern_idx)
+        knots = tau[pattern]
+        order = np.argsort(knots)
+        knots = knots[order]
+        y = values[np.ix_(rows, np.flatnonzero(pattern)[order])]
+        n = len(knots)
+        second = np.zeros((len(rows), n))
+        if n > 2:
+            h = np.diff(knots)
+            system = np.zeros((n - 2, n - 2))
+            idx = np.arange(n - 2)
+            system[idx, idx] = 2 * (h[:-1] + h[1:])
+            system[idx[1:], idx[:-1]] = h[1:-1]
+            system[idx[:-1], idx[1:]] = h[1:-1]
+            slopes = np.diff(y, axis=1) / h
+            rhs = 6 * (slopes[:, 1:] - slopes[:, :-1])
+            second[:, 1:-1] = np.linalg.solve(system, rhs.T).T
+        groups.append((rows, knots, y, second))
+    return SplineFit(len(values), groups)
+
+
+def fit_curves(
+    maturities: Sequence[float],
+    yields: np.ndarray,
+    models: Sequence[str] = MODELS,
+) -> Dict[str, _CurveFit]:
+    fitters = {"nelson_siegel": fit_nelson_siegel, "svensson": fit_svensson, "spline": fit_spline}
+    return {model: fitters[model](maturities, yields) for model in models}
+
+
+# --- daily_state block -------------------------------------------------------
+
+
+def _anchor_matrix(raw_state: Dict[str, Any]) -> np.ndarray:
+    duration = raw_state.get("duration", {}) if isinstance(raw_state, dict) else {}
+    rows = np.full((len(FIT_ANCHORS), len(TENOR_ORDER)), np.nan)
+    for col, (_, key) in enumerate(TENOR_ORDER):
+        item = duration.get(key, {}) if isinstance(duration, dict) else {}
+        snapshots = _snapshots(item if isinstance(item, dict) else {})
+        for row, anchor in enumerate(FIT_ANCHORS):
+            value = snapshots.get(anchor)
+            if isinstance(value, (int, float)) and np.isfinite(value):
+                rows[row, col] = float(value)
+    return rows
+
+
+def _curve_lists(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(v) else round(float(v), 6) for v in values]
+
+
+def build_yield_curve_fit_block(raw_state: Dict[str, Any]) -> Dict[str, Any]:
+    tenors = [tenor for tenor, _ in TENOR_ORDER]
+    yields = _anchor_matrix(raw_state)
+    fits = fit_curves([TENOR_YEARS[t] for t in tenors], yields)
+    models: Dict[str, Any] = {}
+    for model, fit in fits.items():
+        zero, par, forward = fit.zero(OUTPUT_MATURITIES), fit.par(OUTPUT_MATURITIES), fit.forward(OUTPUT_MATURITIES)
+        per_anchor: Dict[str, Any] = {}
+        for row, anchor in enumerate(FIT_ANCHORS):
+            usable = not np.isnan(fit.rmse_bps[row])
+            per_anchor[anchor] = {
+                "params": fit.params(row) if isinstance(fit, ParametricFit) else None,
+                "rmse_bps": round(float(fit.rmse_bps[row]), 4) if usable else None,
+                "zero": _curve_lists(zero[row]) if usable else None,
+                "par": _curve_lists(par[row]) if usable else None,
+                "forward": _curve_lists(forward[row]) if usable else None,
+            }
+        models[model] = per_anchor
+    return {
+        "computed_at": _now_iso(),
+        "maturities_years": OUTPUT_MATURITIES,
+        "input_tenors": tenors,
+        "anchors": FIT_ANCHORS,
+        "convention": "inputs treated as continuously compounded zero rates; par uses semi-annual coupons",
+        "models": models,
+    }
+
+
+def write_daily_state(
+    raw_state_path: Path | str = state_paths.RAW_STATE_PATH,
+    daily_state_path: Path | str = state_paths.DAILY_STATE_PATH,
+) -> Dict[str, Any]:
+    raw_state = json.loads(Path(raw_state_path).read_text(encoding="utf-8"))
+    daily_path = Path(daily_state_path)
+    daily = {}
+    if daily_path.exists():
+        daily = json.loads(daily_path.read_text(encoding="utf-8") or "{}")
+        if not isinstance(daily, dict):
+            daily = {}
+    daily["yield_curve_fit"] = build_yield_curve_fit_block(raw_state)
+    write_json(daily_path, daily)
+    return daily
@@ -1,54 +1,33 @@
 """FX panel analytics from raw_state.json."""
 # NOTE: Evidence-only block. No resolver consumes this data in V1.
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from Signals import state_paths
+import numpy as np
+
+from Signals import series_registry, state_paths
 from Signals.json_utils import write_json
 
 
-FX_ORDER = [
-    ("USDJPY", "usdjpy"),
-    ("EURUSD", "eurusd"),
-    ("GBPUSD", "gbpusd"),
-    ("USDCAD", "usdcad"),
-    ("AUDUSD", "audusd"),
-    ("NZDUSD", "nzdusd"),
-    ("USDNOK", "usdnok"),
-    ("USDMXN", "usdmxn"),
-    ("USDZAR", "usdzar"),
-    ("USDCHF", "usdchf"),
-    ("USDCNH", "usdcnh"),
-]
+_FX_SPECS = series_registry.registry().section("fx").series
+FX_ORDER = [(spec.attrs["label"], spec.key) for spec in _FX_SPECS]
 
 FX_MATRIX_CURRENCIES = ["USD", "EUR", "JPY", "GBP", "CNH", "CHF", "AUD", "CAD"]
+# Direct (XXXUSD) quotes first, then inverse (USDXXX), each in registry order.
 FX_TO_USD = {
-    "EUR": ("eurusd", "direct"),
-    "GBP": ("gbpusd", "direct"),
-    "AUD": ("audusd", "direct"),
-    "NZD": ("nzdusd", "direct"),
-    "JPY": ("usdjpy", "inverse"),
-    "CAD": ("usdcad", "inverse"),
-    "NOK": ("usdnok", "inverse"),
-    "MXN": ("usdmxn", "inverse"),
-    "ZAR": ("usdzar", "inverse"),
-    "CHF": ("usdchf", "inverse"),
-    "CNH": ("usdcnh", "inverse"),
-}
-POLICY_RATE_KEYS = {
-    "EUR": "eur",
-    "GBP": "gbp",
-    "JPY": "jpy",
-    "CHF": "chf",
-    "AUD": "aud",
-    "NZD": "nzd",
-    "CAD": "cad",
-    "CNH": "cnh",
+    spec.attrs["currency"]: (spec.key, spec.attrs["quote"])
+    for spec in sorted(_FX_SPECS, key=lambda spec: spec.attrs["quote"] != "direct")
 }
+POLICY_RATE_KEYS = {spec.attrs["currency"]: spec.key for spec in series_registry.registry().section("policy_rates").series}
 RISK_ON_CURRENCIES = ["AUD", "NZD", "NOK", "MXN", "ZAR"]
 RISK_OFF_CURRENCIES = ["JPY", "CHF", "USD"]
+FX_ALL_CURRENCIES = ["USD"] + list(FX_TO_USD)
+ANCHOR_KEYS = ["current", "last_week", "last_month", "last_6m", "start_of_year"]
+MATRIX_ANCHORS = [("1W", "last_week"), ("1M", "last_month"), ("6M", "last_6m"), ("SOY", "start_of_year")]
+BASKET_ANCHORS = ["start_of_year", "last_6m", "last_month", "last_week", "current"]
 
 
 def _now_iso() -> str:
@@ -107,26 +86,86 @@ def _quality(entry: Dict[str, Any], anchors: Dict[str, Optional[float]]) -> str:
     return "FAILED"
 
 
-def _anchor_value(entry: Dict[str, Any], key: str) -> Optional[float]:
-    return _anchors_from_meta(entry).get(key)
+@dataclass(frozen=True)
+class FxValueGrid:
+    """USD value of one unit of each currency at each anchor (NaN = missing)."""
+
+    currencies: List[str]
+    anchors: List[str]
+    usd: np.ndarray
+
+    def row(self, currency: str) -> int:
+        return self.currencies.index(currency)
+
+    def column(self, anchor: str) -> int:
+        return self.anchors.index(anchor)
+
+    def subset(self, currencies: List[str]) -> "FxValueGrid":
+        rows = [self.row(ccy) for ccy in currencies]
+        return FxValueGrid(list(currencies), self.anchors, self.usd[rows])
+
+
+def build_value_grid(raw_state: Dict[str, Any], currencies: List[str] = FX_ALL_CURRENCIES) -> FxValueGrid:
+    """Parse each pair's anchors once into a (currency x anchor) USD-value array."""
+    usd = np.full((len(currencies), len(ANCHOR_KEYS)), np.nan)
+    for i, currency in enumerate(currencies):
+        if currency == "USD":
+            usd[i, :] = 1.0
+            continue
+        mapping = FX_TO_USD.get(currency)
+        if not mapping:
+            continue
+        fx_key, orientation = mapping
+        anchors = _anchors_from_meta(_get_entry(raw_state, "fx", fx_key))
+        quotes = np.array([np.nan if anchors[key] is None else anchors[key] for key in ANCHOR_KEYS])
+        if orientation == "direct":
+            usd[i, :] = quotes
+        else:
+            with np.errstate(divide="ignore"):
+                usd[i, :] = np.where(quotes == 0, np.nan, 1.0 / quotes)
+    return FxValueGrid(list(currencies), list(ANCHOR_KEYS), usd)
+
+
+def _nan_to_none(values: np.ndarray) -> list:
+    return [[None if not np.isfinite(v) else float(v) for v in row] for row in values]
+
+
+def cross_rates(grid: FxValueGrid) -> np.ndarray:
+    """(base x quote x anchor) units of quote per unit of base."""
+    quote = np.where(grid.usd == 0, np.nan, grid.usd)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return grid.usd[:, None, :] / quote[None, :, :]
+
 
+def pct_change_matrices(grid: FxValueGrid) -> np.ndarray:
+    """(anchor x base x quote) % change of each cross rate from anchor to current."""
+    rates = cross_rates(grid)
+    current = rates[:, :, grid.column("current")]
+    prior = np.moveaxis(rates, 2, 0)
+    prior = np.where(prior == 0, np.nan, prior)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (current[None, :, :] / prior - 1) * 100
 
-def _usd_per_currency(raw_state: Dict[str, Any], currency: str, anchor_key: str) -> Optional[float]:
-    if currency == "USD":
-        return 1.0
-    mapping = FX_TO_USD.get(currency)
-    if not mapping:
-        return None
-    fx_key, orientation = mapping
-    entry = _get_entry(raw_state, "fx", fx_key)
-    value = _anchor_value(entry, anchor_key)
-    if value is None:
-        return None
-    if orientation == "direct":
-        return value
-    if value == 0:
-        return None
-    return 1.0 / value
+
+def _matrix_quality(grid: FxValueGrid, anchor_key: str) -> str:
+    available = int(
+        np.sum(~np.isnan(grid.usd[:, grid.column(anchor_key)]) & ~np.isnan(grid.usd[:, grid.column("current")]))
+    )
+    if available == len(grid.currencies):
+        return "OK"
+    if available > 0:
+        return "PARTIAL"
+    return "FAILED"
+
+
+def _matrix_block(grid: FxValueGrid, changes: np.ndarray, label: str, anchor_key: str) -> Dict[str, Any]:
+    return {
+        "anchor": label,
+        "currencies": list(grid.currencies),
+        "values_pct": _nan_to_none(changes[grid.column(anchor_key)]),
+        "data_quality": _matrix_quality(grid, anchor_key),
+        "computed_at": _now_iso(),
+    }
 
 
 def _build_rate_differentials(raw_state: Dict[str, Any]) -> Dict[str, Any]:
@@ -178,84 +217,41 @@ def _build_rate_differentials(raw_state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _build_fx_matrix(raw_state: Dict[str, Any]) -> Dict[str, Any]:
-    anchor_key = "last_month"
-    current_key = "current"
-    currencies = FX_MATRIX_CURRENCIES
-    anchor_values = {ccy: _usd_per_currency(raw_state, ccy, anchor_key) for ccy in currencies}
-    current_values = {ccy: _usd_per_currency(raw_state, ccy, current_key) for ccy in currencies}
-
-    matrix: list[list[Optional[float]]] = []
-    for base in currencies:
-        row: list[Optional[float]] = []
-        for quote in currencies:
-            base_current = current_values.get(base)
-            quote_current = current_values.get(quote)
-            base_anchor = anchor_values.get(base)
-            quote_anchor = anchor_values.get(quote)
-            if base_current is None or quote_current in (None, 0):
-                row.append(None)
-                continue
-            if base_anchor is None or quote_anchor in (None, 0):
-                row.append(None)
-                continue
-            current_rate = base_current / quote_current
-            anchor_rate = base_anchor / quote_anchor
-            if anchor_rate == 0:
-                row.append(None)
-            else:
-                row.append((current_rate / anchor_rate - 1) * 100)
-        matrix.append(row)
-
-    available = sum(
-        1
-        for ccy in currencies
-        if anchor_values.get(ccy) is not None and current_values.get(ccy) is not None
-    )
-    if available == len(currencies):
-        quality = "OK"
-    elif available > 0:
-        quality = "PARTIAL"
-    else:
-        quality = "FAILED"
-    return {
-        "anchor": "1M",
-        "currencies": currencies,
-        "values_pct": matrix,
-        "data_quality": quality,
-        "computed_at": _now_iso(),
-    }
+def _build_fx_matrix(raw_state: Dict[str, Any], grid: Optional[FxValueGrid] = None) -> Dict[str, Any]:
+    grid = (grid or build_value_grid(raw_state)).subset(FX_MATRIX_CURRENCIES)
+    return _matrix_block(grid, pct_change_matrices(grid), "1M", "last_month")
+
 
+def _build_fx_matrices(grid: FxValueGrid) -> Dict[str, Any]:
+    changes = pct_change_matrices(grid)
+    return {label: _matrix_block(grid, changes, label, anchor_key) for label, anchor_key in MATRIX_ANCHORS}
 
-def _basket_index(raw_state: Dict[str, Any], currencies: list[str]) -> Dict[str, Any]:
-    anchors = ["start_of_year", "last_6m", "last_month", "last_week", "current"]
+
+def _basket_index(
+    raw_state: Dict[str, Any],
+    currencies: list[str],
+    grid: Optional[FxValueGrid] = None,
+) -> Dict[str, Any]:
     base_anchor = "start_of_year"
-    included = []
-    missing = []
-
-    base_values = {}
-    for currency in currencies:
-        value = _usd_per_currency(raw_state, currency, base_anchor)
-        if value is None:
-            missing.append(currency)
-        else:
-            base_values[currency] = value
-            included.append(currency)
-
-    index_anchors: Dict[str, Optional[float]] = {}
-    for anchor in anchors:
-        values = []
-        for currency in included:
-            base_value = base_values.get(currency)
-            anchor_value = _usd_per_currency(raw_state, currency, anchor)
-            if base_value in (None, 0) or anchor_value is None:
-                continue
-            values.append((anchor_value / base_value) * 100)
-        index_anchors[anchor] = sum(values) / len(values) if values else None
+    grid = (grid or build_value_grid(raw_state)).subset(currencies)
+    base = grid.usd[:, grid.column(base_anchor)]
+    included_mask = ~np.isnan(base)
+    included = [ccy for ccy, ok in zip(currencies, included_mask) if ok]
+    missing = [ccy for ccy, ok in zip(currencies, included_mask) if not ok]
+
+    usable = included_mask & (base != 0)
+    columns = [grid.column(anchor) for anchor in BASKET_ANCHORS]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        levels = grid.usd[usable][:, columns] / base[usable][:, None] * 100
+    counts = np.sum(~np.isnan(levels), axis=0)
+    sums = np.nansum(levels, axis=0)
+    index_anchors: Dict[str, Optional[float]] = {
+        anchor: float(sums[i] / counts[i]) if counts[i] else None for i, anchor in enumerate(BASKET_ANCHORS)
+    }
 
     if not included:
         quality = "FAILED"
-    elif any(index_anchors[anchor] is None for anchor in anchors):
+    elif any(index_anchors[anchor] is None for anchor in BASKET_ANCHORS):
         quality = "PARTIAL"
     else:
         quality = "OK"
@@ -271,11 +267,12 @@ def _basket_index(raw_state: Dict[str, Any], currencies: list[str]) -> Dict[str,
     }
 
 
-def _build_risk_baskets(raw_state: Dict[str, Any]) -> Dict[str, Any]:
-    risk_on = _basket_index(raw_state, RISK_ON_CURRENCIES)
-    risk_off = _basket_index(raw_state, RISK_OFF_CURRENCIES)
+def _build_risk_baskets(raw_state: Dict[str, Any], grid: Optional[FxValueGrid] = None) -> Dict[str, Any]:
+    grid = grid or build_value_grid(raw_state)
+    risk_on = _basket_index(raw_state, RISK_ON_CURRENCIES, grid)
+    risk_off = _basket_index(raw_state, RISK_OFF_CURRENCIES, grid)
     spread = {}
-    for anchor in ("start_of_year", "last_6m", "last_month", "last_week", "current"):
+    for anchor in BASKET_ANCHORS:
         on_val = risk_on["anchors"].get(anchor)
         off_val = risk_off["anchors"].get(anchor)
         spread[anchor] = None if on_val is None or off_val is None else on_val - off_val
@@ -330,13 +327,15 @@ def build_fx_panel(raw_state: Dict[str, Any]) -> Dict[str, Any]:
         )
 
     dxy = _resolve_dxy(raw_state)
+    grid = build_value_grid(raw_state)
 
     return {
         "dxy": dxy,
         "pairs": pairs,
         "rate_differentials": _build_rate_differentials(raw_state),
-        "matrix_1m_pct": _build_fx_matrix(raw_state),
-        "risk_baskets": _build_risk_baskets(raw_state),
+        "matrix_1m_pct": _build_fx_matrix(raw_state, grid),
+        "matrices_pct": _build_fx_matrices(grid),
+        "risk_baskets": _build_risk_baskets(raw_state, grid),
     }
 
 
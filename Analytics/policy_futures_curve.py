@@ -4,10 +4,19 @@ from pathlib import Path
 import json
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+from Analytics.policy_path import FOMC_CALENDAR_PATH, contract_month, implied_path, load_fomc_calendar
 from Signals import state_paths
 from Signals.json_utils import write_json
 
 
+ANCHORS = ["current", "last_week", "last_month", "last_6m", "start_of_year"]
+PROXY_HORIZON_MONTHS = (6, 12)
+CHANGE_HORIZON_MONTHS = 12
+DIRECTION_THRESHOLD_BPS = 12.5
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -37,6 +46,89 @@ def _month_label(ticker: str) -> Optional[str]:
     return f"{month} {year}"
 
 
+def _optional(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(v) else round(float(v), 6) for v in values]
+
+
+def _spot_anchors(raw_state: Dict[str, Any]) -> np.ndarray:
+    policy = raw_state.get("policy", {}) if isinstance(raw_state, dict) else {}
+    entry = policy.get("effr", {}) if isinstance(policy, dict) else {}
+    meta = entry.get("meta", {}) if isinstance(entry, dict) else {}
+    meta = meta if isinstance(meta, dict) else {}
+    spot = []
+    for anchor in ANCHORS:
+        value = meta.get(anchor, entry.get("value") if anchor == "current" else None)
+        spot.append(float(value) if isinstance(value, (int, float)) else np.nan)
+    return np.array(spot)
+
+
+def build_implied_path(
+    raw_state: Dict[str, Any],
+    lines: Dict[str, List[Any]],
+    calendar_path: Path | str = FOMC_CALENDAR_PATH,
+) -> Dict[str, Any]:
+    """Meeting-by-meeting implied path for every anchor in one array pass."""
+    months = [contract_month(ticker) for ticker in lines["tenors"]]
+    columns = [idx for idx, month in enumerate(months) if month is not None]
+    prices = np.array(
+        [
+            [np.nan if lines[anchor][idx] is None else float(lines[anchor][idx]) for idx in columns]
+            for anchor in ANCHORS
+        ],
+        dtype="float64",
+    ).reshape(len(ANCHORS), len(columns))
+    meetings = load_fomc_calendar(calendar_path)
+    path = implied_path(prices, [months[idx] for idx in columns], meetings, _spot_anchors(raw_state))
+
+    anchors: Dict[str, Any] = {}
+    for row, anchor in enumerate(ANCHORS):
+        anchors[anchor] = {
+            key: _optional(path[key][row])
+            for key in (
+                "implied_rates",
+                "pre_meeting",
+                "post_meeting",
+                "change_bps",
+                "cumulative_bps",
+                "hike_probability",
+                "cut_probability",
+            )
+        }
+
+    # Headline reads for the resolver come from the current anchor.
+    offsets = [int(month[:4]) * 12 + int(month[5:7]) for month in path["months"]]
+    offsets = [offset - offsets[0] for offset in offsets]
+    low, high = PROXY_HORIZON_MONTHS
+    horizon = np.array([rate for rate, offset in zip(path["implied_rates"][0], offsets) if low <= offset <= high])
+    horizon = horizon[~np.isnan(horizon)]
+    proxy = round(float(horizon.mean()), 6) if horizon.size else None
+    front = int(path["months"][0][:4]) * 12 + int(path["months"][0][5:7]) if path["months"] else None
+    within_year = [
+        idx
+        for idx, meeting in enumerate(path["meetings"])
+        if front is not None and int(meeting[:4]) * 12 + int(meeting[5:7]) - front < CHANGE_HORIZON_MONTHS
+    ]
+    change_12m = path["cumulative_bps"][0][within_year[-1]] if within_year else np.nan
+    # The 12m change only sees meetings that are both in the calendar and inside the contract strip.
+    horizon_months = None
+    if front is not None:
+        calendar_end = meetings[-1].year * 12 + meetings[-1].month if meetings else front - 1
+        covered = min(front + CHANGE_HORIZON_MONTHS - 1, front + offsets[-1], calendar_end)
+        horizon_months = max(covered - front + 1, 0)
+    return {
+        "months": path["months"],
+        "meetings": path["meetings"],
+        "anchors": anchors,
+        "policy_pricing_proxy": proxy,
+        "implied_change_12m_bps": None if np.isnan(change_12m) else round(float(change_12m), 4),
+        "implied_change_horizon_months": horizon_months,
+        "implied_change_partial": horizon_months is not None and horizon_months < CHANGE_HORIZON_MONTHS,
+        "fomc_calendar_ends": meetings[-1].isoformat() if meetings else None,
+        "direction_threshold_bps": DIRECTION_THRESHOLD_BPS,
+        "method": "100 - price; meeting-weighted monthly averages chained from EFFR",
+    }
+
+
 def build_policy_futures_curve(raw_state: Dict[str, Any]) -> Dict[str, Any]:
     futures = raw_state.get("policy_futures", {})
     zq = futures.get("zq", {}) if isinstance(futures, dict) else {}
@@ -87,18 +179,25 @@ def build_policy_futures_curve(raw_state: Dict[str, Any]) -> Dict[str, Any]:
         last_week.append(last_week_price)
         current.append(current_price)
 
+    curve_lines = {
+        "tenors": tenors,
+        "labels": labels,
+        "start_of_year": start_of_year,
+        "last_6m": last_6m,
+        "last_month": last_month,
+        "last_week": last_week,
+        "current": current,
+    }
+    implied = build_implied_path(raw_state, curve_lines)
     return {
         "as_of": _now_iso(),
         "contracts": contracts,
-        "curve_lines": {
-            "tenors": tenors,
-            "labels": labels,
-            "start_of_year": start_of_year,
-            "last_6m": last_6m,
-            "last_month": last_month,
-            "last_week": last_week,
-            "current": current,
-        },
+        "curve_lines": curve_lines,
+        "implied_path": implied,
+        "policy_pricing_proxy": implied["policy_pricing_proxy"],
+        "implied_change_12m_bps": implied["implied_change_12m_bps"],
+        "implied_change_horizon_months": implied["implied_change_horizon_months"],
+        "implied_change_partial": implied["implied_change_partial"],
         "data_quality": {
             "any_failed": any_failed,
             "missing_count": missing_count,
@@ -0,0 +1,162 @@
+"""Implied policy path from 30-day fed funds (ZQ) futures.
+
+Each contract settles on the month's average effective rate, so
+``100 - price`` is the implied average rate for that month. For a month
+with an FOMC decision taking effect on day ``d + 1`` of ``N``:
+
+    average = d / N * pre_meeting + (N - d) / N * post_meeting
+
+Meetings are solved in calendar order, carrying each post-meeting rate
+forward as the next pre-meeting rate. A month without a meeting resets
+the chain to its own implied rate. When the following month has no
+meeting, its implied rate is used as the post-meeting rate directly,
+which is better conditioned for late-month meetings. Every step is an
+array operation over rows, so one call covers all anchors (or every
+date of a price history).
+"""
+from __future__ import annotations
+
+import calendar
+from datetime import date, timedelta
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+FOMC_CALENDAR_PATH = Path("config/fomc_calendar.json")
+STEP_BPS = 25.0
+MONTH_CODES = {
+    "F": 1,
+    "G": 2,
+    "H": 3,
+    "J": 4,
+    "K": 5,
+    "M": 6,
+    "N": 7,
+    "Q": 8,
+    "U": 9,
+    "V": 10,
+    "X": 11,
+    "Z": 12,
+}
+
+Month = Tuple[int, int]
+_CODE_BY_MONTH = {month: code for code, month in MONTH_CODES.items()}
+
+
+def contract_month(ticker: str) -> Optional[Month]:
+    """``ZQZ25.CBT`` -> ``(2025, 12)``; None for anything else."""
+    if not isinstance(ticker, str) or not ticker.startswith("ZQ") or len(ticker) < 5:
+        return None
+    month = MONTH_CODES.get(ticker[2])
+    if month is None or not ticker[3:5].isdigit():
+        return None
+    return 2000 + int(ticker[3:5]), month
+
+
+def zq_ticker(year: int, month: int, suffix: str = ".CBT") -> str:
+    return f"ZQ{_CODE_BY_MONTH[month]}{year % 100:02d}{suffix}"
+
+
+def generate_zq_tickers(today: Optional[date] = None, months_ahead: int = 12, months_back: int = 0) -> List[str]:
+    """Front-month contract plus ``months_ahead`` deferreds (and optional expired ones)."""
+    today = today or date.today()
+    start = today.year * 12 + today.month - 1 - months_back
+    return [zq_ticker(index // 12, index % 12 + 1) for index in range(start, start + months_back + months_ahead + 1)]
+
+
+def load_fomc_calendar(path: Path | str = FOMC_CALENDAR_PATH) -> List[date]:
+    calendar_path = Path(path)
+    if not calendar_path.exists():
+        return []
+    data = json.loads(calendar_path.read_text(encoding="utf-8") or "{}")
+    raw = data.get("decision_dates", []) if isinstance(data, dict) else data
+    dates = []
+    for item in raw if isinstance(raw, list) else []:
+        try:
+            dates.append(date.fromisoformat(str(item)))
+        except ValueError:
+            continue
+    return sorted(dates)
+
+
+def _next_month(month: Month) -> Month:
+    year, mon = month
+    return (year + 1, 1) if mon == 12 else (year, mon + 1)
+
+
+def _meeting_days(meetings: Sequence[date]) -> Dict[Month, Tuple[date, int]]:
+    """Month of the effective date -> (decision date, days at the old rate)."""
+    out: Dict[Month, Tuple[date, int]] = {}
+    for decision in meetings:
+        effective = decision + timedelta(days=1)
+        out[(effective.year, effective.month)] = (decision, effective.day - 1)
+    return out
+
+
+def implied_path(
+    prices: np.ndarray,
+    months: Sequence[Month],
+    meetings: Sequence[date],
+    spot: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
+    """Solve the meeting-by-meeting path for every row of ``prices``.
+
+    ``prices`` is (rows x contracts) with NaN for missing quotes; ``spot``
+    (rows,) is the prevailing effective rate, used when the first contract
+    month already contains a meeting.
+    """
+    prices = np.atleast_2d(np.asarray(prices, dtype="float64"))
+    order = np.argsort([year * 12 + month for year, month in months], kind="stable")
+    months = [tuple(months[idx]) for idx in order]
+    rates = 100.0 - prices[:, order]
+    n_rows = rates.shape[0]
+    spot = np.full(n_rows, np.nan) if spot is None else np.asarray(spot, dtype="float64").reshape(n_rows)
+
+    by_month = _meeting_days(meetings)
+    meeting_dates: List[str] = []
+    pre_cols: List[np.ndarray] = []
+    post_cols: List[np.ndarray] = []
+    current = spot.copy()
+    for idx, month in enumerate(months):
+        average = rates[:, idx]
+        if month not in by_month:
+            current = average
+            continue
+        decision, days_before = by_month[month]
+        weight = days_before / calendar.monthrange(*month)[1]
+        following = idx + 1 < len(months) and months[idx + 1] == _next_month(month)
+        if following and months[idx + 1] not in by_month:
+            post = rates[:, idx + 1]
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                post = (average - weight * current) / (1.0 - weight)
+        if weight > 0:
+            # Fill a missing pre-meeting rate by backing it out of this month.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                backed_out = (average - (1.0 - weight) * post) / weight
+            current = np.where(np.isnan(current), backed_out, current)
+        meeting_dates.append(decision.isoformat())
+        pre_cols.append(current)
+        post_cols.append(post)
+        current = post
+
+    empty = np.empty((n_rows, 0))
+    pre = np.stack(pre_cols, axis=1) if pre_cols else empty
+    post = np.stack(post_cols, axis=1) if post_cols else empty
+    change_bps = (post - pre) * 100
+    start = pre[:, :1] if pre_cols else np.full((n_rows, 1), np.nan)
+    return {
+        "months": [f"{year:04d}-{month:02d}" for year, month in months],
+        "implied_rates": rates,
+        "meetings": meeting_dates,
+        "pre_meeting": pre,
+        "post_meeting": post,
+        "change_bps": change_bps,
+        "cumulative_bps": (post - start) * 100,
+        "hike_probability": np.clip(change_bps / STEP_BPS, 0.0, 1.0),
+        "cut_probability": np.clip(-change_bps / STEP_BPS, 0.0, 1.0),
+        "expected_steps": change_bps / STEP_BPS,
+    }
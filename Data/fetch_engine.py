@@ -0,0 +1,353 @@
+"""Generic ingestion engine driven by ``Signals.series_registry``.
+
+``fetch_series(spec)`` turns one registry entry into an ingestion object:
+primary source, then each fallback, with the anchor snapshots (current,
+last_week, last_month, last_6m, start_of_year) and change fields in
+``meta``. Monthly and quarterly series get a lookback long enough for a
+``year_ago`` anchor as well. The lookback comes from the spec being
+fetched (fallbacks use their primary's), never from a registry lookup by id.
+
+``fetch_sections`` builds the whole raw_state fetch plan from the registry,
+groups it by provider and runs each provider's batch on its own thread
+(series within a batch run in order, so one provider never sees more than
+one request at a time). Entries with a ``fetcher`` call that Data module
+function, resolved at call time so tests and harnesses can patch it;
+entries without one need no module at all. ``run_batches`` is the same
+scheduler for other plans (the ZQ strip's contract histories).
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta, timezone
+import importlib
+import os
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from Data import yfinance_provider
+from Data.utils import fred_provider
+from Data.utils.snapshot_selection import anchor_window_start, select_prior, select_snapshots
+from Signals.series_registry import Registry, SeriesSpec
+
+Snapshot = Tuple[float, Dict[str, Any], str, str]
+IngestionCall = Callable[[], Dict[str, Any]]
+
+YEAR_AGO_CADENCES = ("monthly", "quarterly")
+# A year plus room for publication lag (quarterly releases trail by up to ~6 months).
+YEAR_AGO_WINDOW_DAYS = 550
+ANCHOR_PADDING_DAYS = 10
+PRICE_PERIOD = "1y"
+FETCH_WORKERS_ENV = "RAW_FETCH_WORKERS"
+
+# The spec fetch_series is working on. Snapshot callables handed in by the
+# Data modules only take a series id; fred_snapshot reads the spec from here.
+_FETCHING: ContextVar[Optional[SeriesSpec]] = ContextVar("fetch_engine_spec", default=None)
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def ingestion_object(
+    value: Any = None,
+    status: str = "FAILED",
+    source: Optional[str] = None,
+    error: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    obj = {
+        "value": value,
+        "status": status,  # OK | FAILED
+        "source": source,
+        "fetched_at": now_iso(),
+        "error": error,
+        "meta": {},
+    }
+    if extra:
+        obj["meta"].update(extra)
+    return obj
+
+
+def _normalize_date(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
+
+
+def extract_points(results: Iterable[Any]) -> list[Tuple[datetime, float]]:
+    """(date, value) pairs from provider records: ``close`` for prices, ``value`` for FRED."""
+    points: list[Tuple[datetime, float]] = []
+    for item in results:
+        if isinstance(item, dict):
+            raw_date = item.get("date")
+            raw_value = item.get("close", item.get("value"))
+        else:
+            raw_date = getattr(item, "date", None)
+            raw_value = getattr(item, "close", getattr(item, "value", None))
+        dt = _normalize_date(raw_date)
+        if dt is None or raw_value is None:
+            continue
+        try:
+            value = float(raw_value)
+        except (TypeError, ValueError):
+            continue
+        points.append((dt, value))
+    return points
+
+
+def _format_date(dt: Optional[datetime]) -> Optional[str]:
+    if dt is None:
+        return None
+    return dt.date().isoformat()
+
+
+def _pct_change(current: float, prior: Optional[float]) -> Optional[float]:
+    if prior in (None, 0):
+        return None
+    return (current - prior) / prior * 100
+
+
+def _select_year_ago(points: list[Tuple[datetime, float]], current_date: datetime) -> Optional[Tuple[datetime, float]]:
+    target = current_date - timedelta(days=365)
+    candidates = [pair for pair in points if pair[0] <= target]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda pair: pair[0])
+
+
+def _lookback(spec: Optional[SeriesSpec]) -> Tuple[Optional[int], bool]:
+    """(window days or None, wants year_ago) from the cadence/window of the spec being fetched."""
+    spec = spec or _FETCHING.get()
+    window = None if spec is None else spec.window
+    year_ago = spec is not None and spec.cadence in YEAR_AGO_CADENCES
+    if year_ago:
+        window = max(window or 0, YEAR_AGO_WINDOW_DAYS)
+    return window, year_ago
+
+
+def _anchor_meta(
+    points: list[Tuple[datetime, float]],
+    provider: str,
+    series_id: str,
+    year_ago: bool,
+) -> Tuple[datetime, float, Dict[str, Any]]:
+    snapshots = select_snapshots(points)
+    current = snapshots["current"]
+    if current is None:
+        raise ValueError("no observations")
+    current_date, current_value = current
+    last_month = snapshots["last_month"]
+    meta: Dict[str, Any] = {"provider": provider, "series_id": series_id, "current": current_value}
+    for name in ("last_week", "last_month", "last_6m", "start_of_year"):
+        anchor = snapshots[name]
+        meta[name] = None if anchor is None else anchor[1]
+        meta[f"as_of_{name}"] = _format_date(None if anchor is None else anchor[0])
+    meta["as_of_current"] = _format_date(current_date)
+    meta["1m_change"] = None if last_month is None else current_value - last_month[1]
+    meta["5d_roc"] = _pct_change(current_value, meta["last_week"])
+    if year_ago:
+        prior = _select_year_ago(points, current_date)
+        meta["year_ago"] = None if prior is None else prior[1]
+        meta["as_of_year_ago"] = _format_date(None if prior is None else prior[0])
+    return current_date, current_value, meta
+
+
+def fred_snapshot(
+    series_id: str,
+    try_openbb: Optional[Callable[..., Any]] = None,
+    try_http: Optional[Callable[..., Any]] = None,
+    spec: Optional[SeriesSpec] = None,
+) -> Snapshot:
+    """Latest FRED value and anchor meta; OpenBB first, then FRED HTTP."""
+    try_openbb = try_openbb or fred_provider._try_openbb_fred
+    try_http = try_http or fred_provider._try_fred_http
+    window, year_ago = _lookback(spec)
+    now = datetime.now(timezone.utc)
+    start = anchor_window_start(now, padding_days=ANCHOR_PADDING_DAYS)
+    if window is not None:
+        start = min(start, now - timedelta(days=window))
+    start_date = start.date().isoformat()
+    try:
+        df = try_openbb(series_id, start_date=start_date)
+        source = "openbb:fred"
+    except Exception as openbb_exc:
+        try:
+            df = try_http(series_id, start_date=start_date)
+            source = "fred_http"
+        except Exception as fred_exc:
+            raise RuntimeError(f"OpenBB failed: {openbb_exc}; FRED HTTP failed: {fred_exc}") from fred_exc
+    _, current_value, meta = _anchor_meta(extract_points(df.to_dict("records")), "fred", series_id, year_ago)
+    return current_value, meta, "OK", source
+
+
+def price_points(ticker: str, period: str = PRICE_PERIOD) -> list[Tuple[datetime, float]]:
+    """Every (date, close) yfinance returns for ``ticker`` over ``period``."""
+    frame = yfinance_provider.fetch_price_history(ticker, period=period)
+    return extract_points(frame.to_dict("records"))
+
+
+def price_snapshot(ticker: str, spec: Optional[SeriesSpec] = None) -> Snapshot:
+    """Latest yfinance close with anchor meta, percent changes and the year's range."""
+    window, year_ago = _lookback(spec)
+    if window is None:
+        frame = yfinance_provider.fetch_price_history(ticker, period=PRICE_PERIOD)
+    else:
+        start = datetime.now(timezone.utc) - timedelta(days=window)
+        frame = yfinance_provider.fetch_price_history(ticker, start_date=start.date().isoformat())
+    points = extract_points(frame.to_dict("records"))
+    current_date, current_value, meta = _anchor_meta(points, "yfinance", ticker, year_ago)
+    prior_1d = select_prior(points, current_date, days=1)
+    prior_5d = select_prior(points, current_date, days=5)
+    change_5d = _pct_change(current_value, None if prior_5d is None else prior_5d[1])
+    values = [value for _, value in points]
+    meta.update(
+        {
+            "1d_change_pct": _pct_change(current_value, None if prior_1d is None else prior_1d[1]),
+            "5d_change_pct": change_5d,
+            "1m_change_pct": _pct_change(current_value, meta["last_month"]),
+            "6m_change_pct": _pct_change(current_value, meta["last_6m"]),
+            "5d_roc": change_5d,
+            "year_open": meta["start_of_year"],
+            "year_high": max(values) if values else None,
+            "year_low": min(values) if values else None,
+        }
+    )
+    return current_value, meta, "OK", "yfinance"
+
+
+SNAPSHOTS: Dict[str, Callable[..., Snapshot]] = {"fred": fred_snapshot, "yfinance": price_snapshot}
+
+
+def fetch_series(spec: SeriesSpec, snapshot: Optional[Callable[[str], Snapshot]] = None) -> Dict[str, Any]:
+    """Ingestion object for ``spec``: the primary source (``snapshot`` if given), then each fallback."""
+    failed_source = "yfinance" if spec.provider == "yfinance" else None
+    if not spec.series_id:
+        return ingestion_object(
+            source=failed_source,
+            error=f"{spec.label} series_id not configured",
+            extra={"series_id": None, "provider": spec.provider},
+        )
+    errors: List[str] = []
+    attempts = [(spec.provider, spec.series_id)] + list(spec.fallbacks)
+    for index, (provider, series_id) in enumerate(attempts):
+        token = _FETCHING.set(spec)
+        try:
+            if index == 0 and snapshot is not None:
+                value, meta, status, source = snapshot(series_id)
+            else:
+                value, meta, status, source = SNAPSHOTS[provider](series_id, spec=spec)
+        except Exception as exc:
+            errors.append(f"{series_id} fetch failed: {exc}")
+            continue
+        finally:
+            _FETCHING.reset(token)
+        obj = ingestion_object(value=value, status=status, source=source, extra=meta)
+        if index:
+            obj["error"] = f"{spec.series_id} unavailable; used {series_id} proxy"
+        return obj
+    return ingestion_object(
+        source=failed_source,
+        error="; ".join(errors),
+        extra={"series_id": spec.series_id, "provider": spec.provider},
+    )
+
+
+@dataclass(frozen=True)
+class PlanItem:
+    path: Tuple[str, ...]
+    provider: str
+    call: IngestionCall
+
+
+def _caller(spec: SeriesSpec, *args: str) -> IngestionCall:
+    def call() -> Dict[str, Any]:
+        if spec.fetcher is None:
+            return fetch_series(replace(spec, key=args[0], series_id=args[0]) if args else spec)
+        module, name = spec.fetcher.rsplit(".", 1)
+        return getattr(importlib.import_module(f"Data.{module}"), name)(*args)
+
+    call.__name__ = spec.fetcher.rsplit(".", 1)[1] if spec.fetcher else spec.label
+    return call
+
+
+def build_plan(reg: Registry, expand: Mapping[str, Callable[[], List[str]]]) -> List[PlanItem]:
+    """One PlanItem per raw_state field; ``expand`` entries fan out into one item per contract."""
+    plan: List[PlanItem] = []
+    for section in reg.sections:
+        for spec in section.series:
+            source = spec.attrs.get("expand")
+            if source is None:
+                plan.append(PlanItem((section.name, spec.key), spec.provider, _caller(spec)))
+                continue
+            for member in expand[source]():
+                plan.append(PlanItem((section.name, spec.key, member), spec.provider, _caller(spec, member)))
+    return plan
+
+
+def _resolve_workers(value: Optional[int], batches: int) -> int:
+    if value is None:
+        raw = os.environ.get(FETCH_WORKERS_ENV)
+        try:
+            value = int(raw) if raw else batches
+        except ValueError:
+            value = batches
+    return max(0, min(int(value), batches))
+
+
+def run_batches(
+    plan: List[PlanItem],
+    call: Callable[[IngestionCall], Any],
+    workers: Optional[int] = None,
+) -> Dict[Tuple[str, ...], Any]:
+    """``call(item.call)`` per item, keyed by path; each provider's items run in order on one thread.
+
+    Provider batches run concurrently, one thread each by default;
+    ``workers`` (or ``RAW_FETCH_WORKERS``) of 0 or 1 runs everything inline.
+    """
+    batches: Dict[str, List[PlanItem]] = {}
+    for item in plan:
+        batches.setdefault(item.provider, []).append(item)
+
+    def _run(items: List[PlanItem]) -> List[Tuple[Tuple[str, ...], Any]]:
+        return [(item.path, call(item.call)) for item in items]
+
+    workers = _resolve_workers(workers, len(batches))
+    if workers <= 1:
+        chunks = [_run(items) for items in batches.values()]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="raw-fetch") as pool:
+            chunks = list(pool.map(_run, batches.values()))
+    return {path: result for chunk in chunks for path, result in chunk}
+
+
+def fetch_sections(
+    reg: Registry,
+    call: Callable[[IngestionCall], Dict[str, Any]],
+    expand: Mapping[str, Callable[[], List[str]]],
+    workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Every raw_state section in registry order; ``call`` wraps each fetch (e.g. ``update._safe_call``).
+
+    Batching and ``workers`` as in ``run_batches``.
+    """
+    plan = build_plan(reg, expand)
+    results = run_batches(plan, call, workers)
+
+    sections: Dict[str, Dict[str, Any]] = {}
+    for section in reg.sections:
+        fields: Dict[str, Any] = {}
+        for spec in section.series:
+            fields[spec.key] = {} if "expand" in spec.attrs else results[(section.name, spec.key)]
+        sections[section.name] = fields
+    for item in plan:
+        if len(item.path) == 3:
+            sections[item.path[0]][item.path[1]][item.path[2]] = results[item.path]
+    return sections
@@ -0,0 +1,386 @@
+"""Synthetic macro series and offline stand-ins for the price and FRED providers.
+
+Every series is generated from its id, so any ticker or FRED id the
+pipeline asks for gets plausible data:
+
+- Treasury/real/breakeven rates (``DGS*``, ``DFII*``, ``T*YIE``): mean
+  reversion towards regime targets that shift every couple of years, so
+  rates trend between regimes.
+- Policy rates (``EFFR``, ``SOFR``, ``DFF``, ``ECBDFR``): 25bp steps at
+  meeting-like intervals, plus small fixing noise.
+- ZQ futures (``ZQ<code><yy>.CBT``): ``100 -`` the expected average
+  policy rate for the contract month. Each contract trades for the 24
+  months up to its expiry.
+- Vol indices (``^VIX``, ``^MOVE``, ...) and credit spreads: log
+  mean-reverting with upward jumps.
+- FX (``*=X``, ``DX-Y.NYB``, ``DTWEXBGS``): geometric random walks.
+- CPI/PCE (monthly) and ECI (quarterly) indices: dated on the first day of
+  the period, and only published ``release_lag_days`` after it.
+- Everything else: a log mean-reverting level, daily or weekly.
+
+Output is deterministic for a given ``SyntheticConfig``. The config also
+sets the history length, calendar gaps, missing values and provider
+failure rates. ``install()`` registers the stand-ins through the
+``STAND_INS`` hooks of ``Data.yfinance_provider`` and
+``Data.utils.fred_provider``, so every fetch path (however it imported the
+provider functions) is answered offline. Widening the pipeline's universe
+for load runs lives in ``tools/synthetic_universe.py``.
+
+    with install(SyntheticConfig(years=2)) as providers:
+        build_raw_state()
+    print(providers.calls)
+"""
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+import threading
+from typing import Callable, Dict, Iterator, Optional, Tuple
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from Signals import tracing
+
+
+SYNTHETIC_FX_PREFIX = "fx_syn"
+ZQ_MONTH_CODES = "FGHJKMNQUVXZ"
+ZQ_TRADING_MONTHS = 24
+MEETING_SPACING_DAYS = 32
+
+# series id -> (kind, typical level)
+PROFILES: Dict[str, Tuple[str, float]] = {
+    "CPIAUCSL": ("monthly_index", 315.0),
+    "CPILFESL": ("monthly_index", 322.0),
+    "PCEPI": ("monthly_index", 125.0),
+    "PCEPILFE": ("monthly_index", 124.0),
+    "ECIALLCIV": ("quarterly_index", 168.0),
+    "UNRATE": ("monthly_level", 4.2),
+    "JTSJOL": ("monthly_level", 7500.0),
+    "PAYEMS": ("monthly_level", 159000.0),
+    "WALCL": ("weekly_level", 6.9e6),
+    "WTREGEN": ("weekly_level", 750000.0),
+    "RRPONTSYD": ("level", 250.0),
+    "BAMLC0A0CM": ("spread", 1.0),
+    "BAMLH0A0HYM2": ("spread", 3.2),
+    "EFFR": ("policy_rate", 4.33),
+    "DFF": ("policy_rate", 4.33),
+    "SOFR": ("policy_rate", 4.35),
+    "ECBDFR": ("policy_rate", 2.0),
+    "DFII10": ("rate", 1.9),
+    "T10YIE": ("rate", 2.3),
+    "DTWEXBGS": ("fx", 121.0),
+    "DX-Y.NYB": ("fx", 100.0),
+    "^VIX": ("vol", 17.0),
+    "^MOVE": ("vol", 95.0),
+    "^GVZ": ("vol", 17.0),
+    "^OVX": ("vol", 35.0),
+    "JPY=X": ("fx", 150.0),
+    "EURUSD=X": ("fx", 1.10),
+    "GBPUSD=X": ("fx", 1.30),
+    "CAD=X": ("fx", 1.38),
+    "AUDUSD=X": ("fx", 0.66),
+    "NZDUSD=X": ("fx", 0.60),
+    "NOK=X": ("fx", 10.5),
+    "MXN=X": ("fx", 18.5),
+    "ZAR=X": ("fx", 18.0),
+    "CHF=X": ("fx", 0.85),
+    "CNH=X": ("fx", 7.2),
+    "CNY=X": ("fx", 7.2),
+}
+_DAILY_KINDS = {"rate", "policy_rate", "zq", "vol", "spread", "fx", "level"}
+_PERIOD_DAYS = {"d": 1, "wk": 7, "mo": 31, "y": 366}
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    seed: int = 0
+    # Years of history generated per series, ending at ``end`` (default: today).
+    years: int = 5
+    end: Optional[date] = None
+    # Share of trading days dropped (holidays, outages) and of kept observations blanked.
+    gap_rate: float = 0.0
+    missing_rate: float = 0.0
+    # Share of series each provider fails on (drawn per provider, so the FRED fallback is exercised).
+    failure_rate: float = 0.0
+    # Monthly releases appear this many days after the period start (quarterly: + 2 months).
+    release_lag_days: int = 45
+
+
+def _rng(config: SyntheticConfig, *parts: str) -> np.random.Generator:
+    return np.random.default_rng([config.seed] + [zlib.crc32(part.encode("utf-8")) for part in parts])
+
+
+def _end(config: SyntheticConfig) -> date:
+    return config.end or date.today()
+
+
+def series_kind(series_id: str) -> Tuple[str, float]:
+    """(kind, typical level) for ``series_id``."""
+    if series_id in PROFILES:
+        return PROFILES[series_id]
+    if zq_contract_month(series_id) is not None:
+        return "zq", 0.0
+    if series_id.startswith("DGS"):
+        return "rate", 3.6
+    if series_id.endswith("=X"):
+        return "fx", float(np.exp(zlib.crc32(series_id.encode("utf-8")) % 700 / 100.0 - 2.0))
+    if series_id.startswith("^"):
+        return "vol", 20.0
+    return "level", 100.0
+
+
+def zq_contract_month(ticker: str) -> Optional[Tuple[int, int]]:
+    """``ZQZ25.CBT`` -> ``(2025, 12)``; None for anything else."""
+    if not ticker.startswith("ZQ") or len(ticker) < 5 or ticker[2] not in ZQ_MONTH_CODES or not ticker[3:5].isdigit():
+        return None
+    return 2000 + int(ticker[3:5]), ZQ_MONTH_CODES.index(ticker[2]) + 1
+
+
+def synthetic_fx_tickers(count: int) -> Dict[str, str]:
+    """``count`` extra FX pairs for the history plan: ``fx_syn001 -> SYN001=X``."""
+    return {f"{SYNTHETIC_FX_PREFIX}{index:03d}": f"SYN{index:03d}=X" for index in range(1, count + 1)}
+
+
+# -- calendars ------------------------------------------------------------------
+
+
+def _calendar(kind: str, config: SyntheticConfig) -> pd.DatetimeIndex:
+    end = pd.Timestamp(_end(config))
+    start = end - pd.Timedelta(days=int(config.years * 365.25))
+    if kind in _DAILY_KINDS:
+        # pd.bdate_range steps day by day in Python; a numpy business-day mask is ~100x faster.
+        days = np.arange(start.to_datetime64().astype("datetime64[D]"), end.to_datetime64().astype("datetime64[D]") + 1)
+        return pd.DatetimeIndex(days[np.is_busday(days)].astype("datetime64[ns]"))
+    if kind == "weekly_level":
+        return pd.date_range(start, end, freq="W-WED")
+    freq, lag = ("MS", config.release_lag_days) if kind.startswith("monthly") else ("QS", config.release_lag_days + 61)
+    days = pd.date_range(start, end, freq=freq)
+    return days[days + pd.Timedelta(days=lag) <= end]
+
+
+def _drop_gaps(days: pd.DatetimeIndex, kind: str, rng: np.random.Generator, config: SyntheticConfig) -> pd.DatetimeIndex:
+    if config.gap_rate <= 0 or kind.startswith(("monthly", "quarterly")) or len(days) < 2:
+        return days
+    keep = rng.random(len(days)) >= config.gap_rate
+    keep[-1] = True
+    return days[keep]
+
+
+# -- dynamics -------------------------------------------------------------------
+
+
+def _regime_targets(rng: np.random.Generator, n: int, level: float, spread: float, mean_length: int) -> np.ndarray:
+    targets = np.empty(n)
+    start = 0
+    while start < n:
+        length = int(rng.geometric(1.0 / mean_length))
+        targets[start : start + length] = level + spread * rng.normal()
+        start += length
+    return targets
+
+
+def _mean_reverting(
+    targets: np.ndarray,
+    start: float,
+    speed: float,
+    shocks: np.ndarray,
+    floor: Optional[float] = None,
+) -> np.ndarray:
+    out = np.empty(len(targets))
+    value = start
+    for index, (target, shock) in enumerate(zip(targets, shocks)):
+        value += speed * (target - value) + shock
+        if floor is not None and value < floor:
+            value = floor
+        out[index] = value
+    return out
+
+
+def _with_jumps(rng: np.random.Generator, n: int, per_day: float, low: float, high: float) -> np.ndarray:
+    return np.where(rng.random(n) < per_day, rng.uniform(low, high, n), 0.0)
+
+
+def _policy_path(rng: np.random.Generator, n: int, level: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Stepped policy rate and the regime target it is moving towards."""
+    targets = np.clip(_regime_targets(rng, n, level, 1.5, 520), 0.0, None)
+    path = np.empty(n)
+    rate = max(0.0, round(targets[0] * 4) / 4)
+    next_meeting = int(rng.integers(0, MEETING_SPACING_DAYS))
+    for index in range(n):
+        if index == next_meeting:
+            gap = targets[index] - rate
+            if abs(gap) >= 0.25 and rng.random() < 0.8:
+                rate = max(0.0, rate + np.sign(gap) * (0.5 if abs(gap) > 1.5 else 0.25))
+            next_meeting += MEETING_SPACING_DAYS + int(rng.integers(-5, 6))
+        path[index] = rate
+    return path, targets
+
+
+@lru_cache(maxsize=8)
+def _shared_policy(config: SyntheticConfig) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    """The EFFR path every ZQ contract is priced from (one per config)."""
+    days = _calendar("policy_rate", config)
+    path, targets = _policy_path(_rng(config, "EFFR"), len(days), PROFILES["EFFR"][1])
+    return days, path, targets
+
+
+def _zq_values(series_id: str, days: pd.DatetimeIndex, config: SyntheticConfig, rng: np.random.Generator) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    year, month = zq_contract_month(series_id)  # type: ignore[misc]
+    expiry_end = pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0)
+    listed = expiry_end - pd.DateOffset(months=ZQ_TRADING_MONTHS)
+    policy_days, path, targets = _shared_policy(config)
+    keep = (policy_days >= listed) & (policy_days <= expiry_end)
+    live = policy_days[keep]
+    months_out = np.clip((expiry_end - live).days.to_numpy() / 30.4 - 0.5, 0.0, None)
+    expected = path[keep] + (targets[keep] - path[keep]) * np.minimum(1.0, months_out / 12.0)
+    price = 100.0 - expected - rng.normal(0.0, 0.01, len(live)) * np.sqrt(1.0 + months_out)
+    return live[live.isin(days)], np.round(price[live.isin(days)], 4)
+
+
+def _values(kind: str, level: float, n: int, rng: np.random.Generator) -> np.ndarray:
+    if n == 0:
+        return np.empty(0)
+    if kind == "rate":
+        targets = _regime_targets(rng, n, level, 1.2, 500)
+        return np.round(_mean_reverting(targets, level, 0.004, rng.normal(0.0, 0.05, n), floor=-0.75), 2)
+    if kind == "policy_rate":
+        path, _ = _policy_path(rng, n, level)
+        return np.round(path + rng.normal(0.0, 0.01, n), 2)
+    if kind in ("vol", "spread"):
+        speed, sigma, jump = (0.03, 0.06, 0.5) if kind == "vol" else (0.01, 0.02, 0.25)
+        shocks = rng.normal(0.0, sigma, n) + _with_jumps(rng, n, 1 / 120, jump * 0.4, jump)
+        return np.round(np.exp(_mean_reverting(np.full(n, np.log(level)), np.log(level), speed, shocks)), 2)
+    if kind == "fx":
+        return np.round(level * np.exp(np.cumsum(rng.normal(0.0, 0.006, n))), 5)
+    if kind.endswith("_index"):
+        per_period = 0.0022 if kind.startswith("monthly") else 0.0085
+        inflation = _mean_reverting(np.full(n, per_period), per_period, 0.3, rng.normal(0.0, per_period * 0.6, n))
+        growth = np.exp(np.cumsum(inflation))
+        return np.round(level * growth / growth[-1], 3)
+    speed, sigma = (0.05, 0.02) if kind == "monthly_level" else (0.01, 0.015)
+    logs = _mean_reverting(np.full(n, np.log(level)), np.log(level), speed, rng.normal(0.0, sigma, n))
+    return np.round(np.exp(logs), 3 if level < 100 else 1)
+
+
+@lru_cache(maxsize=4096)
+def _generate(series_id: str, config: SyntheticConfig) -> pd.DataFrame:
+    kind, level = series_kind(series_id)
+    rng = _rng(config, series_id)
+    days = _drop_gaps(_calendar(kind, config), kind, rng, config)
+    if kind == "zq":
+        days, values = _zq_values(series_id, days, config, rng)
+    else:
+        values = _values(kind, level, len(days), rng)
+    if config.missing_rate > 0 and len(values):
+        values = np.where(rng.random(len(values)) < config.missing_rate, np.nan, values)
+    return pd.DataFrame({"date": days, "value": values})
+
+
+def generate_series(series_id: str, config: Optional[SyntheticConfig] = None) -> pd.DataFrame:
+    """The full synthetic history for ``series_id`` as [date, value] (NaN where missing)."""
+    return _generate(series_id, config or SyntheticConfig()).copy()
+
+
+# -- provider stand-ins ---------------------------------------------------------
+
+
+def _period_start(end: date, period: str) -> Optional[date]:
+    if period == "max":
+        return None
+    for suffix, days in _PERIOD_DAYS.items():
+        if period.endswith(suffix) and period[: -len(suffix)].isdigit():
+            return end - timedelta(days=int(period[: -len(suffix)]) * days)
+    raise ValueError(f"unsupported period {period!r}")
+
+
+class SyntheticProviders:
+    """Provider functions answered from ``generate_series``; counts calls and failures per provider."""
+
+    def __init__(self, config: Optional[SyntheticConfig] = None) -> None:
+        self.config = config or SyntheticConfig()
+        self.calls: Counter = Counter()
+        self.failures: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _serve(self, provider: str, series_id: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        with tracing.span(f"provider.{provider}", series_id=series_id, start_date=start_date, synthetic=True) as span:
+            frame = self._frame(provider, series_id, start_date, end_date)
+            span.set(rows=len(frame))
+        return frame
+
+    def _frame(self, provider: str, series_id: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        fails = self.config.failure_rate > 0 and _rng(self.config, provider, series_id).random() < self.config.failure_rate
+        with self._lock:
+            self.calls[provider] += 1
+            if fails:
+                self.failures[provider] += 1
+        if fails:
+            raise RuntimeError(f"synthetic {provider} failure for {series_id}")
+        frame = generate_series(series_id, self.config)
+        if start_date:
+            frame = frame[frame["date"] >= pd.Timestamp(start_date)]
+        if end_date:
+            frame = frame[frame["date"] <= pd.Timestamp(end_date)]
+        return frame.reset_index(drop=True)
+
+    def price_history(
+        self,
+        ticker: str,
+        period: str = "6mo",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        if not (start_date or end_date):
+            start = _period_start(_end(self.config), period)
+            start_date = start.isoformat() if start else None
+        frame = self._serve("yfinance", ticker, start_date, end_date)
+        if frame.empty:
+            raise ValueError(f"no history for {ticker}")
+        return frame.rename(columns={"value": "close"})
+
+    def _fred_frame(self, provider: str, series_id: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        frame = self._serve(provider, series_id, start_date, end_date)
+        values = [None if np.isnan(value) else float(value) for value in frame["value"]]
+        return pd.DataFrame({"date": frame["date"].dt.strftime("%Y-%m-%d"), "value": values}, columns=["date", "value"])
+
+    def openbb_fred(self, series_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        return self._fred_frame("openbb", series_id, start_date, end_date)
+
+    def fred_http(
+        self,
+        series_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ) -> pd.DataFrame:
+        return self._fred_frame("fred_http", series_id, start_date, end_date)
+
+
+@contextmanager
+def install(config: Optional[SyntheticConfig] = None) -> Iterator[SyntheticProviders]:
+    """Serve every yfinance and FRED provider call from synthetic data inside the block."""
+    from Data import yfinance_provider
+    from Data.utils import fred_provider
+
+    providers = SyntheticProviders(config)
+    hooks: Dict[str, Dict[str, Callable[..., pd.DataFrame]]] = {
+        "price_history": yfinance_provider.STAND_INS,
+        "openbb_fred": fred_provider.STAND_INS,
+        "fred_http": fred_provider.STAND_INS,
+    }
+    previous = {name: hook.get(name) for name, hook in hooks.items()}
+    for name, hook in hooks.items():
+        hook[name] = getattr(providers, name)
+    try:
+        yield providers
+    finally:
+        for name, hook in hooks.items():
+            if previous[name] is None:
+                hook.pop(name, None)
+            else:
+                hook[name] = previous[name]
@@ -1,11 +1,15 @@
 """Provider wrappers for FRED series retrieval."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 import pandas as pd
 
 from Data.providers.fred_http import fetch_fred_observations
+from Signals import tracing
+
+# Offline stand-ins keyed "openbb_fred" / "fred_http"; set by Data.providers.synthetic.install.
+STAND_INS: Dict[str, Callable[..., pd.DataFrame]] = {}
 
 
 def _try_openbb_fred(
@@ -13,6 +17,16 @@ def _try_openbb_fred(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
 ) -> pd.DataFrame:
+    stand_in = STAND_INS.get("openbb_fred")
+    if stand_in is not None:
+        return stand_in(series_id, start_date=start_date, end_date=end_date)
+    with tracing.span("provider.openbb", series_id=series_id, start_date=start_date) as span:
+        frame = _openbb_fred_frame(series_id, start_date, end_date)
+        span.set(rows=len(frame))
+    return frame
+
+
+def _openbb_fred_frame(series_id: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
     from openbb import obb
 
     try:
@@ -50,4 +64,10 @@ def _try_fred_http(
     end_date: Optional[str] = None,
     api_key: Optional[str] = None,
 ) -> pd.DataFrame:
-    return fetch_fred_observations(series_id, start_date=start_date, end_date=end_date, api_key=api_key)
+    stand_in = STAND_INS.get("fred_http")
+    if stand_in is not None:
+        return stand_in(series_id, start_date=start_date, end_date=end_date, api_key=api_key)
+    with tracing.span("provider.fred_http", series_id=series_id, start_date=start_date) as span:
+        frame = fetch_fred_observations(series_id, start_date=start_date, end_date=end_date, api_key=api_key)
+        span.set(rows=len(frame))
+    return frame
@@ -1,10 +1,15 @@
 """yfinance provider wrapper for close-price history."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 import pandas as pd
 
+from Signals import tracing
+
+# Offline stand-ins answering instead of yfinance ("price_history"); set by Data.providers.synthetic.install.
+STAND_INS: Dict[str, Callable[..., pd.DataFrame]] = {}
+
 
 def fetch_price_history(
     ticker: str,
@@ -13,6 +18,21 @@ def fetch_price_history(
     end_date: Optional[str] = None,
 ) -> pd.DataFrame:
     """Return a DataFrame with columns [date, close] for the given ticker."""
+    stand_in = STAND_INS.get("price_history")
+    if stand_in is not None:
+        return stand_in(ticker, period=period, start_date=start_date, end_date=end_date)
+    with tracing.span("provider.yfinance", ticker=ticker, period=period, start_date=start_date) as span:
+        frame = _fetch_price_history(ticker, period, start_date, end_date)
+        span.set(rows=len(frame))
+    return frame
+
+
+def _fetch_price_history(
+    ticker: str,
+    period: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> pd.DataFrame:
     try:
         import yfinance as yf
     except ImportError as exc:
@@ -0,0 +1,245 @@
+"""Rolling pairwise correlations across every history series.
+
+All series are placed on the union of their calendars. For each pair the
+rolling window counts only dates where both series have an observation, so
+each pair matches ``DataFrame({a, b}).dropna().rolling(w, min_periods=w).corr()``
+even when calendars differ (FRED business days vs exchange holidays).
+Every pair and window is computed from cumulative sums, a block of pairs
+at a time; results are kept as the upper triangle per date.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+CORRELATION_WINDOWS = (60, 120)
+BASES = ("levels", "changes")
+_MIN_VARIANCE = 1e-12
+PAIR_BLOCK = 256
+
+
+@dataclass
+class RollingCorrelations:
+    keys: List[str]
+    dates: np.ndarray  # datetime64[D], union calendar
+    windows: Tuple[int, ...]
+    upper: Dict[int, np.ndarray]  # window -> (dates x pairs), NaN where undefined
+    basis: str = "levels"
+
+    @property
+    def pairs(self) -> List[Tuple[int, int]]:
+        rows, cols = np.triu_indices(len(self.keys), k=1)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def pair_index(self, a: str, b: str) -> int:
+        i, j = sorted((self.keys.index(a), self.keys.index(b)))
+        n = len(self.keys)
+        return i * n - i * (i + 1) // 2 + (j - i - 1)
+
+    def pair_series(self, a: str, b: str, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        column = self.upper[window][:, self.pair_index(a, b)]
+        keep = ~np.isnan(column)
+        return self.dates[keep], column[keep]
+
+    def matrix_at(self, date: Optional[str], window: int) -> np.ndarray:
+        """Full symmetric matrix as of ``date`` (latest row if None)."""
+        stamps = self.dates.astype(str).tolist()
+        row = len(stamps) - 1 if date is None else bisect_right(stamps, date) - 1
+        matrix = np.eye(len(self.keys))
+        if row < 0:
+            return np.full_like(matrix, np.nan)
+        rows, cols = np.triu_indices(len(self.keys), k=1)
+        matrix[rows, cols] = self.upper[window][row]
+        matrix[cols, rows] = self.upper[window][row]
+        return matrix
+
+    def latest(self, window: int) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """Latest defined value per pair and the date it was observed."""
+        block = self.upper[window]
+        if not len(block):
+            return np.full(block.shape[1], np.nan), [None] * block.shape[1]
+        valid = ~np.isnan(block)
+        has_any = valid.any(axis=0)
+        last_row = len(block) - 1 - np.argmax(valid[::-1], axis=0)
+        values = np.where(has_any, block[last_row, np.arange(block.shape[1])], np.nan)
+        dates = [str(self.dates[r]) if ok else None for r, ok in zip(last_row, has_any)]
+        return values, dates
+
+
+def _to_matrix(
+    series: Dict[str, Tuple[Sequence[str], Sequence[Optional[float]]]],
+    basis: str,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    keys = list(series)
+    parsed = []
+    for key in keys:
+        dates, values = series[key]
+        vals = np.array([np.nan if v is None else v for v in values], dtype="float64")
+        days = np.array(list(dates)[: len(vals)], dtype="datetime64[D]")
+        keep = np.isfinite(vals)
+        order = np.argsort(days[keep], kind="stable")
+        days, vals = days[keep][order], vals[keep][order]
+        if basis == "changes":
+            days, vals = days[1:], np.diff(vals)
+        parsed.append((days, vals))
+    populated = [days for days, _ in parsed if len(days)]
+    calendar = np.unique(np.concatenate(populated)) if populated else np.array([], dtype="datetime64[D]")
+    matrix = np.full((len(calendar), len(keys)), np.nan)
+    for col, (days, vals) in enumerate(parsed):
+        if len(days):
+            matrix[np.searchsorted(calendar, days), col] = vals
+    return keys, calendar, matrix
+
+
+def _standardize(matrix: np.ndarray) -> np.ndarray:
+    # Correlation is invariant to per-series affine maps; centring keeps the
+    # cumulative sums well conditioned for large-level series (WALCL, TGA).
+    # Columns with fewer than 2 observations correlate with nothing; skipping
+    # them keeps nanmean/nanstd from warning on empty slices.
+    mean = np.zeros(matrix.shape[1])
+    std = np.ones(matrix.shape[1])
+    usable = np.isfinite(matrix).sum(axis=0) >= 2
+    if usable.any():
+        mean[usable] = np.nanmean(matrix[:, usable], axis=0)
+        spread = np.nanstd(matrix[:, usable], axis=0)
+        std[usable] = np.where(np.isfinite(spread) & (spread > 0), spread, 1.0)
+    return (matrix - mean) / std
+
+
+def _window_sums(prefix: np.ndarray, start_rows: np.ndarray) -> np.ndarray:
+    """Sum of rows (start, t] for every date t and pair column."""
+    cols = np.arange(prefix.shape[1])[None, :]
+    return prefix[1:] - prefix[start_rows, cols]
+
+
+def _pair_block(
+    valid: np.ndarray,
+    filled: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    windows: Sequence[int],
+) -> Dict[int, np.ndarray]:
+    n_dates, n_pairs = valid.shape[0], len(rows)
+    both = valid[:, rows] & valid[:, cols]
+    a = np.where(both, filled[:, rows], 0.0)
+    b = np.where(both, filled[:, cols], 0.0)
+
+    def _prefix(values: np.ndarray) -> np.ndarray:
+        out = np.zeros((n_dates + 1, n_pairs), dtype=values.dtype)
+        np.cumsum(values, axis=0, out=out[1:])
+        return out
+
+    count = _prefix(both.astype(np.int64))
+    sums = {name: _prefix(arr) for name, arr in (("a", a), ("b", b), ("ab", a * b), ("aa", a * a), ("bb", b * b))}
+
+    # Flatten column-major with a per-pair offset so one searchsorted finds,
+    # for every (date, pair), the first prefix row holding ``count - window``
+    # joint observations. Prefix sums only move on joint observations, so
+    # that row bounds exactly the last ``window`` of them.
+    stride = n_dates + 1
+    offsets = np.arange(n_pairs) * stride
+    flat_counts = (count + offsets).T.ravel()
+
+    upper: Dict[int, np.ndarray] = {}
+    for window in windows:
+        target = count[1:] - window
+        defined = both & (target >= 0)
+        queries = (np.maximum(target, 0) + offsets).T.ravel()
+        position = np.searchsorted(flat_counts, queries, side="left")
+        start_rows = (position - np.repeat(offsets, n_dates)).reshape(n_pairs, n_dates).T
+        sa, sb, sab, saa, sbb = (
+            _window_sums(sums[name], start_rows) for name in ("a", "b", "ab", "aa", "bb")
+        )
+        cov = sab - sa * sb / window
+        var_a = saa - sa * sa / window
+        var_b = sbb - sb * sb / window
+        ok = defined & (var_a > _MIN_VARIANCE) & (var_b > _MIN_VARIANCE)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.where(ok, cov / np.sqrt(np.where(ok, var_a * var_b, 1.0)), np.nan)
+        upper[int(window)] = np.clip(corr, -1.0, 1.0)
+    return upper
+
+
+def compute_rolling_correlations(
+    series: Dict[str, Tuple[Sequence[str], Sequence[Optional[float]]]],
+    windows: Sequence[int] = CORRELATION_WINDOWS,
+    basis: str = "levels",
+) -> RollingCorrelations:
+    """Rolling correlation for every pair of ``{key: (dates, values)}`` series."""
+    if basis not in BASES:
+        raise ValueError(f"basis must be one of {BASES}")
+    keys, calendar, matrix = _to_matrix(series, basis)
+    rows, cols = np.triu_indices(len(keys), k=1)
+    n_dates, n_pairs = len(calendar), len(rows)
+
+    data = _standardize(matrix)
+    valid = ~np.isnan(data)
+    filled = np.nan_to_num(data)
+    upper = {int(window): np.empty((n_dates, n_pairs)) for window in windows}
+    # Pairs are independent, so work in column blocks: the cumulative-sum
+    # temporaries scale with PAIR_BLOCK rather than with the square of the
+    # universe; only the output itself is dates x pairs.
+    for first in range(0, n_pairs, PAIR_BLOCK):
+        block = slice(first, first + PAIR_BLOCK)
+        for window, corr in _pair_block(valid, filled, rows[block], cols[block], windows).items():
+            upper[window][:, block] = corr
+    return RollingCorrelations(keys, calendar, tuple(int(w) for w in windows), upper, basis)
+
+
+def correlation_summary(result: RollingCorrelations) -> Dict[str, Any]:
+    """Latest upper-triangle values per window for history_state.json."""
+    windows: Dict[str, Any] = {}
+    for window in result.windows:
+        values, as_of = result.latest(window)
+        windows[f"{window}d"] = {
+            "upper": [None if np.isnan(v) else float(v) for v in values],
+            "as_of": as_of,
+        }
+    return {"keys": list(result.keys), "basis": result.basis, "layout": "upper_triangle_row_major", "windows": windows}
+
+
+def latest_matrix(summary: Dict[str, Any], window: str) -> List[List[Optional[float]]]:
+    """Expand a stored summary window back to a full symmetric matrix."""
+    keys = summary.get("keys", []) if isinstance(summary, dict) else []
+    block = summary.get("windows", {}).get(window, {}) if isinstance(summary, dict) else {}
+    upper = block.get("upper", []) if isinstance(block, dict) else []
+    n = len(keys)
+    matrix: List[List[Optional[float]]] = [[1.0 if i == j else None for j in range(n)] for i in range(n)]
+    rows, cols = np.triu_indices(n, k=1)
+    for value, i, j in zip(upper, rows.tolist(), cols.tolist()):
+        matrix[i][j] = value
+        matrix[j][i] = value
+    return matrix
+
+
+def save_correlations(path: Path | str, result: RollingCorrelations) -> None:
+    """Write the full per-date upper triangles as compressed float32 arrays."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    arrays = {f"w{window}": result.upper[window].astype("float32") for window in result.windows}
+    with target.open("wb") as handle:
+        np.savez_compressed(
+            handle,
+            keys=np.array(result.keys),
+            dates=result.dates.astype("datetime64[D]").astype("int64"),
+            windows=np.array(result.windows, dtype="int64"),
+            basis=np.array(result.basis),
+            **arrays,
+        )
+
+
+def load_correlations(path: Path | str) -> RollingCorrelations:
+    with np.load(Path(path)) as data:
+        windows = tuple(int(w) for w in data["windows"])
+        return RollingCorrelations(
+            keys=[str(k) for k in data["keys"]],
+            dates=data["dates"].astype("datetime64[D]"),
+            windows=windows,
+            upper={w: data[f"w{w}"].astype("float64") for w in windows},
+            basis=str(data["basis"]),
+        )
@@ -0,0 +1,126 @@
+"""Parametric curve fits for every date in history_state.json.
+
+Writes ``signals/curve_fit_history.json``: one Nelson-Siegel (or Svensson)
+parameter set and fit error per date of the ``yield_curve`` tenor matrix.
+All dates are fitted in one batch (see ``Analytics.curve_fitting``). Decay
+parameters are warm-started from the previous run's file: each date starts
+from its previous fit, or from the latest earlier date's fit when it is
+new, so only dates before the previous run's first fit need the grid.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from Analytics.curve_fitting import TENOR_YEARS, fit_nelson_siegel, fit_svensson
+from History.yield_curve_history import YieldCurveHistory
+from Signals import state_paths
+from Signals.json_utils import write_json
+
+
+HISTORY_MODELS = {"nelson_siegel": fit_nelson_siegel, "svensson": fit_svensson}
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _column(values: np.ndarray) -> list:
+    return [None if np.isnan(v) else round(float(v), 6) for v in values]
+
+
+def _lambda_names(model: str) -> list:
+    return ["lambda1", "lambda2"] if model == "svensson" else ["lambda"]
+
+
+def _warm_start(previous: Optional[Dict[str, Any]], model: str, dates: np.ndarray) -> Optional[np.ndarray]:
+    """Per-date decay seeds (dates x lambdas) from a previous run; NaN where it has no earlier fit."""
+    if not isinstance(previous, dict) or previous.get("model") != model:
+        return None
+    params = previous.get("params")
+    prev_dates = previous.get("dates")
+    if not isinstance(params, dict) or not isinstance(prev_dates, list) or not prev_dates:
+        return None
+    columns = [params.get(name) for name in _lambda_names(model)]
+    if not all(isinstance(column, list) and len(column) == len(prev_dates) for column in columns):
+        return None
+    known = np.array([[np.nan if v is None else v for v in column] for column in columns], dtype="float64").T
+    keep = np.isfinite(known).all(axis=1)
+    if not keep.any():
+        return None
+    known_dates = np.array(prev_dates, dtype="datetime64[D]")[keep]
+    known = known[keep]
+    idx = np.searchsorted(known_dates, dates, side="right") - 1
+    seeds = known[np.maximum(idx, 0)]
+    seeds[idx < 0] = np.nan
+    return seeds
+
+
+def build_curve_fit_history(
+    history_state: Dict[str, Any],
+    model: str = "nelson_siegel",
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Fit every curve date; ``previous`` is an earlier output of this function used as a warm start."""
+    if model not in HISTORY_MODELS:
+        raise ValueError(f"model must be one of {sorted(HISTORY_MODELS)}")
+    curve = YieldCurveHistory.from_history_state(history_state)
+    out: Dict[str, Any] = {
+        "computed_at": _now_iso(),
+        "model": model,
+        "dates": [],
+        "params": {},
+        "rmse_bps": [],
+        "warm_started": 0,
+    }
+    if not len(curve):
+        return out
+    seeds = _warm_start(previous, model, curve.dates)
+    maturities = [TENOR_YEARS[t] for t in curve.tenors]
+    if model == "svensson":
+        fit = fit_svensson(maturities, curve.values.T, initial_lambdas=seeds)
+    else:
+        fit = fit_nelson_siegel(maturities, curve.values.T, initial_lambda=None if seeds is None else seeds[:, 0])
+    params = {f"beta{idx}": _column(fit.betas[:, idx]) for idx in range(fit.betas.shape[1])}
+    if model == "svensson":
+        params.update({"lambda1": _column(fit.lambdas[:, 0]), "lambda2": _column(fit.lambdas[:, 1])})
+    else:
+        params["lambda"] = _column(fit.lambdas[:, 0])
+    out.update(
+        {
+            "dates": [str(day) for day in curve.dates],
+            "params": params,
+            "rmse_bps": _column(fit.rmse_bps),
+            "warm_started": 0 if seeds is None else int(np.isfinite(seeds).all(axis=1).sum()),
+        }
+    )
+    return out
+
+
+def _read_json(path: Path | str) -> Dict[str, Any]:
+    file_path = Path(path)
+    if not file_path.exists():
+        return {}
+    try:
+        data = json.loads(file_path.read_text(encoding="utf-8") or "{}")
+    except json.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_curve_fit_history(
+    history_state_path: Path | str = state_paths.HISTORY_STATE_PATH,
+    out_path: Path | str = state_paths.CURVE_FIT_HISTORY_PATH,
+    model: str = "nelson_siegel",
+) -> Dict[str, Any]:
+    history_state = _read_json(history_state_path)
+    previous = _read_json(out_path)
+    return write_json(out_path, build_curve_fit_history(history_state, model=model, previous=previous))
+
+
+if __name__ == "__main__":
+    write_curve_fit_history()
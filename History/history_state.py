@@ -1,7 +1,10 @@
 """History state writer for UI-only time series."""
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -10,14 +13,37 @@ import pandas as pd
 from Data import yfinance_provider
 from Data.utils.fred_provider import _try_fred_http, _try_openbb_fred
 from Data.utils.snapshot_selection import sanitize_float
+from History.cross_asset_correlation import (
+    RollingCorrelations,
+    compute_rolling_correlations,
+    correlation_summary,
+    save_correlations,
+)
+from History.series_pyramid import build_pyramids
+from History.yield_curve_history import CURVE_TENORS, build_curve_block
 from Signals import state_paths
+from Signals import series_registry, stage_profile, tracing
 from Signals.json_utils import write_json
 
 
 WINDOW_DAYS = {"1y": 365, "3y": 1095, "5y": 1825}
+HISTORY_YEARS = 5
 ROLLING_WINDOWS = {"1y": 252, "3y": 756}
 ROC_WINDOWS = (5, 20)
 
+HISTORY_SERIES = series_registry.registry().history
+# Secondary sources used only when the primary fetch returns no records.
+HISTORY_FALLBACKS = {spec.key: spec.fallbacks for spec in HISTORY_SERIES if spec.fallbacks}
+REALIZED_VOL_KEYS = {spec.key for spec in HISTORY_SERIES if "realized_vol" in spec.attrs.get("transforms", [])}
+CURVE_KEY_PREFIX = "curve:"
+
+# Fetches are I/O bound (threads); transforms are CPU bound (processes).
+# A worker count of 0 or 1 runs that stage inline in the calling process.
+FETCH_WORKERS = 8
+TRANSFORM_WORKERS = min(8, os.cpu_count() or 1)
+FETCH_WORKERS_ENV = "HISTORY_FETCH_WORKERS"
+TRANSFORM_WORKERS_ENV = "HISTORY_TRANSFORM_WORKERS"
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -51,7 +77,8 @@ def _records_from_df(df: pd.DataFrame, value_col: str) -> List[Tuple[datetime, f
     return records
 
 
-def _fetch_fred_history(series_id: str, years: int = 5) -> Tuple[List[Tuple[datetime, float]], str, str]:
+def _fetch_fred_history(series_id: str, years: Optional[int] = None) -> Tuple[List[Tuple[datetime, float]], str, str]:
+    years = years or HISTORY_YEARS
     start_date = (datetime.now(timezone.utc) - timedelta(days=years * 365 + 10)).date().isoformat()
     try:
         df = _try_openbb_fred(series_id, start_date=start_date)
@@ -64,7 +91,8 @@ def _fetch_fred_history(series_id: str, years: int = 5) -> Tuple[List[Tuple[date
     return records, source, status
 
 
-def _fetch_yfinance_history(ticker: str, years: int = 5) -> Tuple[List[Tuple[datetime, float]], str, str]:
+def _fetch_yfinance_history(ticker: str, years: Optional[int] = None) -> Tuple[List[Tuple[datetime, float]], str, str]:
+    years = years or HISTORY_YEARS
     start_date = (datetime.now(timezone.utc) - timedelta(days=years * 365 + 10)).date().isoformat()
     df = yfinance_provider.fetch_price_history(ticker, start_date=start_date)
     records = _records_from_df(df, "close")
@@ -169,110 +197,112 @@ def _cross_asset_transforms(vix: pd.Series, move: pd.Series) -> Dict[str, Any]:
     }
 
 
-def build_history_state() -> Dict[str, Any]:
-    series: Dict[str, Any] = {}
-    transforms: Dict[str, Any] = {}
-    records_map: Dict[str, List[Tuple[datetime, float]]] = {}
+FetchResult = Tuple[List[Tuple[datetime, float]], str, str, str]
 
-    fred_series = {
-        "rrp": "RRPONTSYD",
-        "tga": "WTREGEN",
-        "walcl": "WALCL",
-        "unrate": "UNRATE",
-        "jolts_openings": "JTSJOL",
-        "eci": "ECIALLCIV",
-        "ig_oas": "BAMLC0A0CM",
-        "hy_oas": "BAMLH0A0HYM2",
-        "real_10y": "DFII10",
-        "breakeven_10y": "T10YIE",
-    }
-    for key, series_id in fred_series.items():
-        try:
-            records, source, status = _fetch_fred_history(series_id)
-        except Exception:
-            records, source, status = [], "fred_http", "FAILED"
-        series[key] = _series_entry(records, source, status, series_id)
-        records_map[key] = records
 
-    vol_series = {
-        "vix": "^VIX",
-        "move": "^MOVE",
-        "gvz": "^GVZ",
-        "ovx": "^OVX",
-    }
-    for key, ticker in vol_series.items():
-        try:
-            records, source, status = _fetch_yfinance_history(ticker)
-        except Exception:
-            records, source, status = [], "yfinance", "FAILED"
-        series[key] = _series_entry(records, source, status, ticker)
-        records_map[key] = records
+def _history_plan() -> List[Tuple[str, str, str]]:
+    return [(spec.key, spec.provider, spec.series_id) for spec in HISTORY_SERIES]
 
-    fx_series = {
-        "dxy": "DX-Y.NYB",
-        "eurusd": "EURUSD=X",
-        "gbpusd": "GBPUSD=X",
-        "usdcad": "CAD=X",
-        "usdjpy": "JPY=X",
-        "audusd": "AUDUSD=X",
-        "nzdusd": "NZDUSD=X",
-        "usdnok": "NOK=X",
-        "usdmxn": "MXN=X",
-        "usdzar": "ZAR=X",
-        "usdchf": "CHF=X",
-        "usdcnh": "CNH=X",
-    }
-    for key, ticker in fx_series.items():
+
+def _fetch_from_provider(provider: str, series_id: str) -> FetchResult:
+    fetcher = _fetch_fred_history if provider == "fred" else _fetch_yfinance_history
+    source_on_error = "fred_http" if provider == "fred" else "yfinance"
+    try:
+        records, source, status = fetcher(series_id)
+    except Exception:
+        records, source, status = [], source_on_error, "FAILED"
+    return records, source, status, series_id
+
+
+def _fetch_history_unit(key: str, provider: str, series_id: str) -> FetchResult:
+    with tracing.span("history.fetch", key=key, provider=provider, series_id=series_id) as span:
+        result = _fetch_from_provider(provider, series_id)
+        for fallback in HISTORY_FALLBACKS.get(key, ()):
+            if result[0]:
+                break
+            result = _fetch_from_provider(*fallback)
+        span.set(records=len(result[0]), status=result[2], source=result[1])
+    return result
+
+
+def _transform_unit(key: str, records: List[Tuple[datetime, float]]) -> Dict[str, Any]:
+    with tracing.span("history.transform", key=key, points=len(records)):
+        series_obj = _series_from_records(records)
+        return _transforms_for_series(series_obj, include_realized_vol=key in REALIZED_VOL_KEYS)
+
+
+def _resolve_workers(value: Optional[int], env_name: str, default: int) -> int:
+    if value is None:
+        raw = os.environ.get(env_name)
         try:
-            records, source, status = _fetch_yfinance_history(ticker)
-            series_id = ticker
-        except Exception:
-            records, source, status = [], "yfinance", "FAILED"
-            series_id = ticker
-
-        if key == "dxy" and not records:
-            try:
-                records, source, status = _fetch_fred_history("DTWEXBGS")
-                series_id = "DTWEXBGS"
-            except Exception:
-                records, source, status = [], "fred_http", "FAILED"
-                series_id = "DTWEXBGS"
-
-        if key == "usdcnh" and not records:
-            try:
-                records, source, status = _fetch_yfinance_history("CNY=X")
-                series_id = "CNY=X"
-            except Exception:
-                records, source, status = [], "yfinance", "FAILED"
-                series_id = "CNY=X"
+            value = int(raw) if raw else default
+        except ValueError:
+            value = default
+    return max(0, int(value))
+
 
+def _fetch_all(plan: List[Tuple[str, str, str]], workers: int) -> Dict[str, FetchResult]:
+    if workers <= 1:
+        return {key: _fetch_history_unit(key, provider, sid) for key, provider, sid in plan}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="history-fetch") as pool:
+        futures = {key: pool.submit(_fetch_history_unit, key, provider, sid) for key, provider, sid in plan}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _transform_all(records_map: Dict[str, List[Tuple[datetime, float]]], workers: int) -> Dict[str, Any]:
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {key: pool.submit(_transform_unit, key, records) for key, records in records_map.items()}
+                return {key: future.result() for key, future in futures.items()}
+        except (BrokenProcessPool, OSError):
+            # Sandboxed hosts may forbid worker processes; fall back to inline.
+            pass
+    return {key: _transform_unit(key, records) for key, records in records_map.items()}
+
+
+def _build_history_parts(
+    fetch_workers: Optional[int] = None,
+    transform_workers: Optional[int] = None,
+) -> Tuple[Dict[str, Any], RollingCorrelations]:
+    fetch_workers = _resolve_workers(fetch_workers, FETCH_WORKERS_ENV, FETCH_WORKERS)
+    transform_workers = _resolve_workers(transform_workers, TRANSFORM_WORKERS_ENV, TRANSFORM_WORKERS)
+
+    plan = _history_plan()
+    curve_plan = [(f"{CURVE_KEY_PREFIX}{tenor}", "fred", series_id) for tenor, series_id in CURVE_TENORS]
+    with stage_profile.stage("history.fetch_all", series=len(plan) + len(curve_plan), workers=fetch_workers):
+        fetched = _fetch_all(plan + curve_plan, fetch_workers)
+
+    # Merge in plan order so output never depends on completion order.
+    series: Dict[str, Any] = {}
+    records_map: Dict[str, List[Tuple[datetime, float]]] = {}
+    for key, _, _ in plan:
+        records, source, status, series_id = fetched[key]
         series[key] = _series_entry(records, source, status, series_id)
         records_map[key] = records
 
-    for key, records in records_map.items():
-        series_obj = _series_from_records(records)
-        include_realized = key in {
-            "dxy",
-            "eurusd",
-            "gbpusd",
-            "usdcad",
-            "usdjpy",
-            "audusd",
-            "nzdusd",
-            "usdnok",
-            "usdmxn",
-            "usdzar",
-            "usdchf",
-            "usdcnh",
-        }
-        transforms[key] = _transforms_for_series(series_obj, include_realized_vol=include_realized)
-
-    cross_asset = _cross_asset_transforms(
-        _series_from_records(records_map.get("vix", [])),
-        _series_from_records(records_map.get("move", [])),
-    )
+    with stage_profile.stage("history.transform_all", series=len(records_map), workers=transform_workers):
+        transforms = _transform_all(records_map, transform_workers)
 
-    return {
+    with stage_profile.stage("history.cross_asset"):
+        cross_asset = _cross_asset_transforms(
+            _series_from_records(records_map.get("vix", [])),
+            _series_from_records(records_map.get("move", [])),
+        )
+    with stage_profile.stage("history.correlations", series=len(series)):
+        correlations = compute_rolling_correlations(
+            {key: (entry["dates"], entry["values"]) for key, entry in series.items()}
+        )
+        cross_asset["correlations"] = correlation_summary(correlations)
+
+    curve_results = {key[len(CURVE_KEY_PREFIX) :]: fetched[key] for key, _, _ in curve_plan}
+    with stage_profile.stage("history.yield_curve", tenors=len(curve_results)):
+        yield_curve = build_curve_block(
+            {tenor: result[0] for tenor, result in curve_results.items()},
+            {tenor: result[2] for tenor, result in curve_results.items()},
+        )
+
+    state = {
         "meta": {
             "generated_at": _now_iso(),
             "rolling_windows": ROLLING_WINDOWS,
@@ -281,14 +311,32 @@ def build_history_state() -> Dict[str, Any]:
         "series": series,
         "transforms": transforms,
         "cross_asset": cross_asset,
+        "yield_curve": yield_curve,
     }
+    with stage_profile.stage("history.pyramids"):
+        state["pyramids"] = build_pyramids(series, transforms, cross_asset)
+    return state, correlations
+
+
+def build_history_state(
+    fetch_workers: Optional[int] = None,
+    transform_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    state, _ = _build_history_parts(fetch_workers=fetch_workers, transform_workers=transform_workers)
+    return state
 
 
 def write_history_state(
     path: Path | str = state_paths.HISTORY_STATE_PATH,
+    fetch_workers: Optional[int] = None,
+    transform_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
-    state = build_history_state()
-    return write_json(path, state)
+    state, correlations = _build_history_parts(fetch_workers=fetch_workers, transform_workers=transform_workers)
+    # Full per-date matrices live in a sidecar next to history_state.json.
+    with stage_profile.stage("history.save_correlations"):
+        save_correlations(Path(path).with_name(state_paths.HISTORY_CORRELATIONS_PATH.name), correlations)
+    with stage_profile.stage("history.write_json"):
+        return write_json(path, state)
 
 
 def main() -> None:
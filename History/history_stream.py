@@ -0,0 +1,261 @@
+"""Bounded-memory writer for ``signals/history_state.json``.
+
+``history_state.write_history_state`` builds the whole document before
+serialising it, so peak memory grows with series count x history length.
+``stream_history_state`` instead takes one plan entry at a time: fetch,
+transform, build its series/transforms/pyramid entries, encode them, spool
+the encoded fragments to disk, then drop them. Fetches run ahead on a
+thread pool (and transforms on a process pool), but at most
+``workers + 1`` series are in flight.
+
+What stays in memory for the whole run is fixed or compact:
+
+- VIX/MOVE for ``cross_asset`` and the 10 curve tenors for ``yield_curve``;
+- every series as ``datetime64[D]``/``float64`` arrays (16 bytes a point)
+  for the rolling correlations. Their result is pairwise, so it still grows
+  with the square of the universe;
+- per fragment, the offset into its spool file.
+
+``write_json`` sorts keys, so the document is stitched from the spools in
+sorted order. Each fragment is encoded with the same ``json.dumps`` settings
+and re-indented for its depth, so the file is byte-for-byte what
+``write_json(path, build_history_state())`` writes.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from History import history_state as hs
+from History.cross_asset_correlation import compute_rolling_correlations, correlation_summary, save_correlations
+from History.series_pyramid import LTTB_POINTS, build_levels
+from History.yield_curve_history import build_curve_block
+from Signals import stage_profile, state_paths, tracing
+from Signals.json_utils import sanitize_data
+
+INDENT = "  "
+
+
+def encode(value: Any, level: int) -> str:
+    """``value`` as ``write_json`` renders it when nested ``level`` objects deep."""
+    text = json.dumps(sanitize_data(value), indent=2, sort_keys=True, allow_nan=False)
+    return text.replace("\n", "\n" + INDENT * level)
+
+
+class _Spool:
+    """Encoded ``"key": value`` fragments for one object, appended in any order, read back sorted."""
+
+    def __init__(self, directory: str, name: str, level: int) -> None:
+        self.level = level
+        self.handle: IO[str] = open(os.path.join(directory, f"{name}.spool"), "w+", encoding="utf-8")
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, key: str, value: Any) -> None:
+        text = encode(value, self.level)
+        self.offsets[key] = (self.handle.tell(), len(text))
+        self.handle.write(text)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        self.handle.flush()
+        for key in sorted(self.offsets):
+            offset, length = self.offsets[key]
+            self.handle.seek(offset)
+            yield key, self.handle.read(length)
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class _ObjectWriter:
+    """Writes one JSON object member by member, formatted like ``json.dumps(indent=2)``."""
+
+    def __init__(self, out: IO[str], level: int) -> None:
+        self.out = out
+        self.level = level
+        self.count = 0
+        out.write("{")
+
+    def raw(self, key: str, text: str) -> None:
+        self.out.write(("," if self.count else "") + "\n" + INDENT * self.level + json.dumps(key) + ": ")
+        self.out.write(text)
+        self.count += 1
+
+    def member(self, key: str, value: Any) -> None:
+        self.raw(key, encode(value, self.level))
+
+    def spool(self, key: str, spool: _Spool) -> None:
+        self.raw(key, "")
+        nested = _ObjectWriter(self.out, self.level + 1)
+        for name, text in spool.items():
+            nested.raw(name, text)
+        nested.close()
+
+    def close(self) -> None:
+        self.out.write(("\n" + INDENT * (self.level - 1) + "}") if self.count else "}")
+
+
+def _ordered(pool: Optional[Executor], fn: Any, items: List[Tuple[Any, ...]], window: int) -> Iterator[Any]:
+    """``fn(*item)`` for each item, in order, with at most ``window`` submitted ahead."""
+    if pool is None:
+        for item in items:
+            yield fn(*item)
+        return
+    pending: Deque[Future] = deque()
+    for item in items:
+        pending.append(pool.submit(fn, *item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _units(
+    plan: List[Tuple[str, str, str]],
+    fetch_workers: int,
+    transform_workers: int,
+) -> Iterator[Tuple[str, hs.FetchResult, Dict[str, Any]]]:
+    """(key, fetch result, transforms) per plan entry, in plan order, a bounded number in flight."""
+    fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="history-fetch") if fetch_workers > 1 else None
+    transform_pool: Optional[ProcessPoolExecutor] = None
+    if transform_workers > 1:
+        try:
+            transform_pool = ProcessPoolExecutor(max_workers=transform_workers)
+        except OSError:
+            transform_pool = None
+    pending: Deque[Tuple[str, hs.FetchResult, Any]] = deque()
+
+    def _transforms(key: str, records: List[Any], job: Any) -> Dict[str, Any]:
+        if isinstance(job, Future):
+            try:
+                return job.result()
+            except (BrokenProcessPool, OSError):
+                # Sandboxed hosts may forbid worker processes; fall back to inline.
+                pass
+        return hs._transform_unit(key, records)
+
+    try:
+        fetched = _ordered(fetch_pool, hs._fetch_history_unit, plan, max(1, fetch_workers))
+        for (key, _, _), result in zip(plan, fetched):
+            job = transform_pool.submit(hs._transform_unit, key, result[0]) if transform_pool is not None else None
+            pending.append((key, result, job))
+            if len(pending) > max(1, transform_workers):
+                key, result, job = pending.popleft()
+                yield key, result, _transforms(key, result[0], job)
+        while pending:
+            key, result, job = pending.popleft()
+            yield key, result, _transforms(key, result[0], job)
+    finally:
+        if fetch_pool is not None:
+            fetch_pool.shutdown(cancel_futures=True)
+        if transform_pool is not None:
+            transform_pool.shutdown(cancel_futures=True)
+
+
+def _dated(block: Any) -> bool:
+    return isinstance(block, dict) and isinstance(block.get("dates"), list)
+
+
+def _compact(entry: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.array([np.nan if value is None else value for value in entry["values"]], dtype="float64")
+    return np.array(entry["dates"], dtype="datetime64[D]"), values
+
+
+def stream_history_state(
+    path: Path | str = state_paths.HISTORY_STATE_PATH,
+    fetch_workers: Optional[int] = None,
+    transform_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Write history_state.json one series at a time; returns a small summary, not the document."""
+    fetch_workers = hs._resolve_workers(fetch_workers, hs.FETCH_WORKERS_ENV, hs.FETCH_WORKERS)
+    transform_workers = hs._resolve_workers(transform_workers, hs.TRANSFORM_WORKERS_ENV, hs.TRANSFORM_WORKERS)
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    plan = hs._history_plan()
+    curve_plan = [(f"{hs.CURVE_KEY_PREFIX}{tenor}", "fred", series_id) for tenor, series_id in hs.CURVE_TENORS]
+    compact: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    kept: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory(prefix="history-stream-", dir=target.parent) as scratch:
+        spools = {
+            "series": _Spool(scratch, "series", 2),
+            "transforms": _Spool(scratch, "transforms", 2),
+            "pyramid_series": _Spool(scratch, "pyramid_series", 3),
+            "pyramid_transforms": _Spool(scratch, "pyramid_transforms", 3),
+        }
+        try:
+            with stage_profile.stage("history.stream_series", series=len(plan), workers=fetch_workers):
+                for key, (records, source, status, series_id), transforms in _units(plan, fetch_workers, transform_workers):
+                    with tracing.span("history.spool", key=key, points=len(records)):
+                        entry = hs._series_entry(records, source, status, series_id)
+                        spools["series"].add(key, entry)
+                        spools["transforms"].add(key, transforms)
+                        if _dated(entry):
+                            spools["pyramid_series"].add(key, build_levels(entry, LTTB_POINTS))
+                        spools["pyramid_transforms"].add(
+                            key,
+                            {name: build_levels(block, LTTB_POINTS) for name, block in transforms.items() if _dated(block)},
+                        )
+                        compact[key] = _compact(entry)
+                        if key in ("vix", "move"):
+                            kept[key] = records
+
+            with stage_profile.stage("history.curve_fetch", tenors=len(curve_plan)):
+                curve = {key[len(hs.CURVE_KEY_PREFIX) :]: hs._fetch_history_unit(key, provider, sid) for key, provider, sid in curve_plan}
+            with stage_profile.stage("history.yield_curve", tenors=len(curve)):
+                yield_curve = build_curve_block(
+                    {tenor: result[0] for tenor, result in curve.items()},
+                    {tenor: result[2] for tenor, result in curve.items()},
+                )
+            del curve
+
+            with stage_profile.stage("history.cross_asset"):
+                cross_asset = hs._cross_asset_transforms(
+                    hs._series_from_records(kept.get("vix", [])),
+                    hs._series_from_records(kept.get("move", [])),
+                )
+            del kept
+            with stage_profile.stage("history.correlations", series=len(compact)):
+                correlations = compute_rolling_correlations(compact)
+                cross_asset["correlations"] = correlation_summary(correlations)
+            del compact
+            with stage_profile.stage("history.save_correlations"):
+                save_correlations(target.with_name(state_paths.HISTORY_CORRELATIONS_PATH.name), correlations)
+            del correlations
+
+            tmp = target.with_name(f".{target.name}.tmp")
+            with stage_profile.stage("history.write_json"), tmp.open("w", encoding="utf-8") as out:
+                document = _ObjectWriter(out, 1)
+                document.member("cross_asset", cross_asset)
+                document.member(
+                    "meta",
+                    {"generated_at": hs._now_iso(), "rolling_windows": hs.ROLLING_WINDOWS, "roc_windows": list(hs.ROC_WINDOWS)},
+                )
+                document.raw("pyramids", "")
+                pyramids = _ObjectWriter(out, 2)
+                pyramids.member(
+                    "cross_asset",
+                    {name: build_levels(block, LTTB_POINTS) for name, block in cross_asset.items() if _dated(block)},
+                )
+                pyramids.member("lttb_points", LTTB_POINTS)
+                pyramids.spool("series", spools["pyramid_series"])
+                pyramids.spool("transforms", spools["pyramid_transforms"])
+                pyramids.close()
+                document.spool("series", spools["series"])
+                document.spool("transforms", spools["transforms"])
+                document.member("yield_curve", yield_curve)
+                document.close()
+                out.write("\n")
+            os.replace(tmp, target)
+        finally:
+            for spool in spools.values():
+                spool.close()
+    return {"path": str(target), "series": len(plan), "bytes": target.stat().st_size}
@@ -0,0 +1,277 @@
+"""Vectorised resolver rules replayed over history_state.json.
+
+Each ``*_labels`` function is an array form of a scalar resolver rule and
+returns exactly what the scalar rule returns for every element (NaN stands
+in for ``None``). ``build_regime_backfill`` derives the rule inputs from the
+history store the way the fetchers and analytics derive them from a
+snapshot pull, joins them as-of onto one calendar and labels every date in
+one pass. Curve tenors come from the ``yield_curve`` matrix, or from plain
+``series`` entries named like the raw_state duration keys when a store
+has no matrix.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from Analytics.yield_curve_analytics import TENOR_ORDER
+from History.volatility_regime import BOUNDARY_TOLERANCE, THRESHOLDS
+from Signals import state_paths
+from Signals.json_utils import write_json
+
+
+WEEKLY_OFFSET_OBS = 5
+ROC_CALENDAR_DAYS = 5
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _as_float_array(values: Any) -> np.ndarray:
+    return np.array([np.nan if v is None else v for v in values], dtype="float64")
+
+
+# --- vectorised rules -------------------------------------------------------
+
+
+def yield_curve_labels(y3m: np.ndarray, y2y: np.ndarray, y10y: np.ndarray) -> np.ndarray:
+    """Signals.resolve_yield_curve._determine_regime; None where an input is missing."""
+    s2y_10y = y10y - y2y
+    s3m_10y = y10y - y3m
+    with np.errstate(invalid="ignore"):
+        labels = np.select(
+            [s3m_10y <= -0.10, np.abs(s3m_10y) <= 0.10, (s3m_10y >= 0.75) & (s2y_10y >= 0.25)],
+            ["INVERTED", "FLAT", "STEEP"],
+            default="NORMAL",
+        ).astype(object)
+    labels[np.isnan(y3m) | np.isnan(y2y) | np.isnan(y10y)] = None
+    return labels
+
+
+def volatility_labels(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """History.volatility_regime._classify_regime -> (labels, boundary_case)."""
+    missing = np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        boundary = np.zeros(values.shape, dtype=bool)
+        for threshold in THRESHOLDS:
+            boundary |= np.abs(values - threshold) <= BOUNDARY_TOLERANCE
+        labels = np.select(
+            [missing, boundary, values < THRESHOLDS[0], values <= THRESHOLDS[1], values <= THRESHOLDS[2]],
+            ["UNAVAILABLE", "TRANSITION", "Calm", "Normal", "Elevated"],
+            default="Stress",
+        ).astype(object)
+    return labels, boundary & ~missing
+
+
+def joint_volatility_labels(
+    vix: np.ndarray,
+    move: np.ndarray,
+    vix_boundary: np.ndarray,
+    move_boundary: np.ndarray,
+) -> np.ndarray:
+    """History.volatility_regime._joint_regime."""
+    with np.errstate(invalid="ignore"):
+        vix_stress = vix > THRESHOLDS[2]
+        move_stress = move > THRESHOLDS[2]
+        return np.select(
+            [
+                np.isnan(vix) | np.isnan(move),
+                vix_boundary | move_boundary,
+                vix_stress & move_stress,
+                vix_stress & ~move_stress,
+                move_stress & ~vix_stress,
+                (vix <= THRESHOLDS[1]) & (move <= THRESHOLDS[1]),
+            ],
+            ["UNAVAILABLE", "TRANSITION", "Systemic stress", "Equity-led stress", "Rates-led stress", "Broad calm"],
+            default="Mixed",
+        ).astype(object)
+
+
+def policy_stance_labels(real_10y: np.ndarray, spread_bps: Optional[np.ndarray] = None) -> np.ndarray:
+    """Signals.resolve_policy._base_stance followed by _apply_funding_tilt."""
+    if spread_bps is None:
+        spread_bps = np.full(real_10y.shape, np.nan)
+    with np.errstate(invalid="ignore"):
+        base = np.select(
+            [np.isnan(real_10y), real_10y >= 1.0, real_10y <= 0.0],
+            ["Neutral", "Restrictive", "Accommodative"],
+            default="Neutral",
+        )
+        tilt_eligible = (real_10y > 0.0) & (real_10y < 1.0) & ~np.isnan(spread_bps)
+        return np.select(
+            [tilt_eligible & (spread_bps > 10), tilt_eligible & (spread_bps < -5)],
+            ["Restrictive", "Accommodative"],
+            default=base,
+        ).astype(object)
+
+
+def expected_liquidity_labels(rrp_change: np.ndarray) -> np.ndarray:
+    """Signals.resolve_liquidity_curve._expected_liquidity."""
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [np.isnan(rrp_change), rrp_change < 0, rrp_change > 0],
+            ["Neutral", "Injecting", "Draining"],
+            default="Neutral",
+        ).astype(object)
+
+
+def vol_credit_cross_labels(vix_roc: np.ndarray, hy_change_bps: np.ndarray) -> np.ndarray:
+    """Signals.resolve_vol_credit_cross._resolve_label (label only)."""
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [
+                np.isnan(vix_roc) | np.isnan(hy_change_bps),
+                (vix_roc <= 0) & (hy_change_bps <= 0),
+                (vix_roc > 0) & (hy_change_bps <= 0),
+                (hy_change_bps > 0) & (vix_roc <= 0),
+            ],
+            ["UNAVAILABLE", "NO_STRESS", "MARKET_LED", "CREDIT_LED"],
+            default="UNAVAILABLE",
+        ).astype(object)
+
+
+# --- inputs from the history store -----------------------------------------
+
+Points = Tuple[np.ndarray, np.ndarray]
+
+
+def _empty_points() -> Points:
+    return np.array([], dtype="datetime64[D]"), np.array([], dtype="float64")
+
+
+def _points(block: Any) -> Points:
+    """Valid (date, value) arrays of a {dates, values} block; None values dropped."""
+    if not isinstance(block, dict):
+        return _empty_points()
+    dates = block.get("dates", [])
+    values = block.get("values", [])
+    if not isinstance(dates, list) or not isinstance(values, list) or not dates:
+        return _empty_points()
+    vals = _as_float_array(values[: len(dates)])
+    days = np.array(dates[: len(vals)], dtype="datetime64[D]")
+    keep = ~np.isnan(vals)
+    return days[keep], vals[keep]
+
+
+def _series_points(history_state: Dict[str, Any], key: str) -> Points:
+    series = history_state.get("series", {}) if isinstance(history_state, dict) else {}
+    return _points(series.get(key) if isinstance(series, dict) else None)
+
+
+def _transform_points(history_state: Dict[str, Any], key: str, transform: str) -> Points:
+    transforms = history_state.get("transforms", {}) if isinstance(history_state, dict) else {}
+    block = transforms.get(key, {}) if isinstance(transforms, dict) else {}
+    return _points(block.get(transform) if isinstance(block, dict) else None)
+
+
+def _curve_points(history_state: Dict[str, Any], tenor: str) -> Points:
+    curve = history_state.get("yield_curve", {}) if isinstance(history_state, dict) else {}
+    tenors = curve.get("tenors", []) if isinstance(curve, dict) else []
+    values = curve.get("values", []) if isinstance(curve, dict) else []
+    if isinstance(tenors, list) and tenor in tenors and isinstance(values, list):
+        points = _points({"dates": curve.get("dates", []), "values": values[tenors.index(tenor)]})
+        if len(points[0]):
+            return points
+    return _series_points(history_state, dict(TENOR_ORDER)[tenor])
+
+
+def _observation_change(points: Points, offset: int, scale: float = 1.0) -> Points:
+    """Change vs the observation ``offset`` rows back (select_snapshots last_week)."""
+    dates, values = points
+    if len(values) <= offset:
+        return _empty_points()
+    return dates[offset:], (values[offset:] - values[:-offset]) * scale
+
+
+def _calendar_roc(points: Points, days: int) -> Points:
+    """Pct change vs the last observation on/before date - days (select_prior)."""
+    dates, values = points
+    if not len(values):
+        return _empty_points()
+    prior_idx = np.searchsorted(dates, dates - np.timedelta64(days, "D"), side="right") - 1
+    # select_anchor falls back to the first observation when none precede the anchor.
+    prior = values[np.maximum(prior_idx, 0)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roc = np.where(prior == 0, np.nan, (values - prior) / prior * 100)
+    return dates, roc
+
+
+def _asof(points: Points, calendar: np.ndarray) -> np.ndarray:
+    """Latest value on/before each calendar date (NaN before the first point)."""
+    dates, values = points
+    if not len(values):
+        return np.full(calendar.shape, np.nan)
+    idx = np.searchsorted(dates, calendar, side="right") - 1
+    out = values[np.maximum(idx, 0)].astype("float64")
+    out[idx < 0] = np.nan
+    return out
+
+
+def _count_flips(labels: np.ndarray) -> int:
+    present = [label for label in labels.tolist() if label is not None]
+    return int(sum(1 for prev, cur in zip(present, present[1:]) if prev != cur))
+
+
+def build_regime_backfill(history_state: Dict[str, Any]) -> Dict[str, Any]:
+    inputs: Dict[str, Points] = {
+        "y3m": _curve_points(history_state, "3M"),
+        "y2y": _curve_points(history_state, "2Y"),
+        "y10y": _curve_points(history_state, "10Y"),
+        "vix_z": _transform_points(history_state, "vix", "zscore_3y"),
+        "move_z": _transform_points(history_state, "move", "zscore_3y"),
+        "real_10y": _series_points(history_state, "real_10y"),
+        "effr": _series_points(history_state, "effr"),
+        "sofr": _series_points(history_state, "sofr"),
+        "rrp_change_1w": _observation_change(_series_points(history_state, "rrp"), WEEKLY_OFFSET_OBS),
+        "vix_5d_roc": _calendar_roc(_series_points(history_state, "vix"), ROC_CALENDAR_DAYS),
+        "hy_change_bps": _observation_change(_series_points(history_state, "hy_oas"), WEEKLY_OFFSET_OBS, 100.0),
+    }
+    populated = [dates for dates, _ in inputs.values() if len(dates)]
+    calendar = np.unique(np.concatenate(populated)) if populated else np.array([], dtype="datetime64[D]")
+    aligned = {name: _asof(points, calendar) for name, points in inputs.items()}
+    # Analytics.policy_witnesses: (EFFR - SOFR) in bps from each series' latest value.
+    spread_bps = (aligned["effr"] - aligned["sofr"]) * 100
+
+    equity, equity_boundary = volatility_labels(aligned["vix_z"])
+    rates, rates_boundary = volatility_labels(aligned["move_z"])
+    labels = {
+        "yield_curve": yield_curve_labels(aligned["y3m"], aligned["y2y"], aligned["y10y"]),
+        "volatility_equity": equity,
+        "volatility_rates": rates,
+        "volatility_joint": joint_volatility_labels(
+            aligned["vix_z"], aligned["move_z"], equity_boundary, rates_boundary
+        ),
+        "policy_spot_stance": policy_stance_labels(aligned["real_10y"], spread_bps),
+        "liquidity_expected": expected_liquidity_labels(aligned["rrp_change_1w"]),
+        "vol_credit_cross": vol_credit_cross_labels(aligned["vix_5d_roc"], aligned["hy_change_bps"]),
+    }
+    return {
+        "computed_at": _now_iso(),
+        "alignment": "as-of (latest observation on/before each date)",
+        "dates": [str(day) for day in calendar],
+        "labels": {name: values.tolist() for name, values in labels.items()},
+        "flips": {name: _count_flips(values) for name, values in labels.items()},
+        "inputs_available": {name: bool(len(points[0])) for name, points in inputs.items()},
+    }
+
+
+def write_regime_backfill(
+    history_state_path: Path | str = state_paths.HISTORY_STATE_PATH,
+    out_path: Path | str = state_paths.REGIME_BACKFILL_PATH,
+) -> Dict[str, Any]:
+    history_path = Path(history_state_path)
+    history_state: Dict[str, Any] = {}
+    if history_path.exists():
+        history_state = json.loads(history_path.read_text(encoding="utf-8") or "{}")
+        if not isinstance(history_state, dict):
+            history_state = {}
+    return write_json(out_path, build_regime_backfill(history_state))
+
+
+if __name__ == "__main__":
+    write_regime_backfill()
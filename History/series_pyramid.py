@@ -0,0 +1,171 @@
+"""Downsampled levels of history series for chart rendering.
+
+Each ``{"dates", "values"}`` block gets three coarser levels:
+
+- ``weekly``: last observation of each Monday-based week;
+- ``monthly``: last observation of each calendar month;
+- ``lttb``: Largest-Triangle-Three-Buckets reduction to ``LTTB_POINTS``, which
+  keeps the visual shape (peaks, troughs, turning points) at a fixed point budget.
+
+Missing values are dropped before reducing. The UI picks the finest level
+whose point count inside the selected window fits ``CHART_POINT_BUDGET``
+(see ``pick_level``). ``fidelity`` measures how far a reduced series
+strays from the original.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+LTTB_POINTS = 500
+CHART_POINT_BUDGET = 500
+LEVELS = ("daily", "lttb", "weekly", "monthly")
+
+Block = Dict[str, List[Any]]
+
+
+def _arrays(block: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    dates = block.get("dates", []) if isinstance(block, dict) else []
+    values = block.get("values", []) if isinstance(block, dict) else []
+    if not isinstance(dates, list) or not isinstance(values, list) or not dates:
+        return np.array([], dtype="datetime64[D]"), np.array([], dtype="float64")
+    size = min(len(dates), len(values))
+    days = np.array(dates[:size], dtype="datetime64[D]")
+    vals = np.array([np.nan if v is None else v for v in values[:size]], dtype="float64")
+    keep = ~np.isnan(vals)
+    return days[keep], vals[keep]
+
+
+def _block(days: np.ndarray, values: np.ndarray) -> Block:
+    return {"dates": [str(day) for day in days], "values": [round(float(v), 8) for v in values]}
+
+
+def _last_per_period(days: np.ndarray, values: np.ndarray, period: np.ndarray) -> Block:
+    if not len(days):
+        return {"dates": [], "values": []}
+    last = np.r_[period[1:] != period[:-1], True]
+    return _block(days[last], values[last])
+
+
+def weekly(days: np.ndarray, values: np.ndarray) -> Block:
+    # 1970-01-01 was a Thursday; shifting by 3 starts weeks on Monday.
+    return _last_per_period(days, values, (days.astype("int64") + 3) // 7)
+
+
+def monthly(days: np.ndarray, values: np.ndarray) -> Block:
+    return _last_per_period(days, values, days.astype("datetime64[M]").astype("int64"))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets (first and last always kept)."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    # Per-bucket means of the *next* bucket are independent of the selection; precompute.
+    cumx = np.r_[0.0, np.cumsum(x)]
+    cumy = np.r_[0.0, np.cumsum(y)]
+    starts, stops = edges[:-1], edges[1:]
+    next_start = np.r_[starts[1:], n - 1]
+    next_stop = np.r_[stops[1:], n]
+    width = next_stop - next_start
+    mean_x = (cumx[next_stop] - cumx[next_start]) / width
+    mean_y = (cumy[next_stop] - cumy[next_start]) / width
+    kept = np.empty(threshold, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    xs, ys = x.tolist(), y.tolist()
+    for bucket, (start, stop) in enumerate(zip(starts.tolist(), stops.tolist())):
+        ax, ay = xs[previous], ys[previous]
+        cx, cy = mean_x[bucket], mean_y[bucket]
+        dx, dy = cx - ax, cy - ay
+        best, best_area = start, -1.0
+        for idx in range(start, stop):
+            area = abs(dx * (ys[idx] - ay) - dy * (xs[idx] - ax))
+            if area > best_area:
+                best, best_area = idx, area
+        kept[bucket + 1] = previous = best
+    return kept
+
+
+def lttb(days: np.ndarray, values: np.ndarray, points: int = LTTB_POINTS) -> Block:
+    keep = lttb_indices(days.astype("int64").astype("float64"), values, points)
+    return _block(days[keep], values[keep])
+
+
+def build_levels(block: Dict[str, Any], points: int = LTTB_POINTS) -> Dict[str, Block]:
+    days, values = _arrays(block)
+    return {"weekly": weekly(days, values), "monthly": monthly(days, values), "lttb": lttb(days, values, points)}
+
+
+def build_pyramids(
+    series: Dict[str, Any],
+    transforms: Dict[str, Any],
+    cross_asset: Dict[str, Any],
+    points: int = LTTB_POINTS,
+) -> Dict[str, Any]:
+    """Levels for every dated block, mirroring the ``history_state`` layout."""
+    def _dated(block: Any) -> bool:
+        return isinstance(block, dict) and isinstance(block.get("dates"), list)
+
+    return {
+        "lttb_points": points,
+        "series": {key: build_levels(entry, points) for key, entry in series.items() if _dated(entry)},
+        "transforms": {
+            key: {name: build_levels(block, points) for name, block in blocks.items() if _dated(block)}
+            for key, blocks in transforms.items()
+            if isinstance(blocks, dict)
+        },
+        "cross_asset": {key: build_levels(block, points) for key, block in cross_asset.items() if _dated(block)},
+    }
+
+
+def _count_since(dates: Sequence[str], days: Optional[int]) -> int:
+    if not dates:
+        return 0
+    if days is None:
+        return len(dates)
+    cutoff = (date.fromisoformat(dates[-1]) - timedelta(days=days)).isoformat()
+    return len(dates) - bisect_left(dates, cutoff)
+
+
+def pick_level(
+    full: Dict[str, Any],
+    levels: Dict[str, Any],
+    window_days: Optional[int],
+    budget: int = CHART_POINT_BUDGET,
+) -> Tuple[str, Dict[str, Any]]:
+    """Finest level whose points inside the window fit ``budget`` (coarsest otherwise)."""
+    candidates = [("daily", full)] + [
+        (name, levels[name]) for name in LEVELS[1:] if isinstance(levels, dict) and isinstance(levels.get(name), dict)
+    ]
+    for name, block in candidates:
+        if _count_since(block.get("dates", []), window_days) <= budget:
+            return name, block
+    return candidates[-1]
+
+
+def fidelity(original: Dict[str, Any], reduced: Dict[str, Any]) -> Dict[str, float]:
+    """Error of the reduced line (linearly interpolated) against every original point.
+
+    Errors are normalised by the original's range, so 0.01 means 1% of the
+    chart's vertical extent.
+    """
+    days, values = _arrays(original)
+    small_days, small_values = _arrays(reduced)
+    if len(days) < 2 or len(small_days) < 2:
+        return {"points": float(len(small_days)), "nrmse": 0.0, "max_error": 0.0, "extreme_error": 0.0}
+    rebuilt = np.interp(days.astype("int64"), small_days.astype("int64"), small_values)
+    span = float(values.max() - values.min()) or 1.0
+    error = np.abs(rebuilt - values) / span
+    extremes = max(abs(values.max() - small_values.max()), abs(values.min() - small_values.min())) / span
+    return {
+        "points": float(len(small_days)),
+        "nrmse": float(np.sqrt(np.mean(error**2))),
+        "max_error": float(error.max()),
+        "extreme_error": float(extremes),
+    }
@@ -0,0 +1,125 @@
+"""Nominal Treasury curve history stored as one tenor x date matrix.
+
+``history_state["yield_curve"]`` holds the 10 ``DGS*`` tenors on a shared
+calendar, one values column per tenor. Spreads and butterflies are not
+stored; ``YieldCurveHistory`` derives them on demand and caches each one.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Data.utils.snapshot_selection import sanitize_float
+from Signals.series_registry import registry
+
+
+# (tenor label, FRED id) from the registry's ``curve`` section, short to long.
+CURVE_TENORS: List[Tuple[str, str]] = [(spec.key, spec.series_id or "") for spec in registry().curve]
+NAMED_SPREADS: Dict[str, Tuple[str, str]] = {
+    "3m10y": ("3M", "10Y"),
+    "2s10s": ("2Y", "10Y"),
+    "2s5s": ("2Y", "5Y"),
+    "5s30s": ("5Y", "30Y"),
+    "10s30s": ("10Y", "30Y"),
+}
+NAMED_BUTTERFLIES: Dict[str, Tuple[str, str, str]] = {
+    "2s5s10s": ("2Y", "5Y", "10Y"),
+    "5s10s30s": ("5Y", "10Y", "30Y"),
+}
+
+Records = List[Tuple[datetime, float]]
+
+
+def build_curve_block(
+    records_by_tenor: Dict[str, Records],
+    status_by_tenor: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Columnar ``{tenors, series_ids, status, dates, values}`` block."""
+    status_by_tenor = status_by_tenor or {}
+    per_tenor: Dict[str, Dict[str, float]] = {}
+    for tenor, _ in CURVE_TENORS:
+        points: Dict[str, float] = {}
+        for dt, value in records_by_tenor.get(tenor, []):
+            clean = sanitize_float(value)
+            if clean is not None:
+                points[dt.date().isoformat()] = clean
+        per_tenor[tenor] = points
+    dates = sorted(set().union(*per_tenor.values()))
+    return {
+        "tenors": [tenor for tenor, _ in CURVE_TENORS],
+        "series_ids": [series_id for _, series_id in CURVE_TENORS],
+        "status": [status_by_tenor.get(tenor, "FAILED") for tenor, _ in CURVE_TENORS],
+        "units": "percent",
+        "dates": dates,
+        "values": [[per_tenor[tenor].get(day) for day in dates] for tenor, _ in CURVE_TENORS],
+    }
+
+
+class YieldCurveHistory:
+    """Read-only view over a curve block with cached derived series (bps)."""
+
+    def __init__(self, block: Optional[Dict[str, Any]]) -> None:
+        block = block if isinstance(block, dict) else {}
+        tenors = block.get("tenors", [])
+        dates = block.get("dates", [])
+        values = block.get("values", [])
+        if not isinstance(tenors, list) or not isinstance(dates, list) or not isinstance(values, list):
+            tenors, dates, values = [], [], []
+        self.tenors: List[str] = [str(t) for t in tenors]
+        self.dates = np.array(dates, dtype="datetime64[D]")
+        self.values = np.full((len(self.tenors), len(dates)), np.nan)
+        for row, column in enumerate(values[: len(self.tenors)]):
+            if isinstance(column, list):
+                self.values[row, : len(column)] = [np.nan if v is None else v for v in column[: len(dates)]]
+        self._cache: Dict[Tuple[str, ...], np.ndarray] = {}
+
+    @classmethod
+    def from_history_state(cls, history_state: Dict[str, Any]) -> "YieldCurveHistory":
+        block = history_state.get("yield_curve") if isinstance(history_state, dict) else None
+        return cls(block)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def tenor(self, label: str) -> np.ndarray:
+        if label in self.tenors:
+            return self.values[self.tenors.index(label)]
+        if label in dict(CURVE_TENORS):
+            # Known tenor absent from this block (older history file).
+            return np.full(len(self.dates), np.nan)
+        raise KeyError(f"unknown tenor {label!r}")
+
+    def spread(self, short: str, long: str) -> np.ndarray:
+        """``long - short`` in bps for every date (NaN where either is missing)."""
+        key = ("spread", short, long)
+        if key not in self._cache:
+            self._cache[key] = (self.tenor(long) - self.tenor(short)) * 100
+        return self._cache[key]
+
+    def butterfly(self, short: str, body: str, long: str) -> np.ndarray:
+        """``2 * body - short - long`` in bps (positive = belly cheap)."""
+        key = ("butterfly", short, body, long)
+        if key not in self._cache:
+            self._cache[key] = (2 * self.tenor(body) - self.tenor(short) - self.tenor(long)) * 100
+        return self._cache[key]
+
+    def derived(self, name: str) -> np.ndarray:
+        """Named series (``2s10s``, ``2s5s10s``) or explicit ``2Y-10Y`` / ``2Y-5Y-10Y``."""
+        if name in NAMED_SPREADS:
+            return self.spread(*NAMED_SPREADS[name])
+        if name in NAMED_BUTTERFLIES:
+            return self.butterfly(*NAMED_BUTTERFLIES[name])
+        legs = name.split("-")
+        if len(legs) == 2:
+            return self.spread(*legs)
+        if len(legs) == 3:
+            return self.butterfly(*legs)
+        raise KeyError(f"unknown curve series {name!r}")
+
+    def points(self, name: str) -> Tuple[List[str], List[float]]:
+        """Dates and values of a derived series with missing dates dropped."""
+        values = self.derived(name)
+        keep = ~np.isnan(values)
+        return [str(day) for day in self.dates[keep]], values[keep].tolist()
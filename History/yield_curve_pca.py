@@ -0,0 +1,236 @@
+"""Rolling PCA of daily yield-curve changes (level/slope/curvature).
+
+The decomposition works on the covariance of the last ``PCA_WINDOW``
+complete daily changes of the history tenor matrix. Its window sums (count,
+sum, cross-products) persist in ``signals/yield_curve_pca_state.json``, so
+a run adds the new days and subtracts the days leaving the window, then
+eigendecomposes a 10 x 10 matrix. No SVD over the full history is needed.
+The state also keeps a digest of the window's dates and rows. When today's
+history no longer reproduces it (a revised print, or a day that became
+complete), the rows leaving the window are not the ones that were added,
+so the sums are rebuilt from scratch. They are also rebuilt every
+``REBASE_INTERVAL`` updates to bound floating-point drift. Each component is sign-aligned with the
+previous run's loadings, so factors do not flip between updates.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from History.yield_curve_history import YieldCurveHistory
+from Signals import state_paths
+from Signals.json_utils import write_json
+
+
+PCA_WINDOW = 252
+FACTOR_NAMES = ("level", "slope", "curvature")
+REBASE_INTERVAL = 250
+SCORE_HISTORY = 60
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def curve_changes(curve: YieldCurveHistory) -> Tuple[List[str], np.ndarray]:
+    """Changes (bps) between consecutive dates on which every tenor is present."""
+    complete = ~np.isnan(curve.values).any(axis=0)
+    levels = curve.values[:, complete].T
+    dates = [str(day) for day in curve.dates[complete]]
+    if len(levels) < 2:
+        return [], np.empty((0, len(curve.tenors)))
+    return dates[1:], np.diff(levels, axis=0) * 100
+
+
+def _empty_state(tenors: List[str], window: int) -> Dict[str, Any]:
+    size = len(tenors)
+    return {
+        "tenors": list(tenors),
+        "window": window,
+        "last_date": None,
+        "count": 0,
+        "total": [0.0] * size,
+        "cross": [[0.0] * size for _ in range(size)],
+        "loadings": None,
+        "updates_since_rebase": 0,
+        "window_digest": None,
+    }
+
+
+def window_digest(dates: List[str], rows: np.ndarray) -> str:
+    """Digest of the window's dates and change rows, to detect revised history."""
+    digest = hashlib.sha256("\n".join(dates).encode("utf-8"))
+    digest.update(np.ascontiguousarray(rows, dtype="float64").tobytes())
+    return digest.hexdigest()
+
+
+def _rebuild(tenors: List[str], dates: List[str], changes: np.ndarray, window: int) -> Dict[str, Any]:
+    state = _empty_state(tenors, window)
+    rows = changes[-window:]
+    state.update(
+        {
+            "last_date": dates[-1] if dates else None,
+            "count": int(len(rows)),
+            "total": rows.sum(axis=0).tolist(),
+            "cross": (rows.T @ rows).tolist(),
+            "window_digest": window_digest(dates[-window:], rows),
+        }
+    )
+    return state
+
+
+def _window_unchanged(state: Dict[str, Any], dates: List[str], changes: np.ndarray) -> bool:
+    """Whether the stored window's rows are still what history gives for those dates."""
+    end = dates.index(state["last_date"]) + 1
+    start = end - int(state.get("count", 0))
+    if start < 0:
+        return False
+    return state.get("window_digest") == window_digest(dates[start:end], changes[start:end])
+
+
+def update_state(
+    state: Optional[Dict[str, Any]],
+    tenors: List[str],
+    dates: List[str],
+    changes: np.ndarray,
+    window: int = PCA_WINDOW,
+) -> Dict[str, Any]:
+    """Advance window sums to the last change date (rebuilding when needed)."""
+    compatible = (
+        isinstance(state, dict)
+        and state.get("tenors") == list(tenors)
+        and state.get("window") == window
+        and state.get("last_date") in dates
+        and state.get("updates_since_rebase", 0) < REBASE_INTERVAL
+        and _window_unchanged(state, dates, changes)
+    )
+    if not compatible:
+        rebuilt = _rebuild(tenors, dates, changes, window)
+        if isinstance(state, dict) and state.get("tenors") == list(tenors):
+            rebuilt["loadings"] = state.get("loadings")
+        return rebuilt
+    position = dates.index(state["last_date"])
+    if position == len(dates) - 1:
+        return dict(state)
+    entering = changes[position + 1 :]
+    # Rows i enter for i in (position, n); row i - window leaves with each.
+    leaving = changes[max(0, position + 1 - window) : max(0, len(dates) - window)]
+    total = np.asarray(state["total"]) + entering.sum(axis=0) - leaving.sum(axis=0)
+    cross = np.asarray(state["cross"]) + entering.T @ entering - leaving.T @ leaving
+    out = dict(state)
+    out.update(
+        {
+            "last_date": dates[-1],
+            "count": int(min(len(dates), window)),
+            "total": total.tolist(),
+            "cross": cross.tolist(),
+            "updates_since_rebase": int(state.get("updates_since_rebase", 0)) + 1,
+            "window_digest": window_digest(dates[-window:], changes[-window:]),
+        }
+    )
+    return out
+
+
+def _canonical_signs(loadings: np.ndarray) -> np.ndarray:
+    """Level loads positive, slope rises with maturity, curvature has a positive belly."""
+    middle = loadings.shape[0] // 2
+    checks = [
+        loadings[:, 0].sum(),
+        loadings[-1, 1] - loadings[0, 1],
+        2 * loadings[middle, 2] - loadings[0, 2] - loadings[-1, 2],
+    ]
+    signs = np.array([-1.0 if check < 0 else 1.0 for check in checks[: loadings.shape[1]]])
+    return loadings * signs
+
+
+def decompose(state: Dict[str, Any], factors: int = len(FACTOR_NAMES)) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(explained variance ratio, loadings tenors x factors, window mean)."""
+    count = state["count"]
+    total = np.asarray(state["total"], dtype="float64")
+    cross = np.asarray(state["cross"], dtype="float64")
+    mean = total / count
+    covariance = (cross - np.outer(total, total) / count) / max(count - 1, 1)
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    order = np.argsort(eigenvalues)[::-1]
+    eigenvalues = np.clip(eigenvalues[order], 0.0, None)
+    loadings = eigenvectors[:, order[:factors]]
+    previous = state.get("loadings")
+    if previous is not None and np.asarray(previous).shape == loadings.shape:
+        signs = np.sign(np.einsum("tk,tk->k", loadings, np.asarray(previous)))
+        loadings = loadings * np.where(signs == 0, 1.0, signs)
+    else:
+        loadings = _canonical_signs(loadings)
+    explained = eigenvalues[:factors] / eigenvalues.sum() if eigenvalues.sum() > 0 else np.zeros(factors)
+    return explained, loadings, mean
+
+
+def _rounded(values: np.ndarray) -> List[float]:
+    return [round(float(value), 6) for value in values]
+
+
+def build_yield_curve_factors(
+    history_state: Dict[str, Any],
+    pca_state: Optional[Dict[str, Any]] = None,
+    window: int = PCA_WINDOW,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Return the daily_state block and the updated PCA state."""
+    curve = YieldCurveHistory.from_history_state(history_state)
+    dates, changes = curve_changes(curve)
+    factors = len(FACTOR_NAMES)
+    if len(dates) <= factors:
+        return {"computed_at": _now_iso(), "status": "UNAVAILABLE", "window": window}, pca_state
+    state = update_state(pca_state, curve.tenors, dates, changes, window)
+    explained, loadings, mean = decompose(state, factors)
+    state["loadings"] = loadings.tolist()
+    recent_dates = dates[-SCORE_HISTORY:]
+    scores = (changes[-SCORE_HISTORY:] - mean) @ loadings
+    block = {
+        "computed_at": _now_iso(),
+        "status": "OK",
+        "as_of": dates[-1],
+        "window": window,
+        "observations": state["count"],
+        "tenors": list(curve.tenors),
+        "units": "bps daily change",
+        "explained_variance_ratio": {name: round(float(v), 6) for name, v in zip(FACTOR_NAMES, explained)},
+        "loadings": {name: _rounded(loadings[:, idx]) for idx, name in enumerate(FACTOR_NAMES)},
+        "latest_scores": {name: round(float(scores[-1, idx]), 4) for idx, name in enumerate(FACTOR_NAMES)},
+        "scores": {
+            "dates": recent_dates,
+            **{name: _rounded(scores[:, idx]) for idx, name in enumerate(FACTOR_NAMES)},
+        },
+    }
+    return block, state
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8") or "{}")
+    return data if isinstance(data, dict) else {}
+
+
+def write_daily_state(
+    history_state_path: Path | str = state_paths.HISTORY_STATE_PATH,
+    daily_state_path: Path | str = state_paths.DAILY_STATE_PATH,
+    pca_state_path: Path | str = state_paths.YIELD_CURVE_PCA_STATE_PATH,
+) -> Dict[str, Any]:
+    history_state = _read_json(Path(history_state_path))
+    pca_path = Path(pca_state_path)
+    block, state = build_yield_curve_factors(history_state, _read_json(pca_path) or None)
+    if state is not None:
+        write_json(pca_path, state)
+    daily_path = Path(daily_state_path)
+    daily = _read_json(daily_path)
+    daily["yield_curve_factors"] = block
+    write_json(daily_path, daily)
+    return daily
+
+
+if __name__ == "__main__":
+    write_daily_state()
@@ -0,0 +1,198 @@
+"""ZQ strip history: every contract's daily price in one contract x date array.
+
+The store (``signals/zq_strip.npz``) keeps a row per contract sorted by
+expiry month and a column per trading date. Each run refetches only the
+contracts that have not yet expired and merges them in, so expired
+contracts keep their history across rolls at the cost of one float32 row.
+Contracts are fetched through ``Data.fetch_engine.run_batches`` under the
+registry's ``policy_futures.zq`` provider, so the provider sees one request
+at a time, as in the raw_state fetch.
+Constant-maturity implied rates (1M/3M/6M ahead) are interpolated across
+contract mid-months for every date in one vectorised pass. They go to
+their own small file (``signals/zq_constant_maturity.json``), so
+history_state.json is written once per run and never re-read here.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+import calendar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Analytics.policy_path import contract_month, generate_zq_tickers
+from Data import fetch_engine
+from Data.fetch_engine import PlanItem
+from Signals import state_paths, tracing
+from Signals.series_registry import registry
+from Signals.json_utils import write_json
+
+
+CONSTANT_MATURITIES = {"1M": 1, "3M": 3, "6M": 6}
+STRIP_MONTHS_AHEAD = 12
+FETCH_PERIOD = "1y"
+
+Points = Tuple[np.ndarray, np.ndarray]
+
+
+def _month_index(ticker: str) -> int:
+    year, month = contract_month(ticker)
+    return year * 12 + month - 1
+
+
+@dataclass
+class ZQStrip:
+    contracts: List[str]
+    dates: np.ndarray  # datetime64[D]
+    prices: np.ndarray  # contracts x dates, NaN where no settlement
+
+    @classmethod
+    def empty(cls) -> "ZQStrip":
+        return cls([], np.array([], dtype="datetime64[D]"), np.empty((0, 0)))
+
+    @classmethod
+    def load(cls, path: Path | str = state_paths.ZQ_STRIP_PATH) -> "ZQStrip":
+        store = Path(path)
+        if not store.exists():
+            return cls.empty()
+        with np.load(store) as data:
+            return cls(
+                contracts=[str(c) for c in data["contracts"]],
+                dates=data["dates"].astype("datetime64[D]"),
+                prices=data["prices"].astype("float64"),
+            )
+
+    def save(self, path: Path | str = state_paths.ZQ_STRIP_PATH) -> None:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                contracts=np.array(self.contracts, dtype=str),
+                dates=self.dates.astype("int64"),
+                prices=self.prices.astype("float32"),
+            )
+
+    @property
+    def expiry_months(self) -> np.ndarray:
+        return np.array([_month_index(c) for c in self.contracts], dtype="int64")
+
+    def active(self, today: date) -> List[str]:
+        current = today.year * 12 + today.month - 1
+        return [c for c, month in zip(self.contracts, self.expiry_months) if month >= current]
+
+    def merge(self, updates: Dict[str, Points]) -> "ZQStrip":
+        """New strip with ``{ticker: (dates, prices)}`` merged over the stored rows."""
+        updates = {t: p for t, p in updates.items() if contract_month(t) is not None and len(p[0])}
+        contracts = sorted(set(self.contracts) | set(updates), key=lambda t: (_month_index(t), t))
+        pieces = [self.dates] + [np.asarray(days, dtype="datetime64[D]") for days, _ in updates.values()]
+        dates = np.unique(np.concatenate(pieces)) if pieces else self.dates
+        prices = np.full((len(contracts), len(dates)), np.nan)
+        row_of = {ticker: row for row, ticker in enumerate(contracts)}
+        if self.contracts:
+            rows = [row_of[t] for t in self.contracts]
+            prices[np.ix_(rows, np.searchsorted(dates, self.dates))] = self.prices
+        for ticker, (days, values) in updates.items():
+            cols = np.searchsorted(dates, np.asarray(days, dtype="datetime64[D]"))
+            values = np.asarray(values, dtype="float64")
+            keep = ~np.isnan(values)
+            prices[row_of[ticker], cols[keep]] = values[keep]
+        return ZQStrip(contracts, dates, prices)
+
+    def constant_maturity(self, horizons: Dict[str, int] = CONSTANT_MATURITIES) -> Dict[str, np.ndarray]:
+        """Implied rate ``h`` months ahead of each date, linear across contract mid-months."""
+        if not self.contracts or not len(self.dates):
+            return {label: np.array([]) for label in horizons}
+        rates = 100.0 - self.prices
+        mids = self.expiry_months + 0.5
+        years = self.dates.astype("datetime64[Y]").astype(int) + 1970
+        months = self.dates.astype("datetime64[M]").astype(int) % 12
+        days = (self.dates - self.dates.astype("datetime64[M]")).astype(int)
+        lengths = np.array([calendar.monthrange(y, m + 1)[1] for y, m in zip(years, months)])
+        position = years * 12 + months + days / lengths
+
+        n_contracts, n_dates = rates.shape
+        valid = ~np.isnan(rates)
+        row = np.arange(n_contracts)[:, None]
+        last_valid = np.maximum.accumulate(np.where(valid, row, -1), axis=0)
+        next_valid = np.minimum.accumulate(np.where(valid, row, n_contracts)[::-1], axis=0)[::-1]
+        cols = np.arange(n_dates)
+        out: Dict[str, np.ndarray] = {}
+        for label, horizon in horizons.items():
+            target = position + horizon
+            split = np.searchsorted(mids, target, side="right")
+            lo = np.where(split > 0, last_valid[np.maximum(split - 1, 0), cols], -1)
+            hi = np.where(split < n_contracts, next_valid[np.minimum(split, n_contracts - 1), cols], n_contracts)
+            usable = (lo >= 0) & (hi < n_contracts)
+            lo_c, hi_c = np.clip(lo, 0, n_contracts - 1), np.clip(hi, 0, n_contracts - 1)
+            span = mids[hi_c] - mids[lo_c]
+            weight = np.where(span > 0, (target - mids[lo_c]) / np.where(span > 0, span, 1.0), 0.0)
+            value = rates[lo_c, cols] + weight * (rates[hi_c, cols] - rates[lo_c, cols])
+            # Exact hits on a mid-month have lo == hi and need no neighbour.
+            exact = (lo >= 0) & (mids[lo_c] == target)
+            out[label] = np.where(usable | exact, value, np.nan)
+        return out
+
+
+def _fetch_contract(ticker: str) -> Points:
+    try:
+        points = fetch_engine.price_points(ticker, period=FETCH_PERIOD)
+    except Exception:
+        points = []
+    days = np.array([dt.date().isoformat() for dt, _ in points], dtype="datetime64[D]")
+    return days, np.array([value for _, value in points], dtype="float64")
+
+
+def update_zq_strip(
+    path: Path | str = state_paths.ZQ_STRIP_PATH,
+    today: Optional[date] = None,
+    months_ahead: Optional[int] = None,
+    fetcher: Callable[[str], Points] = _fetch_contract,
+) -> ZQStrip:
+    today = today or date.today()
+    strip = ZQStrip.load(path)
+    months_ahead = STRIP_MONTHS_AHEAD if months_ahead is None else months_ahead
+    tickers = list(dict.fromkeys(generate_zq_tickers(today, months_ahead) + strip.active(today)))
+    provider = registry().spec("policy_futures", "zq").provider
+    plan = [PlanItem(("zq_strip", ticker), provider, lambda ticker=ticker: fetcher(ticker)) for ticker in tickers]
+    with tracing.span("zq.fetch_strip", contracts=len(tickers), provider=provider):
+        results = fetch_engine.run_batches(plan, lambda fetch: fetch())
+    strip = strip.merge({ticker: results[("zq_strip", ticker)] for ticker in tickers})
+    strip.save(path)
+    return strip
+
+
+def constant_maturity_block(strip: ZQStrip) -> Dict[str, Any]:
+    block: Dict[str, Any] = {}
+    dates = [str(day) for day in strip.dates]
+    for label, values in strip.constant_maturity().items():
+        keep = ~np.isnan(values)
+        block[label] = {
+            "dates": [day for day, ok in zip(dates, keep) if ok],
+            "values": [round(float(v), 6) for v in values[keep]],
+        }
+    return block
+
+
+def write_zq_strip(
+    path: Path | str = state_paths.ZQ_STRIP_PATH,
+    out_path: Path | str = state_paths.ZQ_CONSTANT_MATURITY_PATH,
+    today: Optional[date] = None,
+    fetcher: Callable[[str], Points] = _fetch_contract,
+) -> Dict[str, Any]:
+    """Refresh the strip store and write its constant-maturity series to ``out_path``."""
+    strip = update_zq_strip(path, today=today, fetcher=fetcher)
+    return write_json(
+        out_path,
+        {
+            "contracts": strip.contracts,
+            "method": "100 - price, linear across contract mid-months",
+            "series": constant_maturity_block(strip),
+        },
+    )
+
+
+if __name__ == "__main__":
+    write_zq_strip()
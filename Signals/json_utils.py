@@ -6,6 +6,8 @@ import json
 import math
 from typing import Any
 
+from Signals import tracing
+
 
 def _sanitize_scalar(value: Any) -> Any:
     if value is None:
@@ -34,10 +36,10 @@ def sanitize_data(value: Any) -> Any:
 
 def write_json(path: Path | str, data: Any) -> Any:
     target = Path(path)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    sanitized = sanitize_data(data)
-    target.write_text(
-        json.dumps(sanitized, indent=2, sort_keys=True, allow_nan=False) + "\n",
-        encoding="utf-8",
-    )
+    with tracing.span("write_json", path=str(target)) as span:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        sanitized = sanitize_data(data)
+        text = json.dumps(sanitized, indent=2, sort_keys=True, allow_nan=False) + "\n"
+        target.write_text(text, encoding="utf-8")
+        span.set(bytes=len(text))
     return sanitized
@@ -6,6 +6,9 @@ from typing import Any, Dict, Optional
 from Signals import state_paths
 from Signals.json_utils import write_json
 
+# Used only when the policy_futures_curve block does not carry its own threshold.
+DEFAULT_DIRECTION_THRESHOLD_BPS = 12.5
+
 
 def _get_block(daily_state: Dict[str, Any], key: str) -> Dict[str, Any]:
     block = daily_state.get(key, {})
@@ -40,8 +43,22 @@ def _base_direction(breakeven_change: Optional[float]) -> str:
     return "Hold"
 
 
+def _get_implied_change(daily_state: Dict[str, Any]) -> Optional[float]:
+    futures = _get_block(daily_state, "policy_futures_curve")
+    return _get_value(futures, "implied_change_12m_bps")
+
+
+def _path_direction(implied_change_bps: float, threshold_bps: float) -> str:
+    if implied_change_bps > threshold_bps:
+        return "Tightening"
+    if implied_change_bps < -threshold_bps:
+        return "Easing"
+    return "Hold"
+
+
 def _get_policy_proxy(daily_state: Dict[str, Any]) -> Optional[float]:
     for block_key, value_key in (
+        ("policy_futures_curve", "policy_pricing_proxy"),
         ("yield_expectations", "policy_pricing_proxy"),
         ("yield_expectations", "forward_policy_proxy"),
         ("yield_curve", "policy_pricing_proxy"),
@@ -62,6 +79,16 @@ def _inputs_used(breakeven_change: Optional[float], proxy: Optional[float], stre
     }
 
 
+def _futures_coverage(futures: Dict[str, Any], implied_change: Optional[float]) -> Dict[str, Any]:
+    """Optional ZQ input, reported apart from inputs_used so a daily_state without a strip is not 'missing'."""
+    horizon = futures.get("implied_change_horizon_months")
+    return {
+        "implied_path": implied_change is not None,
+        "horizon_months": horizon if isinstance(horizon, int) else None,
+        "partial_horizon": bool(futures.get("implied_change_partial")) and implied_change is not None,
+    }
+
+
 def _explanation(
     direction: str,
     breakeven_change: Optional[float],
@@ -69,9 +96,20 @@ def _explanation(
     sofr: Optional[float],
     stress: Optional[str],
     missing_any: bool,
+    implied_change: Optional[float] = None,
+    coverage: Optional[Dict[str, Any]] = None,
 ) -> str:
     parts = []
-    if breakeven_change is None:
+    if implied_change is not None:
+        parts.append(
+            f"Fed funds futures price {implied_change:+.0f} bps of policy change over the next 12 months, "
+            f"pointing toward {direction.lower()}."
+        )
+        if coverage and coverage.get("partial_horizon"):
+            months = coverage.get("horizon_months")
+            span = f"the next {months} months" if months else "part of the year"
+            parts.append(f"The FOMC calendar or contract strip only covers {span}, so the change is partial.")
+    elif breakeven_change is None:
         parts.append("Inflation expectations trend is unavailable, so the bias defaults to hold.")
     elif breakeven_change > 0:
         parts.append("Inflation expectations are rising, pointing toward tightening.")
@@ -116,15 +154,27 @@ def resolve_policy_curve(daily_state_path: Path | str = state_paths.DAILY_STATE_
     sofr = _get_value(witnesses, "sofr_current")
     stress = _get_text(volatility, "stress_origin_read")
 
-    direction = _base_direction(breakeven_change)
+    futures = _get_block(daily_state, "policy_futures_curve")
+    implied_change = _get_implied_change(daily_state)
+    coverage = _futures_coverage(futures, implied_change)
+
+    # The futures-implied path is a direct expectations read; breakevens are the fallback.
+    if implied_change is not None:
+        threshold = _get_value(futures, "direction_threshold_bps")
+        direction = _path_direction(implied_change, DEFAULT_DIRECTION_THRESHOLD_BPS if threshold is None else threshold)
+    else:
+        direction = _base_direction(breakeven_change)
     inputs_used = _inputs_used(breakeven_change, proxy, stress)
     missing_any = not all(inputs_used.values())
 
     policy_curve = {
         "expected_direction": direction,
         "horizon": "6–12 months",
-        "explanation": _explanation(direction, breakeven_change, proxy, sofr, stress, missing_any),
+        "explanation": _explanation(
+            direction, breakeven_change, proxy, sofr, stress, missing_any, implied_change, coverage
+        ),
         "inputs_used": inputs_used,
+        "futures_coverage": coverage,
     }
 
     daily_state["policy_curve"] = policy_curve
@@ -0,0 +1,174 @@
+"""Declarative series registry loaded from ``config/series_registry.json``.
+
+Every series the pipeline ingests is described once: provider, id,
+fallbacks, cadence, lookback window and the raw_state section it lands in.
+``raw_state`` lists the sections of ``signals/raw_state.json`` in fetch
+order; ``history`` lists the series ``History/history_state.py`` pulls and
+``curve`` the nominal Treasury tenors (keyed by tenor label, short to long)
+behind ``history_state["yield_curve"]``.
+Keys other than the ones below stay on the spec as ``attrs`` (FX labels,
+policy-rate currencies, history transforms, ...).
+
+Series entry keys:
+
+- ``key``: the field name inside its section (or in history_state; the
+  tenor label for ``curve``);
+- ``provider``: ``fred`` | ``yfinance`` | ``manual`` | ``custom``;
+- ``id``: FRED series id or ticker; null means not configured (FAILED);
+- ``fallbacks``: ``[{"provider", "id"}]`` tried in order when the primary fails;
+- ``cadence``: ``daily`` | ``weekly`` | ``monthly`` | ``quarterly``;
+- ``window``: lookback in days, when the anchor window is not enough;
+- ``fetcher``: ``"<Data module>.<function>"`` kept for the legacy module
+  API; required for ``manual``/``custom`` providers, optional otherwise;
+- ``expand``: fan one entry out into a dict of contracts (``zq_contracts``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REGISTRY_PATH = Path(__file__).resolve().parents[1] / "config" / "series_registry.json"
+
+CADENCES = ("daily", "weekly", "monthly", "quarterly")
+PROVIDERS = ("fred", "yfinance", "manual", "custom")
+FETCHED_PROVIDERS = ("fred", "yfinance")
+_SPEC_KEYS = {"key", "provider", "id", "fallbacks", "cadence", "window", "fetcher"}
+
+
+@dataclass(frozen=True)
+class SeriesSpec:
+    key: str
+    provider: str
+    series_id: Optional[str] = None
+    section: Optional[str] = None
+    fallbacks: Tuple[Tuple[str, str], ...] = ()
+    cadence: str = "daily"
+    window: Optional[int] = None
+    fetcher: Optional[str] = None
+    attrs: Dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def label(self) -> str:
+        return f"{self.section}.{self.key}" if self.section else self.key
+
+
+@dataclass(frozen=True)
+class Section:
+    name: str
+    health: bool
+    series: Tuple[SeriesSpec, ...]
+
+
+@dataclass(frozen=True)
+class Registry:
+    sections: Tuple[Section, ...]
+    history: Tuple[SeriesSpec, ...]
+    curve: Tuple[SeriesSpec, ...] = ()
+
+    def section(self, name: str) -> Section:
+        for section in self.sections:
+            if section.name == name:
+                return section
+        raise KeyError(f"unknown registry section {name!r}")
+
+    def spec(self, section: str, key: str) -> SeriesSpec:
+        for spec in self.section(section).series:
+            if spec.key == key:
+                return spec
+        raise KeyError(f"unknown series {section}.{key}")
+
+    def find(self, provider: str, series_id: str) -> Optional[SeriesSpec]:
+        """First spec (raw_state sections, then history) fetching ``series_id`` from ``provider``."""
+        for spec in [s for section in self.sections for s in section.series] + list(self.history):
+            if spec.provider == provider and spec.series_id == series_id:
+                return spec
+        return None
+
+
+def _spec(entry: Any, where: str, section: Optional[str] = None) -> SeriesSpec:
+    if not isinstance(entry, dict) or not isinstance(entry.get("key"), str) or not entry["key"]:
+        raise ValueError(f"{where}: series entries need a non-empty string 'key'")
+    label = f"{where}.{entry['key']}"
+    provider = entry.get("provider")
+    if provider not in PROVIDERS:
+        raise ValueError(f"{label}: provider must be one of {PROVIDERS}")
+    series_id = entry.get("id")
+    if series_id is not None and not isinstance(series_id, str):
+        raise ValueError(f"{label}: id must be a string or null")
+    cadence = entry.get("cadence", "daily")
+    if cadence not in CADENCES:
+        raise ValueError(f"{label}: cadence must be one of {CADENCES}")
+    window = entry.get("window")
+    if window is not None and (not isinstance(window, int) or isinstance(window, bool) or window <= 0):
+        raise ValueError(f"{label}: window must be a positive number of days")
+    fetcher = entry.get("fetcher")
+    if fetcher is not None and (not isinstance(fetcher, str) or "." not in fetcher):
+        raise ValueError(f"{label}: fetcher must look like '<module>.<function>'")
+    if provider not in FETCHED_PROVIDERS and fetcher is None:
+        raise ValueError(f"{label}: {provider} series need a fetcher")
+    fallbacks: List[Tuple[str, str]] = []
+    for fallback in entry.get("fallbacks", []):
+        if (
+            not isinstance(fallback, dict)
+            or fallback.get("provider") not in FETCHED_PROVIDERS
+            or not isinstance(fallback.get("id"), str)
+        ):
+            raise ValueError(f"{label}: fallbacks need a fred/yfinance 'provider' and a string 'id'")
+        fallbacks.append((fallback["provider"], fallback["id"]))
+    return SeriesSpec(
+        key=entry["key"],
+        provider=provider,
+        series_id=series_id,
+        section=section,
+        fallbacks=tuple(fallbacks),
+        cadence=cadence,
+        window=window,
+        fetcher=fetcher,
+        attrs={name: value for name, value in entry.items() if name not in _SPEC_KEYS},
+    )
+
+
+def _unique(specs: List[SeriesSpec], where: str) -> Tuple[SeriesSpec, ...]:
+    keys = [spec.key for spec in specs]
+    duplicates = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicates:
+        raise ValueError(f"{where}: duplicate keys {duplicates}")
+    return tuple(specs)
+
+
+def _history(data: Dict[str, Any], name: str) -> Tuple[SeriesSpec, ...]:
+    specs = [_spec(entry, name) for entry in data.get(name, [])]
+    for spec in specs:
+        if spec.provider not in FETCHED_PROVIDERS or not spec.series_id:
+            raise ValueError(f"{name}.{spec.key}: {name} series need a fred/yfinance id")
+    return _unique(specs, name)
+
+
+def parse(data: Any) -> Registry:
+    """Validate a registry document; raises ValueError naming the offending entry."""
+    if not isinstance(data, dict) or not isinstance(data.get("raw_state"), list):
+        raise ValueError("series registry needs a 'raw_state' list of sections")
+    sections: List[Section] = []
+    for raw in data["raw_state"]:
+        if not isinstance(raw, dict) or not isinstance(raw.get("section"), str) or raw["section"] == "meta":
+            raise ValueError("raw_state entries need a 'section' name other than 'meta'")
+        name = raw["section"]
+        specs = [_spec(entry, name, name) for entry in raw.get("series", [])]
+        sections.append(Section(name=name, health=bool(raw.get("health", False)), series=_unique(specs, name)))
+    names = [section.name for section in sections]
+    if len(set(names)) != len(names):
+        raise ValueError("raw_state: duplicate section names")
+    return Registry(sections=tuple(sections), history=_history(data, "history"), curve=_history(data, "curve"))
+
+
+@lru_cache(maxsize=4)
+def load(path: Path | str = REGISTRY_PATH) -> Registry:
+    return parse(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def registry() -> Registry:
+    """The registry shipped in ``config/series_registry.json``."""
+    return load(REGISTRY_PATH)
@@ -0,0 +1,222 @@
+"""Per-stage cProfile and tracemalloc reports for update and history runs.
+
+``update.py --profile`` / ``history_update.py --profile`` open a session.
+Each pipeline stage (``stage("history.transform_all")``, one per analytics
+writer and resolver, JSON writes, ...) then runs under its own cProfile
+profiler, with tracemalloc measuring it. The output goes to
+``signals/profiles/<run>-<UTC time>/`` (or the given directory):
+
+- ``NN-<stage>.pstats``: open with ``python -m pstats`` or snakeviz;
+- ``summary.json``: per stage, the seconds, the peak traced memory above
+  the stage's starting point, the net change in traced memory and the top
+  functions by own time. With ``--profile-allocations`` it also lists the
+  top allocation sites (a tracemalloc snapshot diff per stage, which is
+  slow when large state is live);
+- ``report.txt``: the stage table plus the hottest functions over the
+  whole run.
+
+Stages do not nest: cProfile allows one active profiler, so a stage inside
+another is covered by the outer one. Only the thread that opened the
+session is profiled. Work handed to fetch threads or transform processes
+shows up as waiting in the stage that spawned it (use ``--fetch-workers 0
+--transform-workers 0`` to profile it inline). Times include profiler
+overhead. Every stage is also a ``Signals.tracing`` span.
+"""
+from __future__ import annotations
+
+import cProfile
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from Signals import state_paths, tracing
+
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 10
+MIB = 2**20
+
+FunctionKey = Tuple[str, int, str]
+
+
+def _label(key: FunctionKey) -> str:
+    filename, line, name = key
+    if filename.startswith("~") or filename.startswith("<"):
+        return name
+    path = Path(filename)
+    try:
+        shown = str(path.resolve().relative_to(Path.cwd().resolve()))
+    except ValueError:
+        shown = "/".join(path.parts[-2:])
+    return f"{name} ({shown}:{line})"
+
+
+def _top_functions(stats: pstats.Stats, top: int) -> List[Dict[str, Any]]:
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]  # type: ignore[attr-defined]
+    return [
+        {
+            "function": _label(key),
+            "calls": calls,
+            "own_seconds": round(own, 6),
+            "cumulative_seconds": round(cumulative, 6),
+        }
+        for key, (_, calls, own, cumulative, _) in rows
+    ]
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+
+
+class ProfileSession:
+    def __init__(self, directory: Path | str, run: str, top: int = TOP_FUNCTIONS, allocations: bool = False) -> None:
+        self.directory = Path(directory)
+        self.run = run
+        self.top = top
+        self.allocations = allocations
+        self.thread = threading.get_ident()
+        self.active = False
+        self.stages: List[Dict[str, Any]] = []
+        self._stats: Optional[pstats.Stats] = None
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        self.active = True
+        before = _snapshot() if self.allocations else None
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        error = None
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            profiler.disable()
+            seconds = time.perf_counter() - started
+            end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            allocations = _snapshot().compare_to(before, "lineno")[:TOP_ALLOCATIONS] if before is not None else []
+            self._record(name, profiler, seconds, peak_bytes - start_bytes, end_bytes - start_bytes, allocations, error)
+            self.active = False
+
+    def _record(
+        self,
+        name: str,
+        profiler: cProfile.Profile,
+        seconds: float,
+        peak_bytes: int,
+        net_bytes: int,
+        allocations: List[tracemalloc.StatisticDiff],
+        error: Optional[str],
+    ) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stats_path = self.directory / f"{len(self.stages) + 1:02d}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.pstats"
+        profiler.dump_stats(stats_path)
+        stats = pstats.Stats(profiler)
+        if self._stats is None:
+            self._stats = pstats.Stats(profiler)
+        else:
+            self._stats.add(stats)
+        self.stages.append(
+            {
+                "stage": name,
+                "seconds": round(seconds, 6),
+                "peak_mib": round(peak_bytes / MIB, 3),
+                "net_mib": round(net_bytes / MIB, 3),
+                "pstats": stats_path.name,
+                "error": error,
+                "top_functions": _top_functions(stats, self.top),
+                "top_allocations": [
+                    {
+                        "site": f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+                        "size_mib": round(diff.size_diff / MIB, 3),
+                        "blocks": diff.count_diff,
+                    }
+                    for diff in allocations
+                ],
+            }
+        )
+
+    def write_report(self) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        hot = _top_functions(self._stats, self.top) if self._stats is not None else []
+        summary = {"run": self.run, "generated_at": datetime.now(timezone.utc).isoformat(), "stages": self.stages, "hot_functions": hot}
+        (self.directory / "summary.json").write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+        lines = [f"{self.run}: {len(self.stages)} stages, {sum(s['seconds'] for s in self.stages):.2f}s profiled", ""]
+        lines.append(f"{'stage':<44} {'seconds':>9} {'peak MiB':>9} {'net MiB':>9}  top function")
+        for entry in self.stages:
+            first = entry["top_functions"][0]["function"] if entry["top_functions"] else ""
+            lines.append(f"{entry['stage']:<44} {entry['seconds']:>9.3f} {entry['peak_mib']:>9.1f} {entry['net_mib']:>9.1f}  {first}")
+        lines += ["", "Hottest functions over the run (own time):", f"{'own s':>9} {'cum s':>9} {'calls':>9}  function"]
+        for row in hot:
+            lines.append(f"{row['own_seconds']:>9.3f} {row['cumulative_seconds']:>9.3f} {row['calls']:>9}  {row['function']}")
+        report = self.directory / "report.txt"
+        report.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return report
+
+
+_SESSION: Optional[ProfileSession] = None
+
+
+@contextmanager
+def stage(name: str, **attrs: Any) -> Iterator[Any]:
+    """A pipeline stage: a tracing span, profiled when a session is open (outermost stage only)."""
+    session = _SESSION
+    with tracing.span(name, **attrs) as span:
+        if session is None or session.active or threading.get_ident() != session.thread:
+            yield span
+        else:
+            with session.measure(name):
+                yield span
+
+
+@contextmanager
+def session(
+    directory: Path | str,
+    run: str = "run",
+    top: int = TOP_FUNCTIONS,
+    allocations: bool = False,
+) -> Iterator[ProfileSession]:
+    global _SESSION
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profile = _SESSION = ProfileSession(directory, run, top, allocations)
+    try:
+        yield profile
+    finally:
+        _SESSION = None
+        if started_tracing:
+            tracemalloc.stop()
+        profile.write_report()
+
+
+def session_for(
+    run: str,
+    directory: Optional[str],
+    top: int = TOP_FUNCTIONS,
+    allocations: bool = False,
+) -> ContextManager[Any]:
+    """``session()`` for a ``--profile [DIR]`` value: None = off, "" = a new dir under signals/profiles/."""
+    if directory is None:
+        return nullcontext()
+    if not directory:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        directory = str(state_paths.PROFILE_DIR / f"{run}-{stamp}")
+    return session(directory, run, top, allocations)
@@ -0,0 +1,341 @@
+"""Append-only archive of raw_state/daily_state snapshots.
+
+Every run is stored as per-block deltas against the previous snapshot, with
+a full keyframe every ``KEYFRAME_INTERVAL`` runs. Each block delta is
+compressed independently and appended to ``archive.bin``; ``index.jsonl``
+holds one line per run with ``generated_at`` and the byte span of every
+block. ``index.pos`` holds one fixed-width record per run (timestamp plus
+the byte span of its index line), so opening the archive reads nothing up
+front, locating a run is a bisect over those records (O(log n) seeks) and
+only the index lines a replay needs are parsed. Rebuilding a snapshot (or
+one block) replays at most ``KEYFRAME_INTERVAL`` deltas.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+import zlib
+
+from Signals import state_paths
+from Signals.json_utils import sanitize_data
+
+
+KEYFRAME_INTERVAL = 48
+COMPRESSION_LEVEL = 6
+STATES = ("raw", "daily")
+DATA_FILE = "archive.bin"
+INDEX_FILE = "index.jsonl"
+POSITIONS_FILE = "index.pos"
+# generated_at (NUL-padded ASCII), offset and length of the run's index.jsonl line.
+_RECORD = struct.Struct("<48sQI")
+_SEP = "\x1f"
+
+Flat = Dict[str, Any]
+
+
+def _flatten(value: Any, prefix: str = "") -> Flat:
+    """Flatten nested dicts to path -> leaf. Lists and empty dicts are leaves."""
+    if not isinstance(value, dict) or not value:
+        return {prefix: value}
+    flat: Flat = {}
+    for key, item in value.items():
+        path = f"{prefix}{_SEP}{key}" if prefix else str(key)
+        flat.update(_flatten(item, path))
+    return flat
+
+
+def _unflatten(flat: Flat) -> Any:
+    if set(flat) == {""}:
+        return flat[""]
+    root: Dict[str, Any] = {}
+    for path, value in flat.items():
+        parts = path.split(_SEP)
+        node = root
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return root
+
+
+def _block_delta(previous: Optional[Flat], current: Optional[Flat]) -> Dict[str, Any]:
+    if current is None:
+        return {"drop": True}
+    if previous is None:
+        return {"set": current, "del": []}
+    changed = {path: value for path, value in current.items() if path not in previous or previous[path] != value}
+    removed = [path for path in previous if path not in current]
+    return {"set": changed, "del": removed}
+
+
+def _apply_delta(flat: Optional[Flat], delta: Dict[str, Any]) -> Optional[Flat]:
+    if delta.get("drop"):
+        return None
+    out = {} if flat is None or delta.get("full") else dict(flat)
+    for path in delta.get("del", []):
+        out.pop(path, None)
+    out.update(delta.get("set", {}))
+    return out
+
+
+def _split_blocks(raw_state: Dict[str, Any], daily_state: Dict[str, Any]) -> Dict[str, Flat]:
+    blocks: Dict[str, Flat] = {}
+    for state_name, state in zip(STATES, (raw_state, daily_state)):
+        if not isinstance(state, dict):
+            continue
+        for key, value in state.items():
+            blocks[f"{state_name}/{key}"] = _flatten(sanitize_data(value))
+    return blocks
+
+
+class StateArchive:
+    """Reader/writer for an archive directory (default ``signals/archive``)."""
+
+    def __init__(
+        self,
+        root: Path | str = state_paths.ARCHIVE_DIR,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> None:
+        self.root = Path(root)
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self._lock = threading.Lock()
+        self._cache: Dict[int, Dict[str, Any]] = {}
+        self._count = self._sync_positions()
+
+    @property
+    def data_path(self) -> Path:
+        return self.root / DATA_FILE
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_FILE
+
+    @property
+    def positions_path(self) -> Path:
+        return self.root / POSITIONS_FILE
+
+    def __len__(self) -> int:
+        return self._count
+
+    def timestamps(self) -> List[str]:
+        return [self._timestamp(position) for position in range(self._count)]
+
+    def _record(self, position: int) -> Tuple[str, int, int]:
+        with self.positions_path.open("rb") as handle:
+            handle.seek(position * _RECORD.size)
+            stamp, offset, length = _RECORD.unpack(handle.read(_RECORD.size))
+        return stamp.rstrip(b"\0").decode("ascii"), offset, length
+
+    def _timestamp(self, position: int) -> str:
+        return self._record(position)[0]
+
+    def _entry(self, position: int) -> Dict[str, Any]:
+        entry = self._cache.get(position)
+        if entry is None:
+            _, offset, length = self._record(position)
+            with self.index_path.open("rb") as handle:
+                handle.seek(offset)
+                entry = json.loads(handle.read(length))
+            self._cache[position] = entry
+        return entry
+
+    def _entries(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        return [self._entry(position) for position in range(start, stop)]
+
+    def _sync_positions(self) -> int:
+        """Record count; index lines missing from index.pos (legacy archive, crash between writes) are added."""
+        count = self.positions_path.stat().st_size // _RECORD.size if self.positions_path.exists() else 0
+        covered = 0
+        if count:
+            _, offset, length = self._record(count - 1)
+            covered = offset + length
+        if not self.index_path.exists() or self.index_path.stat().st_size <= covered:
+            return count
+        with self.index_path.open("rb") as handle, self.positions_path.open("r+b" if count else "wb") as positions:
+            positions.truncate(count * _RECORD.size)
+            positions.seek(count * _RECORD.size)
+            handle.seek(covered)
+            offset = covered
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written trailing line from an interrupted run.
+                    offset += len(line)
+                    continue
+                positions.write(_RECORD.pack(entry["generated_at"].encode("ascii"), offset, len(line)))
+                offset += len(line)
+                count += 1
+        return count
+
+    def _drop_torn_tail(self) -> None:
+        """Cut a partial trailing index line (interrupted run) so the next line starts on its own."""
+        size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        if not size:
+            return
+        with self.index_path.open("r+b") as handle:
+            handle.seek(size - 1)
+            if handle.read(1) == b"\n":
+                return
+            end = 0
+            if self._count:
+                _, offset, length = self._record(self._count - 1)
+                end = offset + length
+            handle.truncate(end)
+
+    def _read_chunk(self, span: List[int]) -> Dict[str, Any]:
+        offset, length = span
+        with self.data_path.open("rb") as handle:
+            handle.seek(offset)
+            payload = handle.read(length)
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def locate(self, generated_at: Optional[str] = None) -> int:
+        """Index of the latest run at or before ``generated_at`` (latest if None)."""
+        if not self._count:
+            raise LookupError("archive is empty")
+        if generated_at is None:
+            return self._count - 1
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if generated_at < self._timestamp(middle):
+                high = middle
+            else:
+                low = middle + 1
+        position = low - 1
+        if position < 0:
+            raise LookupError(f"no archived run at or before {generated_at}")
+        return position
+
+    def _keyframe_before(self, position: int) -> int:
+        return position - (position % self.keyframe_interval)
+
+    def _replay_block(self, name: str, position: int) -> Optional[Flat]:
+        flat: Optional[Flat] = None
+        for entry in self._entries(self._keyframe_before(position), position + 1):
+            span = entry["blocks"].get(name)
+            if span is None:
+                if entry.get("keyframe"):
+                    flat = None
+                continue
+            flat = _apply_delta(flat, self._read_chunk(span))
+        return flat
+
+    def _block_names_at(self, position: int) -> List[str]:
+        names: List[str] = []
+        seen = set()
+        for entry in self._entries(self._keyframe_before(position), position + 1):
+            for name in entry["blocks"]:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+        return names
+
+    def _flat_blocks_at(self, position: int) -> Dict[str, Flat]:
+        blocks: Dict[str, Flat] = {}
+        for name in self._block_names_at(position):
+            flat = self._replay_block(name, position)
+            if flat is not None:
+                blocks[name] = flat
+        return blocks
+
+    def snapshot(self, generated_at: Optional[str] = None) -> Dict[str, Any]:
+        """Rebuild ``{"generated_at", "raw", "daily"}`` for a past run."""
+        position = self.locate(generated_at)
+        out: Dict[str, Any] = {"generated_at": self._timestamp(position), "raw": {}, "daily": {}}
+        for name, flat in self._flat_blocks_at(position).items():
+            state_name, key = name.split("/", 1)
+            out[state_name][key] = _unflatten(flat)
+        return out
+
+    def block(self, state_name: str, key: str, generated_at: Optional[str] = None) -> Any:
+        """Rebuild a single top-level block (e.g. ``("daily", "fx")``)."""
+        if state_name not in STATES:
+            raise ValueError(f"unknown state {state_name!r}; expected one of {STATES}")
+        position = self.locate(generated_at)
+        flat = self._replay_block(f"{state_name}/{key}", position)
+        return None if flat is None else _unflatten(flat)
+
+    def append(
+        self,
+        raw_state: Dict[str, Any],
+        daily_state: Dict[str, Any],
+        generated_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Append one run; returns its index entry."""
+        if generated_at is None:
+            meta = raw_state.get("meta", {}) if isinstance(raw_state, dict) else {}
+            generated_at = meta.get("generated_at") if isinstance(meta, dict) else None
+        if not isinstance(generated_at, str) or not generated_at:
+            raise ValueError("generated_at is required to archive a run")
+        if len(generated_at.encode("ascii", "replace")) > _RECORD.size - 12:
+            raise ValueError(f"generated_at {generated_at!r} is too long to index")
+        with self._lock:
+            last = self._timestamp(self._count - 1) if self._count else None
+            if last is not None and generated_at < last:
+                raise ValueError(f"generated_at {generated_at} is older than the last archived run {last}")
+            position = self._count
+            keyframe = position % self.keyframe_interval == 0
+            current = _split_blocks(raw_state, daily_state)
+            previous = {} if keyframe or position == 0 else self._flat_blocks_at(position - 1)
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            spans: Dict[str, List[int]] = {}
+            with self.data_path.open("ab") as handle:
+                offset = handle.tell()
+                for name in sorted(set(current) | set(previous)):
+                    delta = _block_delta(previous.get(name), current.get(name))
+                    if not keyframe and not delta.get("drop") and not delta["set"] and not delta["del"]:
+                        continue
+                    if keyframe:
+                        delta["full"] = True
+                    payload = zlib.compress(
+                        json.dumps(delta, sort_keys=True, separators=(",", ":"), allow_nan=False).encode("utf-8"),
+                        COMPRESSION_LEVEL,
+                    )
+                    handle.write(payload)
+                    spans[name] = [offset, len(payload)]
+                    offset += len(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+
+            entry = {"generated_at": generated_at, "keyframe": keyframe, "blocks": spans}
+            # Index line after the data, position record last: a crash never references missing bytes.
+            line = (json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+            self._drop_torn_tail()
+            with self.index_path.open("ab") as handle:
+                handle.seek(0, os.SEEK_END)
+                line_offset = handle.tell()
+                handle.write(line)
+            with self.positions_path.open("ab") as handle:
+                handle.write(_RECORD.pack(generated_at.encode("ascii"), line_offset, len(line)))
+            self._cache[position] = entry
+            self._count += 1
+            return entry
+
+    def size_bytes(self) -> Tuple[int, int]:
+        data = self.data_path.stat().st_size if self.data_path.exists() else 0
+        index = sum(path.stat().st_size for path in (self.index_path, self.positions_path) if path.exists())
+        return data, index
+
+
+def _read_state(path: Path | str) -> Dict[str, Any]:
+    state_path = Path(path)
+    if not state_path.exists():
+        return {}
+    data = json.loads(state_path.read_text(encoding="utf-8") or "{}")
+    return data if isinstance(data, dict) else {}
+
+
+def archive_run(
+    raw_state_path: Path | str = state_paths.RAW_STATE_PATH,
+    daily_state_path: Path | str = state_paths.DAILY_STATE_PATH,
+    archive_dir: Path | str = state_paths.ARCHIVE_DIR,
+) -> Dict[str, Any]:
+    """Append the current raw/daily state files to the archive."""
+    archive = StateArchive(archive_dir)
+    return archive.append(_read_state(raw_state_path), _read_state(daily_state_path))
@@ -0,0 +1,120 @@
+"""Generation manifest published after each state write.
+
+``signals/state_manifest.json`` is a few hundred bytes. Readers (the
+dashboard's watcher thread) poll it instead of the state files. It holds:
+
+- ``generation``: a counter bumped whenever any state file's content changes;
+- ``files``: per file, the content digest (the same sha256 prefix the UI
+  data layer uses as its generation) and size;
+- ``blocks``: a digest per top-level daily_state block;
+- ``changed``: which daily_state blocks changed in this generation, and
+  whether the history files (history_state and the ZQ constant-maturity
+  series) changed.
+
+The manifest is written to a temp file and renamed into place, so a reader
+sees the old or the new manifest, never a partial one. It is written after
+the state files, so every file it names is already complete.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from Signals import state_paths
+
+
+DIGEST_CHARS = 12
+SOURCES = {
+    "daily_state": state_paths.DAILY_STATE_PATH,
+    "history_state": state_paths.HISTORY_STATE_PATH,
+    "zq_constant_maturity": state_paths.ZQ_CONSTANT_MATURITY_PATH,
+}
+HISTORY_SOURCES = ("history_state", "zq_constant_maturity")
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def file_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:DIGEST_CHARS]
+
+
+def _block_digests(raw: bytes) -> Dict[str, str]:
+    try:
+        data = json.loads(raw.decode("utf-8") or "{}")
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        key: hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:DIGEST_CHARS]
+        for key, value in data.items()
+    }
+
+
+def load_manifest(path: Path | str = state_paths.STATE_MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def build_manifest(
+    previous: Optional[Dict[str, Any]] = None,
+    sources: Optional[Dict[str, Path | str]] = None,
+) -> Dict[str, Any]:
+    previous = previous or {}
+    files: Dict[str, Any] = {}
+    blocks: Dict[str, str] = {}
+    for name, path in (sources or SOURCES).items():
+        try:
+            raw = Path(path).read_bytes()
+        except OSError:
+            continue
+        files[name] = {"path": str(path), "digest": file_digest(raw), "bytes": len(raw)}
+        if name == "daily_state":
+            blocks = _block_digests(raw)
+
+    old_files = previous.get("files", {}) if isinstance(previous.get("files"), dict) else {}
+    old_blocks = previous.get("blocks", {}) if isinstance(previous.get("blocks"), dict) else {}
+
+    def _digest(entries: Dict[str, Any], name: str) -> Optional[str]:
+        entry = entries.get(name)
+        return entry.get("digest") if isinstance(entry, dict) else None
+
+    if previous and all(_digest(files, name) == _digest(old_files, name) for name in set(files) | set(old_files)):
+        # Nothing new: same generation, so watchers stay idle.
+        return previous
+    return {
+        "generation": int(previous.get("generation", 0) or 0) + 1,
+        "published_at": _now_iso(),
+        "files": files,
+        "blocks": blocks,
+        "changed": {
+            "daily_state": sorted(key for key in set(blocks) | set(old_blocks) if blocks.get(key) != old_blocks.get(key)),
+            "history_state": any(_digest(files, name) != _digest(old_files, name) for name in HISTORY_SOURCES),
+        },
+    }
+
+
+def publish_manifest(
+    path: Path | str = state_paths.STATE_MANIFEST_PATH,
+    sources: Optional[Dict[str, Path | str]] = None,
+) -> Dict[str, Any]:
+    """Bump and atomically write the manifest if any state file changed."""
+    target = Path(path)
+    previous = load_manifest(target)
+    manifest = build_manifest(previous, sources)
+    if manifest == previous:
+        return manifest
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, target)
+    return manifest
@@ -4,6 +4,18 @@ from pathlib import Path
 RAW_STATE_PATH = Path("signals/raw_state.json")
 DAILY_STATE_PATH = Path("signals/daily_state.json")
 HISTORY_STATE_PATH = Path("signals/history_state.json")
+HISTORY_CORRELATIONS_PATH = Path("signals/history_correlations.npz")
+ARCHIVE_DIR = Path("signals/archive")
+REGIME_BACKFILL_PATH = Path("signals/regime_backfill.json")
+CURVE_FIT_HISTORY_PATH = Path("signals/curve_fit_history.json")
+ZQ_STRIP_PATH = Path("signals/zq_strip.npz")
+ZQ_CONSTANT_MATURITY_PATH = Path("signals/zq_constant_maturity.json")
+YIELD_CURVE_PCA_STATE_PATH = Path("signals/yield_curve_pca_state.json")
+UI_PROFILE_LOG_PATH = Path("signals/ui_panel_profile.jsonl")
+REPORT_HTML_PATH = Path("signals/dashboard_report.html")
+STATE_MANIFEST_PATH = Path("signals/state_manifest.json")
+TRACE_DIR = Path("signals/traces")
+PROFILE_DIR = Path("signals/profiles")
 
 
 def raw_state_path() -> Path:
@@ -16,3 +28,11 @@ def daily_state_path() -> Path:
 
 def history_state_path() -> Path:
     return HISTORY_STATE_PATH
+
+
+def archive_dir() -> Path:
+    return ARCHIVE_DIR
+
+
+def history_correlations_path() -> Path:
+    return HISTORY_CORRELATIONS_PATH
@@ -0,0 +1,216 @@
+"""Span tracing for update and history runs, exported as Chrome trace-event JSON.
+
+Off by default: ``span()`` then returns a shared no-op, so an instrumented
+call costs one global lookup. ``session(path)`` turns tracing on for a run
+and writes a trace that opens in Perfetto (ui.perfetto.dev) or
+chrome://tracing. Spans nest per thread, and attributes (series ids, row
+counts, bytes) show up as the event's args.
+
+Worker processes started during a session inherit it through
+``PIPELINE_TRACE_SPOOL`` (forked or spawned). Each worker appends its events
+to ``<spool>/<pid>.jsonl`` when an outermost span closes, and the session
+merges them on exit. Timestamps are wall-clock microseconds, so processes
+share one timeline.
+
+``update.py`` and ``history_update.py`` trace when ``PIPELINE_TRACE`` is set:
+``1`` writes ``signals/traces/<run>-<UTC time>.trace.json``; any other value
+is the output path.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from Signals import state_paths
+
+
+TRACE_ENV = "PIPELINE_TRACE"
+SPOOL_ENV = "PIPELINE_TRACE_SPOOL"
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _Tracer:
+    def __init__(self, process_name: str, spool: Optional[Path] = None) -> None:
+        self.pid = os.getpid()
+        self.spool = spool
+        self.events: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self._wall_us = time.time_ns() / 1000
+        self._perf = time.perf_counter()
+        self.events.append({"ph": "M", "name": "process_name", "pid": self.pid, "args": {"name": process_name}})
+
+    def now_us(self) -> float:
+        return self._wall_us + (time.perf_counter() - self._perf) * 1e6
+
+    def complete(self, name: str, start: float, end: float, attrs: Dict[str, Any]) -> None:
+        tid = threading.get_native_id()
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": round(start, 1),
+            "dur": round(end - start, 1),
+            "pid": self.pid,
+            "tid": tid,
+            "args": attrs,
+        }
+        with self.lock:
+            if not getattr(self.local, "named", False):
+                self.local.named = True
+                thread_name = threading.current_thread().name
+                self.events.append({"ph": "M", "name": "thread_name", "pid": self.pid, "tid": tid, "args": {"name": thread_name}})
+            self.events.append(event)
+
+    def drain(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            events, self.events = self.events, []
+        return events
+
+    def flush_spool(self) -> None:
+        events = self.drain()
+        if events and self.spool is not None:
+            with (self.spool / f"{self.pid}.jsonl").open("a", encoding="utf-8") as handle:
+                handle.write("".join(json.dumps(event, default=str) + "\n" for event in events))
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "attrs", "start")
+
+    def __init__(self, tracer: _Tracer, name: str, attrs: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        local = self.tracer.local
+        local.depth = getattr(local, "depth", 0) + 1
+        self.start = self.tracer.now_us()
+        return self
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        tracer = self.tracer
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        tracer.complete(self.name, self.start, tracer.now_us(), self.attrs)
+        tracer.local.depth -= 1
+        if tracer.local.depth == 0 and tracer.spool is not None:
+            tracer.flush_spool()
+        return False
+
+
+def _worker_tracer() -> Optional[_Tracer]:
+    spool = os.environ.get(SPOOL_ENV)
+    return _Tracer("worker", Path(spool)) if spool and Path(spool).is_dir() else None
+
+
+_TRACER: Optional[_Tracer] = _worker_tracer()
+
+
+def _after_fork() -> None:
+    # A forked worker must not re-emit the parent's buffered events.
+    global _TRACER
+    if _TRACER is not None:
+        _TRACER = _worker_tracer()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def enabled() -> bool:
+    return _TRACER is not None
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """Context manager timing one stage; ``.set(**attrs)`` adds args before it closes."""
+    tracer = _TRACER
+    if tracer is None:
+        return _NOOP
+    return _Span(tracer, name, attrs)
+
+
+def _read_spool(spool: Path) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    for part in sorted(spool.glob("*.jsonl")):
+        for line in part.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                events.append(json.loads(line))
+    return events
+
+
+def write_trace(path: Path | str, events: List[Dict[str, Any]]) -> Path:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"traceEvents": events, "displayTimeUnit": "ms"}
+    target.write_text(json.dumps(payload, default=str) + "\n", encoding="utf-8")
+    return target
+
+
+@contextmanager
+def session(path: Path | str, process_name: str = "main") -> Iterator[None]:
+    """Trace everything inside the block (this process and its workers) to ``path``."""
+    global _TRACER
+    if _TRACER is not None:
+        # Nested: the outer session owns the trace.
+        yield
+        return
+    spool = Path(tempfile.mkdtemp(prefix="pipeline-trace-"))
+    previous = os.environ.get(SPOOL_ENV)
+    os.environ[SPOOL_ENV] = str(spool)
+    tracer = _TRACER = _Tracer(process_name)
+    try:
+        with span(process_name):
+            yield
+    finally:
+        _TRACER = None
+        if previous is None:
+            os.environ.pop(SPOOL_ENV, None)
+        else:
+            os.environ[SPOOL_ENV] = previous
+        events = tracer.drain() + _read_spool(spool)
+        shutil.rmtree(spool, ignore_errors=True)
+        write_trace(path, events)
+
+
+def trace_path(run: str) -> Optional[Path]:
+    value = os.environ.get(TRACE_ENV, "").strip()
+    if not value or value == "0":
+        return None
+    if value == "1":
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return state_paths.TRACE_DIR / f"{run}-{stamp}.trace.json"
+    return Path(value)
+
+
+def session_from_env(run: str) -> ContextManager[None]:
+    """``session()`` when ``PIPELINE_TRACE`` asks for one, otherwise a no-op."""
+    path = trace_path(run)
+    return session(path, run) if path is not None else nullcontext()
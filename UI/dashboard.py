@@ -1,6 +1,8 @@
 """Streamlit dashboard entrypoint."""
-import json
+import functools
+import logging
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -9,10 +11,18 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from History.series_pyramid import pick_level
+from History.yield_curve_history import NAMED_BUTTERFLIES, NAMED_SPREADS, YieldCurveHistory
 from Signals import state_paths
+from UI.data_layer import cache_stats, load_state, state_generation
+from UI.profiling import SLOW_PANEL_MS, env_enabled, log_slow_panel, phase, phase_timed, profile_panel, record_chart
+from UI.state_watcher import REFRESH_SECONDS, affects, get_watcher
+from UI.view_models import chart_spec, memo_stats, rows_to_frame, series_frame, view_model
+from UI.windowing import WINDOW_DAYS, DatedSeries
 
 
 ANCHOR_ORDER: List[Tuple[str, str]] = [
@@ -40,7 +50,6 @@ SNAPSHOT_COLORS = {
 }
 SERIES_COLORS = ["#56B4E9", "#E69F00", "#CC79A7", "#009E73", "#0072B2"]
 WINDOW_OPTIONS = [("1y", "1Y"), ("3y", "3Y"), ("5y", "5Y")]
-WINDOW_DAYS = {"1y": 365, "3y": 1095, "5y": 1825}
 ANCHOR_SHAPES = {
     "Start of Year": "diamond",
     "6M": "triangle-down",
@@ -51,6 +60,8 @@ ANCHOR_SHAPES = {
 
 MISSING_DISPLAY = "—"
 
+logger = logging.getLogger("UI.dashboard")
+
 
 
 st.set_page_config(
@@ -72,19 +83,23 @@ st.markdown(
 
 
 def _load_daily_state(path: Path | str = state_paths.DAILY_STATE_PATH) -> dict:
-    daily_path = Path(path)
-    if not daily_path.exists():
-        return {}
-    data = json.loads(daily_path.read_text(encoding="utf-8") or "{}")
-    return data if isinstance(data, dict) else {}
+    with phase("data_load"):
+        return load_state(path)
 
 
 def _load_history_state(path: Path | str = state_paths.HISTORY_STATE_PATH) -> dict:
-    history_path = Path(path)
-    if not history_path.exists():
-        return {}
-    data = json.loads(history_path.read_text(encoding="utf-8") or "{}")
-    return data if isinstance(data, dict) else {}
+    with phase("data_load"):
+        return load_state(path)
+
+
+def _load_zq_constant_maturity(path: Path | str = state_paths.ZQ_CONSTANT_MATURITY_PATH) -> dict:
+    with phase("data_load"):
+        return load_state(path)
+
+
+def _altair_chart(target: Any, chart: Any) -> None:
+    record_chart(chart)
+    target.altair_chart(chart, width="stretch")
 
 
 def _get_block(data: dict, key: str) -> dict:
@@ -144,77 +159,122 @@ def _style_magnitude(df: pd.DataFrame, columns: List[str]):
         alpha = 0.08 + (0.5 * intensity)
         return f"background-color: rgba(86, 180, 233, {alpha:.2f});"
 
-    return styler.applymap(_colorize, subset=columns)
+    return styler.map(_colorize, subset=columns)
 
 
-def _apply_window(rows: list[dict], window: str) -> list[dict]:
-    days = WINDOW_DAYS.get(window)
-    if not rows or days is None:
-        return rows
-    df = pd.DataFrame(rows)
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df = df.dropna(subset=["Date"])
-    if df.empty:
-        return []
-    last_date = df["Date"].max()
-    cutoff = last_date - pd.Timedelta(days=days)
-    df = df[df["Date"] >= cutoff]
-    df["Date"] = df["Date"].dt.date.astype(str)
-    return df.to_dict("records")
+def _history_generation() -> Optional[str]:
+    return state_generation(state_paths.HISTORY_STATE_PATH)
+
+
+def _resolution() -> str:
+    return st.session_state.get("chart_resolution", "auto")
+
+
+def _memo_chart(panel: Any, window: str, builder) -> Any:
+    """Chart for ``panel`` built once per (history generation, panel, window, resolution)."""
+    with phase("charts"):
+        return chart_spec(_history_generation(), (panel, window, _resolution()), builder)
+
+
+def _resolved_block(history: dict, path: Tuple[str, ...], full: dict, window: str) -> dict:
+    """Pick the pyramid level for ``full`` that suits the window (or the sidebar override)."""
+    levels: Any = history.get("pyramids", {}) if isinstance(history, dict) else {}
+    for part in path:
+        levels = levels.get(part, {}) if isinstance(levels, dict) else {}
+    choice = st.session_state.get("chart_resolution", "auto")
+    if choice == "daily" or not isinstance(levels, dict) or not levels:
+        return full
+    if choice != "auto":
+        block = levels.get(choice)
+        return block if isinstance(block, dict) else full
+    _, block = pick_level(full, levels, WINDOW_DAYS.get(window))
+    return block
+
+
+def _windowed(history: dict, source: Tuple[str, ...], window: str) -> DatedSeries:
+    """Window of the block at ``history[source...]`` (pyramid level applied), as array views."""
+    full: Any = history if isinstance(history, dict) else {}
+    for part in source:
+        full = full.get(part, {}) if isinstance(full, dict) else {}
+    if not isinstance(full, dict):
+        return DatedSeries.empty()
+    block = _resolved_block(history, source, full, window)
+    # Blocks are cached objects, stable within a generation; parse each one's dates once.
+    dated = view_model(_history_generation(), ("dated", source, id(block)), lambda: DatedSeries.from_block(block))
+    return dated.window(WINDOW_DAYS.get(window))
 
 
 def _history_rows(history: dict, key: str, window: str, label: str) -> list[dict]:
-    series = history.get("series", {}).get(key, {}) if isinstance(history, dict) else {}
-    dates = series.get("dates", [])
-    values = series.get("values", [])
-    if not isinstance(dates, list) or not isinstance(values, list):
-        return []
-    rows = [{"Date": dt, "Value": val, "Series": label} for dt, val in zip(dates, values)]
-    return _apply_window(rows, window)
+    return _windowed(history, ("series", key), window).to_rows(label)
+
+
+def _transform_rows(history: dict, series_key: str, transform_key: str, window: str, label: str) -> list[dict]:
+    return _windowed(history, ("transforms", series_key, transform_key), window).to_rows(label)
+
+
+def _cross_asset_rows(history: dict, key: str, window: str, label: str) -> list[dict]:
+    return _windowed(history, ("cross_asset", key), window).to_rows(label)
+
+
+def _curve_spread_series(curve: YieldCurveHistory, name: str, window: str) -> DatedSeries:
+    values = curve.derived(name)
+    keep = ~np.isnan(values)
+    return DatedSeries(curve.dates[keep], values[keep]).window(WINDOW_DAYS.get(window))
+
+
+def _curve_spread_rows(curve: YieldCurveHistory, name: str, window: str) -> list[dict]:
+    return _curve_spread_series(curve, name, window).to_rows(name)
+
+
+def _series_frame(history: dict, source: Tuple[str, ...], window: str, label: str) -> pd.DataFrame:
+    with phase("frames"):
+        return series_frame(
+            _history_generation(),
+            (source, window, label, _resolution()),
+            lambda: _windowed(history, source, window).to_frame(label),
+        )
+
+
+def _history_frame(history: dict, window: str, series_map: dict[str, str]) -> pd.DataFrame:
+    frames = [_series_frame(history, ("series", key), window, label) for key, label in series_map.items()]
+    frames = [frame for frame in frames if not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else rows_to_frame([])
 
 
 def _history_chart(
     history: dict, window: str, series_map: dict[str, str], title: str
 ) -> Optional[alt.Chart]:
-    rows: list[dict] = []
-    for key, label in series_map.items():
-        rows.extend(_history_rows(history, key, window, label))
-    if not rows:
-        return None
-    df = pd.DataFrame(rows)
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df = df.dropna(subset=["Date"])
-    if df.empty:
-        return None
-    series_domain = list(series_map.values())
-    color = alt.Color(
-        "Series:N",
-        scale=alt.Scale(domain=series_domain, range=SERIES_COLORS[: len(series_domain)]),
-    )
-    base = (
-        alt.Chart(df)
-        .mark_line(interpolate="linear")
-        .encode(
-            x=alt.X("Date:T", title="Date"),
-            y=alt.Y("Value:Q", title="Level"),
-            color=color,
-            tooltip=["Date", "Series", "Value"],
+    def _build() -> Optional[alt.Chart]:
+        df = _history_frame(history, window, series_map)
+        if df.empty:
+            return None
+        series_domain = list(series_map.values())
+        color = alt.Color(
+            "Series:N",
+            scale=alt.Scale(domain=series_domain, range=SERIES_COLORS[: len(series_domain)]),
+        )
+        return (
+            alt.Chart(df)
+            .mark_line(interpolate="linear")
+            .encode(
+                x=alt.X("Date:T", title="Date"),
+                y=alt.Y("Value:Q", title="Level"),
+                color=color,
+                tooltip=["Date", "Series", "Value"],
+            )
+            .properties(title=title)
         )
-        .properties(title=title)
-    )
-    return base
+
+    return _memo_chart(("history", tuple(series_map.items()), title), window, _build)
 
 
 def _history_chart_independent(
     history: dict, window: str, series_map: dict[str, str], title: str
 ) -> Optional[alt.Chart]:
-    charts: list[alt.Chart] = []
-    for key, label in series_map.items():
-        rows = _history_rows(history, key, window, label)
-        if rows:
-            df = pd.DataFrame(rows)
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-            df = df.dropna(subset=["Date"])
+    def _build() -> Optional[alt.Chart]:
+        charts: list[alt.Chart] = []
+        for key, label in series_map.items():
+            df = _history_frame(history, window, {key: label})
             if not df.empty:
                 charts.append(
                     alt.Chart(df)
@@ -226,33 +286,11 @@ def _history_chart_independent(
                         tooltip=["Date", "Series", "Value"],
                     )
                 )
-    if not charts:
-        return None
-    layered = alt.layer(*charts).resolve_scale(y="independent").properties(title=title)
-    return layered
-
-
-def _transform_rows(history: dict, series_key: str, transform_key: str, window: str, label: str) -> list[dict]:
-    transforms = history.get("transforms", {}) if isinstance(history, dict) else {}
-    series_block = transforms.get(series_key, {}) if isinstance(transforms, dict) else {}
-    block = series_block.get(transform_key, {})
-    dates = block.get("dates", []) if isinstance(block, dict) else []
-    values = block.get("values", []) if isinstance(block, dict) else []
-    if not isinstance(dates, list) or not isinstance(values, list):
-        return []
-    rows = [{"Date": dt, "Value": val, "Series": label} for dt, val in zip(dates, values)]
-    return _apply_window(rows, window)
-
+        if not charts:
+            return None
+        return alt.layer(*charts).resolve_scale(y="independent").properties(title=title)
 
-def _cross_asset_rows(history: dict, key: str, window: str, label: str) -> list[dict]:
-    cross_asset = history.get("cross_asset", {}) if isinstance(history, dict) else {}
-    block = cross_asset.get(key, {}) if isinstance(cross_asset, dict) else {}
-    dates = block.get("dates", []) if isinstance(block, dict) else []
-    values = block.get("values", []) if isinstance(block, dict) else []
-    if not isinstance(dates, list) or not isinstance(values, list):
-        return []
-    rows = [{"Date": dt, "Value": val, "Series": label} for dt, val in zip(dates, values)]
-    return _apply_window(rows, window)
+    return _memo_chart(("history_independent", tuple(series_map.items()), title), window, _build)
 
 
 def _select_window(label: str, key: str) -> str:
@@ -291,6 +329,7 @@ def _anchor_rows(series_label: str, anchors: Dict[str, Optional[float]]) -> List
     return rows
 
 
+@phase_timed("charts")
 def _anchor_chart(
     rows: List[Dict[str, Any]],
     y_title: str,
@@ -331,6 +370,7 @@ def _matrix_rows(matrix: Dict[str, Any]) -> List[Dict[str, Any]]:
     return rows
 
 
+@phase_timed("charts")
 def _snapshot_curve_chart(
     tenors: List[str],
     lines: Dict[str, List[Optional[float]]],
@@ -377,7 +417,7 @@ def render_yield_curve_panel(daily_state: Dict[str, Any]) -> None:
     chart = _snapshot_curve_chart(tenors, lines)
 
     cols = st.columns([2, 1])
-    cols[0].altair_chart(chart, width="stretch")
+    _altair_chart(cols[0], chart)
     cols[0].caption("Anchor points only. Axis is data-range (not zero-based).")
     rows = yield_curve.get("table_rows", []) if isinstance(yield_curve.get("table_rows"), list) else []
     table_df = pd.DataFrame(
@@ -414,6 +454,80 @@ def render_yield_curve_panel(daily_state: Dict[str, Any]) -> None:
     )
     cols[1].dataframe(styler, width="stretch")
 
+    fit_block = _get_block(daily_state, "yield_curve_fit")
+    fit_models = fit_block.get("models", {}) if isinstance(fit_block.get("models"), dict) else {}
+    if fit_models:
+        anchor_labels = {key: label for label, key in ANCHOR_ORDER}
+        fit_cols = st.columns(2)
+        model = fit_cols[0].selectbox("Fitted Model", list(fit_models), key="curve_fit_model")
+        anchor = fit_cols[1].selectbox(
+            "Fitted Anchor",
+            [key for _, key in reversed(ANCHOR_ORDER)],
+            format_func=lambda key: anchor_labels.get(key, key),
+            key="curve_fit_anchor",
+        )
+        fitted = fit_models.get(model, {}).get(anchor, {})
+        maturities = fit_block.get("maturities_years", [])
+        fit_rows = [
+            {"Maturity (Y)": maturity, "Curve": curve_name.title(), "Yield": value}
+            for curve_name in ("zero", "par", "forward")
+            for maturity, value in zip(maturities, (fitted or {}).get(curve_name) or [])
+            if value is not None
+        ]
+        if fit_rows:
+            fit_chart = (
+                alt.Chart(pd.DataFrame(fit_rows))
+                .mark_line(interpolate="monotone")
+                .encode(
+                    x=alt.X("Maturity (Y):Q"),
+                    y=alt.Y("Yield:Q", title="Yield (%)", scale=alt.Scale(zero=False)),
+                    color=alt.Color("Curve:N"),
+                    tooltip=["Maturity (Y)", "Curve", "Yield"],
+                )
+                .properties(title=f"Fitted Curve ({model.replace('_', ' ').title()})")
+            )
+            _altair_chart(st, fit_chart)
+            st.caption(f"Fit RMSE: {_format_bps(fitted.get('rmse_bps'), 2)}.")
+        else:
+            st.info("Not enough tenors to fit this model for the selected anchor.")
+
+    history = _load_history_state()
+    curve = view_model(_history_generation(), "yield_curve", lambda: YieldCurveHistory.from_history_state(history))
+    if len(curve):
+        spread_cols = st.columns(2)
+        choice = spread_cols[0].selectbox(
+            "Curve Spread", list(NAMED_SPREADS) + list(NAMED_BUTTERFLIES), key="curve_spread_choice"
+        )
+        with spread_cols[1]:
+            window = _select_window("Curve Spread Window", key="curve_spread_window")
+        def _spread_chart() -> Optional[alt.Chart]:
+            spread_df = series_frame(
+                _history_generation(),
+                (("curve", choice), window, choice),
+                lambda: _curve_spread_series(curve, choice, window).to_frame(choice),
+            )
+            if spread_df.empty:
+                return None
+            zero_line = alt.Chart(pd.DataFrame({"Value": [0]})).mark_rule(color="#9aa0a6").encode(y="Value:Q")
+            spread_chart = (
+                alt.Chart(spread_df)
+                .mark_line(interpolate="linear")
+                .encode(
+                    x=alt.X("Date:T", title="Date"),
+                    y=alt.Y("Value:Q", title="bps"),
+                    color=alt.Color("Series:N"),
+                    tooltip=["Date", "Series", "Value"],
+                )
+                .properties(title=f"Curve {choice} History (bps)")
+            )
+            return spread_chart + zero_line
+
+        spread_chart = _memo_chart(("curve_spread", choice), window, _spread_chart)
+        if spread_chart is not None:
+            _altair_chart(st, spread_chart)
+        else:
+            st.info(f"{choice} history not available.")
+
 
 def render_real_rates_panel(daily_state: Dict[str, Any]) -> None:
     st.subheader("Real Yields & Breakevens")
@@ -430,7 +544,7 @@ def render_real_rates_panel(daily_state: Dict[str, Any]) -> None:
     chart = _anchor_chart(chart_rows, "Yield (%)", domain=domain, series_domain=["Real 10Y", "10Y Breakeven"])
 
     cols = st.columns(2)
-    cols[0].altair_chart(chart, width="stretch")
+    _altair_chart(cols[0], chart)
     cols[0].caption("Anchor points only. Axis is data-range (not zero-based).")
 
     real_rows = infl.get("real_yields", []) if isinstance(infl.get("real_yields"), list) else []
@@ -504,7 +618,7 @@ def render_real_rates_panel(daily_state: Dict[str, Any]) -> None:
             "Real Yields & Breakevens History",
         )
         if chart is not None:
-            st.altair_chart(chart, width="stretch")
+            _altair_chart(st, chart)
         else:
             st.info("Real rates history not available.")
 
@@ -552,7 +666,7 @@ def render_policy_futures_panel(daily_state: Dict[str, Any]) -> None:
     )
 
     cols = st.columns(2)
-    cols[0].altair_chart(curve_chart, width="stretch")
+    _altair_chart(cols[0], curve_chart)
     cols[0].caption("Anchor points only. Axis is data-range (not zero-based).")
 
     contracts = futures.get("contracts", []) if isinstance(futures.get("contracts"), list) else []
@@ -579,6 +693,76 @@ def render_policy_futures_panel(daily_state: Dict[str, Any]) -> None:
     )
     cols[1].dataframe(table_df, width="stretch")
 
+    implied = futures.get("implied_path", {}) if isinstance(futures.get("implied_path"), dict) else {}
+    meetings = implied.get("meetings", []) if isinstance(implied.get("meetings"), list) else []
+    current_path = implied.get("anchors", {}).get("current", {}) if isinstance(implied.get("anchors"), dict) else {}
+    if meetings and current_path:
+        st.subheader("Implied Meeting Path (Current)")
+        path_df = pd.DataFrame(
+            {
+                "Meeting": meetings,
+                "Implied Rate": current_path.get("post_meeting", []),
+                "Δ (bps)": current_path.get("change_bps", []),
+                "Cumulative (bps)": current_path.get("cumulative_bps", []),
+                "Hike Prob": current_path.get("hike_probability", []),
+                "Cut Prob": current_path.get("cut_probability", []),
+            }
+        )
+        styler = _style_magnitude(path_df, ["Δ (bps)", "Cumulative (bps)"]).format(
+            {
+                "Implied Rate": _percent_formatter(3),
+                "Δ (bps)": _bps_formatter(1),
+                "Cumulative (bps)": _bps_formatter(1),
+                "Hike Prob": "{:.0%}",
+                "Cut Prob": "{:.0%}",
+            },
+            na_rep=MISSING_DISPLAY,
+        )
+        st.dataframe(styler, width="stretch")
+        st.caption("Implied rate = 100 - price, chained meeting by meeting from EFFR (config/fomc_calendar.json).")
+        if implied.get("implied_change_partial"):
+            st.warning(
+                f"The 12-month implied change covers only {implied.get('implied_change_horizon_months')} months: "
+                f"the FOMC calendar ends {implied.get('fomc_calendar_ends') or 'early'} or the contract strip is short."
+            )
+
+    strip = _load_zq_constant_maturity()
+
+    def _cm_chart() -> Optional[alt.Chart]:
+        series = strip.get("series", {}) if isinstance(strip, dict) and isinstance(strip.get("series"), dict) else {}
+        cm_rows = [
+            {"date": day, "Horizon": f"{label} ahead", "Implied Rate": value}
+            for label, block in series.items()
+            if isinstance(block, dict)
+            for day, value in zip(block.get("dates", []), block.get("values", []))
+        ]
+        if not cm_rows:
+            return None
+        cm_df = pd.DataFrame(cm_rows)
+        cm_df["date"] = pd.to_datetime(cm_df["date"])
+        return (
+            alt.Chart(cm_df)
+            .mark_line()
+            .encode(
+                x=alt.X("date:T", title="Date"),
+                y=alt.Y("Implied Rate:Q", title="Implied Rate (%)", scale=alt.Scale(zero=False)),
+                color=alt.Color("Horizon:N"),
+                tooltip=["date:T", "Horizon", alt.Tooltip("Implied Rate:Q", format=".3f")],
+            )
+        )
+
+    with phase("charts"):
+        cm_chart = chart_spec(
+            state_generation(state_paths.ZQ_CONSTANT_MATURITY_PATH),
+            ("zq_constant_maturity", "all", _resolution()),
+            _cm_chart,
+            source="zq_constant_maturity",
+        )
+    if cm_chart is not None:
+        st.subheader("Constant-Maturity Implied Rate")
+        _altair_chart(st, cm_chart)
+        st.caption("Interpolated across ZQ contract mid-months from signals/zq_strip.npz; survives contract rolls.")
+
 
 def render_volatility_panel(daily_state: Dict[str, Any]) -> None:
     st.header("Volatility")
@@ -653,17 +837,20 @@ def render_volatility_panel(daily_state: Dict[str, Any]) -> None:
             "Volatility Levels (Raw)",
         )
         if raw_chart is not None:
-            st.altair_chart(raw_chart, width="stretch")
+            _altair_chart(st, raw_chart)
         else:
             st.info("Volatility history not available.")
 
-        z_rows = []
-        z_rows += _transform_rows(history, "vix", "zscore_3y", window, "VIX Z (3Y)")
-        z_rows += _transform_rows(history, "move", "zscore_3y", window, "MOVE Z (3Y)")
-        z_df = pd.DataFrame(z_rows)
-        if not z_df.empty:
-            z_df["Date"] = pd.to_datetime(z_df["Date"], errors="coerce")
-            z_df = z_df.dropna(subset=["Date"])
+        def _z_chart() -> Optional[alt.Chart]:
+            z_df = pd.concat(
+                [
+                    _series_frame(history, ("transforms", "vix", "zscore_3y"), window, "VIX Z (3Y)"),
+                    _series_frame(history, ("transforms", "move", "zscore_3y"), window, "MOVE Z (3Y)"),
+                ],
+                ignore_index=True,
+            )
+            if z_df.empty:
+                return None
             zero_line = alt.Chart(pd.DataFrame({"Value": [0]})).mark_rule(color="#9aa0a6").encode(y="Value:Q")
             z_chart = (
                 alt.Chart(z_df)
@@ -676,15 +863,23 @@ def render_volatility_panel(daily_state: Dict[str, Any]) -> None:
                 )
                 .properties(title="Volatility Standardized (Z-score)")
             )
-            st.altair_chart(z_chart + zero_line, width="stretch")
-
-        ratio_rows = _transform_rows(history, "move", "pct_of_avg_3y", window, "MOVE % of Avg (3Y)")
-        ratio_rows += _transform_rows(history, "vix", "pct_of_avg_3y", window, "VIX % of Avg (3Y)")
-        ratio_df = pd.DataFrame(ratio_rows)
-        if not ratio_df.empty:
-            ratio_df["Date"] = pd.to_datetime(ratio_df["Date"], errors="coerce")
-            ratio_df = ratio_df.dropna(subset=["Date"])
-            ratio_chart = (
+            return z_chart + zero_line
+
+        z_chart = _memo_chart("vol_zscore", window, _z_chart)
+        if z_chart is not None:
+            _altair_chart(st, z_chart)
+
+        def _ratio_chart() -> Optional[alt.Chart]:
+            ratio_df = pd.concat(
+                [
+                    _series_frame(history, ("transforms", "move", "pct_of_avg_3y"), window, "MOVE % of Avg (3Y)"),
+                    _series_frame(history, ("transforms", "vix", "pct_of_avg_3y"), window, "VIX % of Avg (3Y)"),
+                ],
+                ignore_index=True,
+            )
+            if ratio_df.empty:
+                return None
+            return (
                 alt.Chart(ratio_df)
                 .mark_line(interpolate="linear")
                 .encode(
@@ -695,13 +890,15 @@ def render_volatility_panel(daily_state: Dict[str, Any]) -> None:
                 )
                 .properties(title="Volatility Percent of Avg (3Y)")
             )
-            st.altair_chart(ratio_chart, width="stretch")
 
-        spread_rows = _cross_asset_rows(history, "move_vix_z_spread", window, "MOVE Z - VIX Z")
-        spread_df = pd.DataFrame(spread_rows)
-        if not spread_df.empty:
-            spread_df["Date"] = pd.to_datetime(spread_df["Date"], errors="coerce")
-            spread_df = spread_df.dropna(subset=["Date"])
+        ratio_chart = _memo_chart("vol_pct_of_avg", window, _ratio_chart)
+        if ratio_chart is not None:
+            _altair_chart(st, ratio_chart)
+
+        def _spread_chart() -> Optional[alt.Chart]:
+            spread_df = _series_frame(history, ("cross_asset", "move_vix_z_spread"), window, "MOVE Z - VIX Z")
+            if spread_df.empty:
+                return None
             zero_line = alt.Chart(pd.DataFrame({"Value": [0]})).mark_rule(color="#9aa0a6").encode(y="Value:Q")
             spread_chart = (
                 alt.Chart(spread_df)
@@ -714,7 +911,11 @@ def render_volatility_panel(daily_state: Dict[str, Any]) -> None:
                 )
                 .properties(title="Volatility Z-Score Spread (MOVE - VIX)")
             )
-            st.altair_chart(spread_chart + zero_line, width="stretch")
+            return spread_chart + zero_line
+
+        spread_chart = _memo_chart("vol_z_spread", window, _spread_chart)
+        if spread_chart is not None:
+            _altair_chart(st, spread_chart)
 
 
 def render_liquidity_panel(daily_state: Dict[str, Any]) -> None:
@@ -764,7 +965,7 @@ def render_liquidity_panel(daily_state: Dict[str, Any]) -> None:
             "Liquidity History",
         )
         if chart is not None:
-            st.altair_chart(chart, width="stretch")
+            _altair_chart(st, chart)
         else:
             st.info("Liquidity history not available.")
 
@@ -785,7 +986,7 @@ def render_labor_panel(daily_state: Dict[str, Any]) -> None:
         ):
             chart = _history_chart(history, window, {key: label}, f"{label} History")
             if chart is not None:
-                cols[idx].altair_chart(chart, width="stretch")
+                _altair_chart(cols[idx], chart)
             else:
                 cols[idx].info(f"{label} history not available.")
     else:
@@ -881,10 +1082,10 @@ def render_fx_panel(daily_state: Dict[str, Any]) -> None:
                 )
                 .properties(title="FX Matrix (1M % Change)")
             )
-            st.altair_chart(heatmap, width="stretch")
+            _altair_chart(st, heatmap)
         else:
             pivot = df.pivot(index="Base", columns="Quote", values="Value")
-            table = pivot.applymap(lambda v: _format_percent(v, decimals=2) if pd.notna(v) else MISSING_DISPLAY)
+            table = pivot.map(lambda v: _format_percent(v, decimals=2) if pd.notna(v) else MISSING_DISPLAY)
             st.subheader("FX Matrix (1M % Change)")
             st.dataframe(table, width="stretch")
 
@@ -945,7 +1146,7 @@ def render_fx_panel(daily_state: Dict[str, Any]) -> None:
         cols = st.columns(2)
         dxy_chart = _history_chart(history, window, {"dxy": "DXY"}, "DXY History")
         if dxy_chart is not None:
-            cols[0].altair_chart(dxy_chart, width="stretch")
+            _altair_chart(cols[0], dxy_chart)
         else:
             cols[0].info("DXY history not available.")
 
@@ -956,14 +1157,14 @@ def render_fx_panel(daily_state: Dict[str, Any]) -> None:
             "Major Pairs Overlay",
         )
         if pairs_chart is not None:
-            cols[1].altair_chart(pairs_chart, width="stretch")
+            _altair_chart(cols[1], pairs_chart)
             cols[1].caption("Independent y-scales. Compare direction, not level.")
         else:
             cols[1].info("FX pair history not available.")
 
         usdjpy_chart = _history_chart(history, window, {"usdjpy": "USDJPY"}, "USDJPY Focus")
         if usdjpy_chart is not None:
-            st.altair_chart(usdjpy_chart, width="stretch")
+            _altair_chart(st, usdjpy_chart)
         else:
             st.info("USDJPY history not available.")
     else:
@@ -1013,7 +1214,7 @@ def render_credit_panel(daily_state: Dict[str, Any]) -> None:
             "Credit Spreads History",
         )
         if chart is not None:
-            st.altair_chart(chart, width="stretch")
+            _altair_chart(st, chart)
         else:
             st.info("Credit history not available.")
 
@@ -1097,6 +1298,99 @@ def render_system_health(daily_state: Dict[str, Any]) -> None:
         st.caption("Failed series list:")
         st.caption(", ".join(str(item) for item in failed_list))
 
+    stats = cache_stats()
+    st.subheader("UI State Cache")
+    st.write(
+        f"Hits: {stats['hits']} | Loads: {stats['misses']} | Unchanged rewrites: {stats['revalidations']} | "
+        f"Total load time: {stats['load_seconds'] * 1000:.1f} ms"
+    )
+    file_rows = [
+        {
+            "File": path,
+            "Generation": info.get("generation"),
+            "Size (KB)": round(info.get("bytes", 0) / 1024, 1),
+            "Load (ms)": round(info.get("load_seconds", 0.0) * 1000, 2),
+        }
+        for path, info in stats["files"].items()
+    ]
+    if file_rows:
+        st.dataframe(pd.DataFrame(file_rows), width="stretch")
+    memo_rows = [{"Memo": name.title(), **info} for name, info in memo_stats().items()]
+    st.dataframe(pd.DataFrame(memo_rows), width="stretch")
+    render_panel_profiles()
+    timings = st.session_state.get("panel_timings_ms", {})
+    if timings:
+        st.caption("Last compute time per panel this session (ms):")
+        st.dataframe(
+            pd.DataFrame([{"Panel": name, "Compute (ms)": ms} for name, ms in timings.items()]),
+            width="stretch",
+        )
+
+
+def render_panel_profiles() -> None:
+    profiles = st.session_state.get("panel_profiles", {})
+    if not profiles:
+        if _profiling_enabled():
+            st.caption("Panel profiling is on; open other sections to collect timings.")
+        return
+    st.subheader("Panel Render Profile")
+    rows = [
+        {
+            "Panel": name,
+            "Total (ms)": info["total_ms"],
+            "Data Load (ms)": info["phases_ms"].get("data_load"),
+            "Frames (ms)": info["phases_ms"].get("frames"),
+            "Chart Specs (ms)": info["phases_ms"].get("charts"),
+            "Other (ms)": info["other_ms"],
+            "Charts": info["charts"],
+            "Payload (KB)": round(info["payload_bytes"] / 1024, 1),
+        }
+        for name, info in sorted(profiles.items(), key=lambda item: -item[1]["total_ms"])
+    ]
+    st.dataframe(pd.DataFrame(rows), width="stretch")
+    payload_rows = [
+        {"Panel": name, "Chart": chart, "KB": round(size / 1024, 1)}
+        for name, info in profiles.items()
+        for chart, size in info["chart_payloads"].items()
+    ]
+    if payload_rows:
+        payload_chart = (
+            alt.Chart(pd.DataFrame(payload_rows))
+            .mark_bar()
+            .encode(
+                x=alt.X("sum(KB):Q", title="Vega-Lite payload (KB)"),
+                y=alt.Y("Panel:N", sort="-x", title=None),
+                color=alt.Color("Chart:N", legend=None),
+                tooltip=["Panel", "Chart", "KB"],
+            )
+            .properties(title="Payload by Panel and Chart")
+        )
+        st.altair_chart(payload_chart, width="stretch")
+    st.caption(
+        f"Panels slower than {SLOW_PANEL_MS:.0f} ms are appended to {state_paths.UI_PROFILE_LOG_PATH} "
+        "(tagged with DASHBOARD_RELEASE)."
+    )
+
+
+def render_sidebar_resolution() -> None:
+    labels = {"auto": "Auto (fit window)", "daily": "Daily", "lttb": "LTTB", "weekly": "Weekly", "monthly": "Monthly"}
+    st.sidebar.selectbox(
+        "Chart resolution",
+        list(labels),
+        format_func=lambda opt: labels[opt],
+        key="chart_resolution",
+        help="Auto uses daily points when they fit the chart budget, otherwise a precomputed downsampled level.",
+    )
+
+
+def render_sidebar_diagnostics() -> None:
+    st.sidebar.toggle(
+        "Profile panels",
+        value=env_enabled(),
+        key="profile_panels",
+        help="Time data load, frames and chart specs per panel and measure Vega payloads (System Health).",
+    )
+
 
 def render_sidebar_reasoning() -> None:
     st.sidebar.divider()
@@ -1127,6 +1421,82 @@ def render_sidebar_reasoning() -> None:
         )
 
 
+def render_raw_json(daily_state: Dict[str, Any]) -> None:
+    with st.expander("Raw JSON"):
+        st.json(daily_state)
+
+
+def _profiling_enabled() -> bool:
+    return bool(st.session_state.get("profile_panels", env_enabled()))
+
+
+def _panel(render):
+    """Run ``render`` as a fragment (its widgets rerun only this panel) and log its time."""
+
+    @functools.wraps(render)
+    def run(daily_state: Dict[str, Any]) -> None:
+        name = render.__name__
+        started = time.perf_counter()
+        with profile_panel(name, _profiling_enabled()) as profile:
+            render(daily_state)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        st.session_state.setdefault("panel_timings_ms", {})[name] = round(elapsed_ms, 2)
+        logger.info("panel %s rendered in %.1f ms", name, elapsed_ms)
+        if profile is not None:
+            st.session_state.setdefault("panel_profiles", {})[name] = profile.as_dict()
+            if log_slow_panel(profile):
+                logger.warning("slow panel %s: %.1f ms", name, profile.total_ms)
+
+    return st.fragment(run)
+
+
+TABS: List[Tuple[str, Tuple[Any, ...]]] = [
+    ("📈 Rates & Inflation", (_panel(render_yield_curve_panel), _panel(render_real_rates_panel))),
+    (
+        "🏦 Policy & Liquidity",
+        (_panel(render_policy_futures_panel), _panel(render_liquidity_panel), _panel(render_cross_signals)),
+    ),
+    ("👷 Labor Market", (_panel(render_labor_panel),)),
+    ("💱 FX Conditions", (_panel(render_fx_panel),)),
+    ("⚡ Volatility & Risk", (_panel(render_volatility_panel), _panel(render_credit_panel))),
+    ("🛠 System Health", (_panel(render_system_health), render_raw_json)),
+]
+
+
+# Daily blocks each panel reads, and whether it reads history_state ("*": every block).
+PANEL_DEPENDENCIES: Dict[str, Tuple[set, bool]] = {
+    "render_yield_curve_panel": ({"yield_curve", "yield_curve_fit"}, True),
+    "render_real_rates_panel": ({"inflation_real_rates"}, True),
+    "render_policy_futures_panel": ({"policy_futures_curve"}, True),
+    "render_liquidity_panel": ({"liquidity_analytics"}, True),
+    "render_cross_signals": ({"policy", "policy_curve", "liquidity_curve", "disagreements", "vol_credit_cross"}, False),
+    "render_labor_panel": ({"labor_market"}, True),
+    "render_fx_panel": ({"fx", "fx_volatility"}, True),
+    "render_volatility_panel": ({"volatility", "volatility_regime"}, True),
+    "render_credit_panel": ({"credit_transmission"}, True),
+    "render_system_health": ({"system_health"}, True),
+    "render_raw_json": ({"*"}, False),
+}
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_live_refresh() -> None:
+    """Rerun the app when the watcher has pre-loaded a generation that touches the visible panels."""
+    watcher = get_watcher()
+    current = watcher.generation
+    seen = st.session_state.setdefault("seen_generation", current)
+    if current is not None and current != seen:
+        st.session_state["seen_generation"] = current
+        change = watcher.changes_since(seen)
+        visible = [render.__name__ for render in dict(TABS).get(st.session_state.get("active_tab"), ())]
+        if any(affects(change, *PANEL_DEPENDENCIES.get(name, ({"*"}, True))) for name in visible):
+            st.rerun()
+    if current is None:
+        st.caption("Live refresh: waiting for the first published state generation.")
+    else:
+        st.caption(f"Live refresh: generation {current} (published {watcher.published_at or MISSING_DISPLAY}).")
+
+
 def main() -> None:
     daily_state = _load_daily_state()
     if not daily_state:
@@ -1136,42 +1506,17 @@ def main() -> None:
     st.title("Macro Strategy Dashboard")
     st.markdown("Decision Support System | _Snapshot Mode_")
 
+    render_sidebar_resolution()
+    render_sidebar_diagnostics()
+    with st.sidebar:
+        render_live_refresh()
     render_sidebar_reasoning()
 
-    tab_rates, tab_policy, tab_labor, tab_fx, tab_risk, tab_health = st.tabs(
-        [
-            "📈 Rates & Inflation",
-            "🏦 Policy & Liquidity",
-            "👷 Labor Market",
-            "💱 FX Conditions",
-            "⚡ Volatility & Risk",
-            "🛠 System Health",
-        ]
-    )
-
-    with tab_rates:
-        render_yield_curve_panel(daily_state)
-        render_real_rates_panel(daily_state)
-
-    with tab_policy:
-        render_policy_futures_panel(daily_state)
-        render_liquidity_panel(daily_state)
-        render_cross_signals(daily_state)
-
-    with tab_labor:
-        render_labor_panel(daily_state)
-
-    with tab_fx:
-        render_fx_panel(daily_state)
-
-    with tab_risk:
-        render_volatility_panel(daily_state)
-        render_credit_panel(daily_state)
-
-    with tab_health:
-        render_system_health(daily_state)
-        with st.expander("Raw JSON"):
-            st.json(daily_state)
+    # Only the selected tab's panels run; st.tabs would build all six on every rerun.
+    labels = [label for label, _ in TABS]
+    active = st.radio("Section", labels, horizontal=True, key="active_tab", label_visibility="collapsed")
+    for render in dict(TABS).get(active, ()):
+        render(daily_state)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+"""Process-wide cache for the JSON state files the dashboard reads.
+
+Streamlit reruns the whole script on every widget interaction and for every
+session, but imported modules persist, so one ``StateCache`` here is shared
+by all of them. A read costs one ``stat``: unchanged ``(mtime_ns, size)`` is
+a hit. When the updater rewrites a file, the bytes are hashed and only
+re-parsed if the content actually changed. Parsed state is handed out as
+read-only ``FrozenDict``/``FrozenList`` views (plain ``dict``/``list``
+subclasses, so existing ``isinstance`` checks and pandas keep working), so
+one session cannot corrupt the copy every other session sees.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+def _readonly(*_args: Any, **_kwargs: Any) -> None:
+    raise TypeError("cached state is read-only; use thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = reverse = sort = clear = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def _freeze_list(items: list) -> FrozenList:
+    return FrozenList(_freeze_list(item) if isinstance(item, list) else item for item in items)
+
+
+def _frozen_object(pairs: Dict[str, Any]) -> FrozenDict:
+    # json calls this innermost-first, so nested objects are already frozen.
+    return FrozenDict(
+        (key, _freeze_list(value) if isinstance(value, list) else value) for key, value in pairs.items()
+    )
+
+
+def parse_frozen(text: str) -> Any:
+    data = json.loads(text or "{}", object_hook=_frozen_object)
+    return _freeze_list(data) if isinstance(data, list) else data
+
+
+def thaw(value: Any) -> Any:
+    """Deep mutable copy of a frozen view."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+EMPTY = FrozenDict()
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    data: Any
+    load_seconds: float
+    loaded_at: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    load_seconds: float = 0.0
+    files: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "load_seconds": round(self.load_seconds, 6),
+            "files": {path: dict(info) for path, info in self.files.items()},
+        }
+
+
+class StateCache:
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def load(self, path: Path | str) -> Any:
+        """Frozen contents of ``path``; ``EMPTY`` when it is missing or not a JSON object."""
+        key = str(Path(path).absolute())
+        try:
+            stat = Path(key).stat()
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+                self.stats.files.pop(key, None)
+            return EMPTY
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                self.stats.hits += 1
+                return entry.data
+            started = time.perf_counter()
+            raw = Path(key).read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is not None and entry.digest == digest:
+                # Touched but identical (e.g. an updater run with no new data).
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                self.stats.revalidations += 1
+                return entry.data
+            try:
+                data = parse_frozen(raw.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # A half-written file: keep serving the last good copy if there is one.
+                return entry.data if entry is not None else EMPTY
+            data = data if isinstance(data, dict) else EMPTY
+            elapsed = time.perf_counter() - started
+            self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, digest, data, elapsed, time.time())
+            self.stats.misses += 1
+            self.stats.load_seconds += elapsed
+            self.stats.files[key] = {
+                "generation": digest[:12],
+                "bytes": stat.st_size,
+                "load_seconds": round(elapsed, 6),
+            }
+            return data
+
+    def generation(self, path: Path | str) -> Optional[str]:
+        """Content hash prefix of the cached copy; changes whenever the data does."""
+        entry = self._entries.get(str(Path(path).absolute()))
+        return None if entry is None else entry.digest[:12]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+
+_CACHE = StateCache()
+
+
+def load_state(path: Path | str) -> Any:
+    return _CACHE.load(path)
+
+
+def state_generation(path: Path | str) -> Optional[str]:
+    return _CACHE.generation(path)
+
+
+def cache_stats() -> Dict[str, Any]:
+    return _CACHE.stats.as_dict()
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
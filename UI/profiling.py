@@ -0,0 +1,151 @@
+"""Opt-in per-panel render profiling for the dashboard.
+
+Profiling is off unless ``DASHBOARD_PROFILE=1`` is set or the sidebar toggle
+is on. Off, ``phase`` and ``record_chart`` return after one context-variable
+lookup. On, each ``render_*_panel`` call collects:
+
+- exclusive time per phase: ``data_load``, ``frames``, ``charts`` (spec
+  construction), with ``other`` (tables, widgets, layout) as the remainder;
+- the number of charts and their serialised Vega-Lite payload size.
+
+Panels slower than ``SLOW_PANEL_MS`` are appended to
+``signals/ui_panel_profile.jsonl``, tagged with ``DASHBOARD_RELEASE``, so
+regressions can be compared across releases.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import functools
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from Signals import state_paths
+
+
+PROFILE_ENV = "DASHBOARD_PROFILE"
+RELEASE_ENV = "DASHBOARD_RELEASE"
+SLOW_PANEL_MS = 250.0
+PHASES = ("data_load", "frames", "charts")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class PanelProfile:
+    panel: str
+    total_ms: float = 0.0
+    phases_ms: Dict[str, float] = field(default_factory=lambda: {name: 0.0 for name in PHASES})
+    charts: int = 0
+    payload_bytes: int = 0
+    chart_payloads: Dict[str, int] = field(default_factory=dict)
+    # Open phases as [name, started, time spent in nested phases].
+    _stack: List[List[Any]] = field(default_factory=list, repr=False)
+
+    @property
+    def other_ms(self) -> float:
+        return max(self.total_ms - sum(self.phases_ms.values()), 0.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("_stack", None)
+        data["other_ms"] = round(self.other_ms, 3)
+        data["total_ms"] = round(self.total_ms, 3)
+        data["phases_ms"] = {name: round(ms, 3) for name, ms in self.phases_ms.items()}
+        return data
+
+
+_ACTIVE: ContextVar[Optional[PanelProfile]] = ContextVar("dashboard_panel_profile", default=None)
+
+
+def env_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@contextmanager
+def profile_panel(panel: str, enabled: bool) -> Iterator[Optional[PanelProfile]]:
+    if not enabled:
+        yield None
+        return
+    profile = PanelProfile(panel)
+    token = _ACTIVE.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_ms = (time.perf_counter() - started) * 1000
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute the enclosed time to ``name``, excluding nested phases."""
+    profile = _ACTIVE.get()
+    if profile is None:
+        yield
+        return
+    frame = [name, time.perf_counter(), 0.0]
+    profile._stack.append(frame)
+    try:
+        yield
+    finally:
+        profile._stack.pop()
+        elapsed = time.perf_counter() - frame[1]
+        profile.phases_ms[name] = profile.phases_ms.get(name, 0.0) + (elapsed - frame[2]) * 1000
+        if profile._stack:
+            profile._stack[-1][2] += elapsed
+
+
+def phase_timed(name: str) -> Callable[[F], F]:
+    """Decorator form of ``phase``."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def record_chart(chart: Any) -> None:
+    """Count ``chart`` and its serialised Vega-Lite size against the active panel."""
+    profile = _ACTIVE.get()
+    if profile is None or chart is None:
+        return
+    try:
+        size = len(chart.to_json(indent=None).encode("utf-8"))
+        title = chart.to_dict().get("title") if hasattr(chart, "to_dict") else None
+    except Exception:
+        size, title = 0, None
+    label = title if isinstance(title, str) else f"chart {profile.charts + 1}"
+    profile.charts += 1
+    profile.payload_bytes += size
+    profile.chart_payloads[label] = profile.chart_payloads.get(label, 0) + size
+
+
+def log_slow_panel(
+    profile: PanelProfile,
+    path: Path | str = state_paths.UI_PROFILE_LOG_PATH,
+    threshold_ms: float = SLOW_PANEL_MS,
+) -> bool:
+    if profile.total_ms < threshold_ms:
+        return False
+    entry = {
+        "logged_at": datetime.now(timezone.utc).isoformat(),
+        "release": os.environ.get(RELEASE_ENV),
+        "threshold_ms": threshold_ms,
+        **profile.as_dict(),
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry, sort_keys=True) + "\n")
+    return True
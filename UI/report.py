@@ -0,0 +1,355 @@
+"""Static HTML export of the dashboard for viewers who do not need interactivity.
+
+Every Streamlit session recomputes every panel. ``build_report`` instead runs
+the dashboard's own ``render_*`` panels once, headless, against a
+``_Recorder`` that stands in for the ``streamlit`` module. The recorder turns
+headers, tables, metrics and Altair charts into HTML, and uses the window
+chosen for the report (1Y by default) wherever a panel asks for a window
+selector. The resulting single file embeds each chart's Vega-Lite spec with
+its pre-windowed data inline, so a web server can hand the same bytes to any
+number of viewers. Only the Vega runtime comes from the CDN (inlining it
+would need ``vl-convert``).
+
+``write_report`` runs after ``update.py`` and ``history_update.py``. It
+replaces ``signals/dashboard_report.html`` atomically, so a server never
+serves a half-written file.
+"""
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from html import escape
+import inspect
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import altair as alt
+import pandas as pd
+from pandas.io.formats.style import Styler
+
+from Signals import state_paths
+
+
+logger = logging.getLogger("UI.report")
+
+DEFAULT_WINDOW = "1y"
+# Page-level chrome that has no meaning in a static file.
+SKIPPED_PANELS = {"render_raw_json"}
+VEGA_CDN = "https://cdn.jsdelivr.net/npm"
+
+PAGE_STYLE = """
+body { background: #0b0f14; color: #f2f2f2; font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 0 2rem 3rem; }
+h1, h2, h3, h4 { color: #f2f2f2; }
+nav a { color: #56B4E9; margin-right: 1rem; text-decoration: none; }
+section { border-top: 1px solid #243040; margin-top: 2rem; }
+.meta, .caption { color: #9aa4b2; font-size: 0.85rem; }
+.columns { display: flex; gap: 1.5rem; align-items: flex-start; }
+.columns > div { min-width: 0; }
+.chart { width: 100%; }
+.info { background: #12263a; border-radius: 6px; padding: 0.6rem 0.9rem; margin: 0.5rem 0; }
+.error { background: #3a1212; border-radius: 6px; padding: 0.6rem 0.9rem; margin: 0.5rem 0; }
+.metric .label { color: #9aa4b2; font-size: 0.85rem; }
+.metric .value { font-size: 1.6rem; }
+.md { white-space: pre-wrap; }
+table { border-collapse: collapse; font-size: 0.85rem; margin: 0.5rem 0; }
+th, td { border: 1px solid #243040; padding: 0.25rem 0.5rem; text-align: right; }
+th { background: #141b24; }
+details { margin: 0.5rem 0; }
+pre { background: #141b24; padding: 0.6rem; overflow-x: auto; }
+"""
+
+
+class _Report:
+    """State shared by every recorder of one report: open containers and chart specs."""
+
+    def __init__(self, window: str) -> None:
+        self.window = window
+        self.session_state: Dict[str, Any] = {"chart_resolution": "auto", "profile_panels": False}
+        self.stack: List["_Recorder"] = []
+        self.specs: Dict[str, Dict[str, Any]] = {}
+        # The root recorder stands in for the ``st`` module itself.
+        self.root = _Recorder(self, tag="main")
+
+
+class _Recorder:
+    """The subset of the ``streamlit`` API the dashboard panels use, recorded as HTML."""
+
+    def __init__(self, report: _Report, tag: str = "div", attrs: str = "", prefix: str = "") -> None:
+        self._report = report
+        self._tag = tag
+        self._attrs = attrs
+        self._prefix = prefix
+        self.parts: List[Any] = []
+
+    # -- containers -------------------------------------------------------
+    @property
+    def session_state(self) -> Dict[str, Any]:
+        return self._report.session_state
+
+    @property
+    def sidebar(self) -> "_Recorder":
+        # Sidebar widgets and guides are not part of the report.
+        return _Recorder(self._report)
+
+    def _target(self) -> "_Recorder":
+        # ``st.*`` calls inside ``with cols[0]:`` land in that column, as in Streamlit.
+        if self is self._report.root and self._report.stack:
+            return self._report.stack[-1]
+        return self
+
+    def _add(self, html: Any) -> None:
+        self._target().parts.append(html)
+
+    def _child(self, tag: str = "div", attrs: str = "", prefix: str = "") -> "_Recorder":
+        child = _Recorder(self._report, tag, attrs, prefix)
+        self._add(child)
+        return child
+
+    def __enter__(self) -> "_Recorder":
+        self._report.stack.append(self)
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self._report.stack.pop()
+
+    def columns(self, spec: Any, **_kwargs: Any) -> List["_Recorder"]:
+        weights = [1] * spec if isinstance(spec, int) else list(spec)
+        row = self._child(attrs=' class="columns"')
+        return [row._child(attrs=f' style="flex: {weight} 1 0"') for weight in weights]
+
+    def expander(self, label: str, expanded: bool = False, **_kwargs: Any) -> "_Recorder":
+        opened = " open" if expanded else ""
+        return self._child("details", opened, f"<summary>{escape(str(label))}</summary>")
+
+    def container(self, **_kwargs: Any) -> "_Recorder":
+        return self._child()
+
+    def tabs(self, labels: Sequence[str]) -> List["_Recorder"]:
+        return [self._child(prefix=f"<h3>{escape(str(label))}</h3>") for label in labels]
+
+    def fragment(self, func: Any = None, **_kwargs: Any) -> Any:
+        return func if func is not None else (lambda inner: inner)
+
+    # -- widgets: the report is one fixed view ------------------------------
+    def _choose(self, options: Sequence[Any], index: Optional[int]) -> Any:
+        options = list(options)
+        if self._report.window in options:
+            return self._report.window
+        if not options or index is None:
+            return None
+        return options[index]
+
+    def selectbox(self, _label: str, options: Sequence[Any], index: int = 0, **_kwargs: Any) -> Any:
+        return self._choose(options, index)
+
+    def radio(self, _label: str, options: Sequence[Any], index: int = 0, **_kwargs: Any) -> Any:
+        return self._choose(options, index)
+
+    def toggle(self, _label: str, value: bool = False, **_kwargs: Any) -> bool:
+        return value
+
+    checkbox = toggle
+
+    # -- elements ------------------------------------------------------------
+    def set_page_config(self, **_kwargs: Any) -> None:
+        return None
+
+    def title(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f"<h1>{escape(str(body))}</h1>")
+
+    def header(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f"<h2>{escape(str(body))}</h2>")
+
+    def subheader(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f"<h3>{escape(str(body))}</h3>")
+
+    def markdown(self, body: Any, unsafe_allow_html: bool = False, **_kwargs: Any) -> None:
+        if unsafe_allow_html:
+            # Raw HTML is page styling for Streamlit; the report has its own.
+            return
+        self._add(f'<div class="md">{escape(str(body))}</div>')
+
+    def caption(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f'<p class="caption">{escape(str(body))}</p>')
+
+    def info(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f'<div class="info">{escape(str(body))}</div>')
+
+    warning = info
+
+    def error(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f'<div class="error">{escape(str(body))}</div>')
+
+    def write(self, *args: Any, **_kwargs: Any) -> None:
+        for arg in args:
+            if isinstance(arg, (pd.DataFrame, Styler)):
+                self.dataframe(arg)
+            else:
+                self._add(f"<p>{escape(str(arg))}</p>")
+
+    def metric(self, label: Any, value: Any, delta: Any = None, **_kwargs: Any) -> None:
+        delta_html = f'<div class="caption">{escape(str(delta))}</div>' if delta is not None else ""
+        self._add(
+            f'<div class="metric"><div class="label">{escape(str(label))}</div>'
+            f'<div class="value">{escape(str(value))}</div>{delta_html}</div>'
+        )
+
+    def json(self, body: Any, **_kwargs: Any) -> None:
+        self._add(f"<pre>{escape(json.dumps(body, indent=2, default=str))}</pre>")
+
+    def dataframe(self, data: Any, hide_index: Optional[bool] = None, **_kwargs: Any) -> None:
+        if isinstance(data, Styler):
+            styler = data.hide(axis="index") if hide_index else data
+            self._add(styler.to_html())
+            return
+        frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        self._add(frame.to_html(index=not hide_index, na_rep="—", border=0, escape=True))
+
+    table = dataframe
+
+    def altair_chart(self, chart: Any, **_kwargs: Any) -> None:
+        spec = chart.to_dict()
+        if not {"hconcat", "vconcat", "concat"} & spec.keys():
+            spec.setdefault("width", "container")
+        chart_id = f"chart-{len(self._report.specs) + 1}"
+        self._report.specs[chart_id] = spec
+        self._add(f'<div class="chart" id="{chart_id}"></div>')
+
+    def render(self) -> str:
+        inner = "".join(part.render() if isinstance(part, _Recorder) else part for part in self.parts)
+        return f"<{self._tag}{self._attrs}>{self._prefix}{inner}</{self._tag}>"
+
+
+@contextmanager
+def _headless(module: Any, recorder: _Recorder) -> Iterator[None]:
+    """Point ``module.st`` at ``recorder`` while the panels run."""
+    original = module.st
+    module.st = recorder
+    try:
+        yield
+    finally:
+        module.st = original
+
+
+def report_sections(dashboard: Any) -> List[tuple]:
+    """``(label, [render functions])`` in dashboard tab order, fragments unwrapped."""
+    sections = []
+    for label, renders in dashboard.TABS:
+        panels = [inspect.unwrap(render) for render in renders]
+        sections.append((label, [panel for panel in panels if panel.__name__ not in SKIPPED_PANELS]))
+    return sections
+
+
+def _anchor(label: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-") or "section"
+
+
+def _script_json(value: Any) -> str:
+    # Keep "</script>" inside string data from closing the script element.
+    return json.dumps(value, separators=(",", ":"), default=str).replace("</", "<\\/")
+
+
+def _import_dashboard() -> Any:
+    from streamlit import config, runtime
+
+    if not runtime.exists():
+        # Headless: silence the "use streamlit run" and missing ScriptRunContext warnings.
+        config.set_option("global.showWarningOnDirectExecution", False)
+        logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    from UI import dashboard
+
+    return dashboard
+
+
+def build_report(window: str = DEFAULT_WINDOW) -> str:
+    """Render every dashboard panel for ``window`` into one static HTML page."""
+    dashboard = _import_dashboard()
+
+    daily_state = dashboard._load_daily_state()
+    # Loaded up front so its generation is known for the page header.
+    dashboard._load_history_state()
+    report = _Report(window)
+    root = report.root
+    nav: List[str] = []
+    with _headless(dashboard, root):
+        if not daily_state:
+            root.info("daily_state.json not found.")
+        for label, panels in report_sections(dashboard) if daily_state else []:
+            anchor = _anchor(label)
+            nav.append(f'<a href="#{anchor}">{escape(label)}</a>')
+            with root._child("section", f' id="{anchor}"', f"<h2>{escape(label)}</h2>"):
+                for panel in panels:
+                    try:
+                        panel(daily_state)
+                    except Exception as exc:  # one broken panel should not sink the report
+                        logger.exception("report panel %s failed", panel.__name__)
+                        root.error(f"{panel.__name__} could not be rendered: {exc}")
+
+    health = daily_state.get("system_health", {}) if isinstance(daily_state, dict) else {}
+    generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    as_of = health.get("generated_at") if isinstance(health, dict) else None
+    generations = {
+        name: dashboard.state_generation(path) or "—"
+        for name, path in (("daily_state", state_paths.DAILY_STATE_PATH), ("history_state", state_paths.HISTORY_STATE_PATH))
+    }
+    meta = escape(
+        f"Static snapshot generated {generated_at} · state updated {as_of or '—'} · "
+        f"history window {dict(dashboard.WINDOW_OPTIONS).get(window, window)} · "
+        + " · ".join(f"{name} {generation}" for name, generation in generations.items())
+    )
+    scripts = "".join(
+        f'<script src="{VEGA_CDN}/{name}@{version}"></script>'
+        for name, version in (
+            ("vega", alt.VEGA_VERSION),
+            ("vega-lite", alt.VEGALITE_VERSION),
+            ("vega-embed", alt.VEGAEMBED_VERSION),
+        )
+    )
+    embed = (
+        f"<script>const SPECS = {_script_json(report.specs)};"
+        "for (const [id, spec] of Object.entries(SPECS)) {"
+        "vegaEmbed('#' + id, spec, {actions: false, theme: 'dark'}).catch(console.error);}</script>"
+    )
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        "<title>Macro Strategy Dashboard</title>"
+        f"<style>{PAGE_STYLE}</style>{scripts}</head><body>"
+        "<h1>Macro Strategy Dashboard</h1>"
+        f'<p class="meta">{meta}</p><nav>{"".join(nav)}</nav>'
+        f"{root.render()}{embed}</body></html>\n"
+    )
+
+
+def write_report(
+    path: Path | str = state_paths.REPORT_HTML_PATH,
+    window: str = DEFAULT_WINDOW,
+) -> Path:
+    html = build_report(window)
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_text(html, encoding="utf-8")
+    os.replace(tmp, target)
+    return target
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Write the static dashboard report.")
+    parser.add_argument("--window", default=DEFAULT_WINDOW, choices=["1y", "3y", "5y"])
+    parser.add_argument("--output", default=str(state_paths.REPORT_HTML_PATH))
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    print(write_report(args.output, args.window))
@@ -0,0 +1,317 @@
+"""Local read-only HTTP API over daily_state.json and history_state.json.
+
+Notebooks and services can fetch one block or one series instead of parsing
+whole state files:
+
+- ``GET /``: generations of both files.
+- ``GET /daily``: block names. ``GET /daily/<block>[/<key>...]``: that subtree,
+  e.g. ``/daily/fx/matrix_1m_pct``.
+- ``GET /history``: top-level keys and series names.
+  ``GET /history/<key>[/<key>...]``: that subtree, e.g.
+  ``/history/series/dxy`` or ``/history/transforms/dxy/zscore_3y``.
+
+Dated blocks (``dates`` + ``values``, including the yield-curve matrix) take
+``window=1y|3y|5y|all``, ``days=N``, ``start=`` and ``end=`` (ISO dates). They
+also take ``level=weekly|monthly|lttb`` to read a pre-built pyramid level, and
+``format=npz`` for a binary ``dates``/``values`` payload (``np.load`` it).
+
+State is parsed once through ``UI.data_layer`` and re-read only when a new
+generation (content hash) is written. Encoded responses are memoised per
+generation. ETags are derived from the generation and the request, so
+``If-None-Match`` revalidation costs one ``stat`` and builds no body. Bodies
+of at least ``GZIP_MIN_BYTES`` are gzipped for clients that accept it.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from datetime import date
+import gzip
+import hashlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+import logging
+from pathlib import Path
+import sys
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np
+
+from Signals import state_paths
+from UI.data_layer import load_state, state_generation
+from UI.view_models import GenerationMemo
+from UI.windowing import WINDOW_DAYS, as_dates, date_slice
+
+
+logger = logging.getLogger("UI.state_api")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+GZIP_MIN_BYTES = 1024
+MAX_RESPONSES = 512
+QUERY_KEYS = {"window", "days", "start", "end", "level", "format"}
+PYRAMID_LEVELS = {"weekly", "monthly", "lttb"}
+JSON_TYPE = "application/json"
+NPZ_TYPE = "application/x-npz"
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class Response:
+    status: HTTPStatus
+    body: bytes = b""
+    content_type: str = JSON_TYPE
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _error(status: HTTPStatus, message: str) -> Response:
+    return Response(status, _json_bytes({"error": message, "status": int(status)}))
+
+
+def _is_dated(block: Any) -> bool:
+    return isinstance(block, dict) and isinstance(block.get("dates"), list) and isinstance(block.get("values"), list)
+
+
+def _is_matrix(values: List[Any]) -> bool:
+    return bool(values) and all(isinstance(row, list) for row in values)
+
+
+def _float_array(values: List[Any]) -> np.ndarray:
+    return np.array([np.nan if v is None else v for v in values], dtype="float64")
+
+
+def _parse_day(value: str, name: str) -> np.datetime64:
+    try:
+        return np.datetime64(date.fromisoformat(value), "D")
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an ISO date (YYYY-MM-DD)") from None
+
+
+def _parse_query(query: str) -> Tuple[Tuple[str, str], ...]:
+    params: Dict[str, str] = {}
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key not in QUERY_KEYS:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"unknown query parameter: {key}")
+        params[key] = value
+    window = params.get("window")
+    if window is not None and window != "all" and window not in WINDOW_DAYS:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"window must be one of {sorted(WINDOW_DAYS)} or all")
+    if "days" in params and (not params["days"].isdigit() or int(params["days"]) <= 0):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "days must be a positive integer")
+    level = params.get("level")
+    if level is not None and level != "daily" and level not in PYRAMID_LEVELS:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"level must be daily or one of {sorted(PYRAMID_LEVELS)}")
+    if params.get("format", "json") not in {"json", "npz"}:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "format must be json or npz")
+    return tuple(sorted(params.items()))
+
+
+def _subtree(state: Mapping[str, Any], parts: Tuple[str, ...]) -> Any:
+    node: Any = state
+    for depth, part in enumerate(parts):
+        if not isinstance(node, dict) or part not in node:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"not found: /{'/'.join(parts[: depth + 1])}")
+        node = node[part]
+    return node
+
+
+def _listing(source: str, state: Mapping[str, Any], generation: Optional[str]) -> Dict[str, Any]:
+    if source == "daily":
+        return {"generation": generation, "blocks": sorted(state)}
+    listing: Dict[str, Any] = {"generation": generation, "keys": sorted(state)}
+    for key in ("series", "transforms", "cross_asset"):
+        if isinstance(state.get(key), dict):
+            listing[key] = sorted(state[key])
+    return listing
+
+
+class StateAPI:
+    """Request handling, independent of the HTTP server so it can be called directly."""
+
+    def __init__(
+        self,
+        daily_path: Path | str = state_paths.DAILY_STATE_PATH,
+        history_path: Path | str = state_paths.HISTORY_STATE_PATH,
+    ) -> None:
+        self.paths = {"daily": Path(daily_path), "history": Path(history_path)}
+        self._memos = {source: GenerationMemo(MAX_RESPONSES) for source in self.paths}
+
+    def handle(self, target: str, headers: Mapping[str, str]) -> Response:
+        try:
+            return self._handle(target, headers)
+        except ApiError as exc:
+            return _error(exc.status, str(exc))
+
+    def _handle(self, target: str, headers: Mapping[str, str]) -> Response:
+        split = urlsplit(target)
+        parts = tuple(unquote(part) for part in split.path.split("/") if part)
+        if not parts:
+            generations = {source: self._load(source)[1] for source in self.paths}
+            return Response(HTTPStatus.OK, _json_bytes({"generations": generations}), headers={"Cache-Control": "no-cache"})
+        source, path = parts[0], parts[1:]
+        if source not in self.paths:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"unknown source: {source} (use /daily or /history)")
+        query = _parse_query(split.query)
+        state, generation = self._load(source)
+        if not state:
+            raise ApiError(HTTPStatus.SERVICE_UNAVAILABLE, f"{self.paths[source].name} not available")
+
+        wants_gzip = "gzip" in headers.get("Accept-Encoding", "").lower()
+        key = hashlib.sha1(f"{'/'.join(parts)}?{query}".encode("utf-8")).hexdigest()[:12]
+        # Weak: the gzip and identity encodings of one generation are equivalent.
+        etag = f'W/"{generation}-{key}"'
+        if self._matches(headers.get("If-None-Match"), etag):
+            return Response(HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+        body, content_type = self._memos[source].get(
+            generation, (path, query), lambda: self._render(source, state, generation, path, dict(query))
+        )
+        response_headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if wants_gzip and len(body) >= GZIP_MIN_BYTES:
+            body = self._memos[source].get(generation, (path, query, "gzip"), lambda: gzip.compress(body, 6))
+            response_headers["Content-Encoding"] = "gzip"
+        return Response(HTTPStatus.OK, body, content_type, response_headers)
+
+    def _load(self, source: str) -> Tuple[Mapping[str, Any], Optional[str]]:
+        state = load_state(self.paths[source])
+        return state, state_generation(self.paths[source])
+
+    @staticmethod
+    def _matches(if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        # Weak comparison (RFC 9110 13.1.2), as If-None-Match requires.
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    def _render(
+        self,
+        source: str,
+        state: Mapping[str, Any],
+        generation: Optional[str],
+        path: Tuple[str, ...],
+        params: Dict[str, str],
+    ) -> Tuple[bytes, str]:
+        if not path:
+            if params:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "query parameters apply to dated blocks only")
+            return _json_bytes(_listing(source, state, generation)), JSON_TYPE
+        level = params.get("level", "daily")
+        block = _subtree(state, path)
+        if level != "daily":
+            if source != "history":
+                raise ApiError(HTTPStatus.BAD_REQUEST, "level applies to history series only")
+            block = _subtree(state, ("pyramids", *path, level))
+        if not _is_dated(block):
+            if params:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "query parameters apply to dated blocks only")
+            return _json_bytes(block), JSON_TYPE
+        return self._render_dated(block, params)
+
+    @staticmethod
+    def _render_dated(block: Mapping[str, Any], params: Dict[str, str]) -> Tuple[bytes, str]:
+        dates = as_dates(block["dates"])
+        window = params.get("window")
+        days = int(params["days"]) if "days" in params else WINDOW_DAYS.get(window or "")
+        start = _parse_day(params["start"], "start") if "start" in params else None
+        end = _parse_day(params["end"], "end") if "end" in params else None
+        rows = date_slice(dates, days, start, end)
+        values = block["values"]
+        matrix = _is_matrix(values)
+        sliced = [row[rows] for row in values] if matrix else values[rows]
+
+        if params.get("format") == "npz":
+            buffer = io.BytesIO()
+            array = np.array([_float_array(row) for row in sliced]) if matrix else _float_array(sliced)
+            np.savez(buffer, dates=dates[rows], values=array)
+            return buffer.getvalue(), NPZ_TYPE
+        payload = {key: value for key, value in block.items() if key not in {"dates", "values"}}
+        payload["dates"] = block["dates"][rows]
+        payload["values"] = sliced
+        return _json_bytes(payload), JSON_TYPE
+
+
+class _Handler(BaseHTTPRequestHandler):
+    api: StateAPI
+    server_version = "StateAPI/1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self._respond(include_body=True)
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._respond(include_body=False)
+
+    def _method_not_allowed(self) -> None:
+        self._send(_error(HTTPStatus.METHOD_NOT_ALLOWED, "read-only API: use GET or HEAD"), True)
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _method_not_allowed
+
+    def _respond(self, include_body: bool) -> None:
+        self._send(self.api.handle(self.path, self.headers), include_body)
+
+    def _send(self, response: Response, include_body: bool) -> None:
+        self.send_response(response.status)
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", response.content_type)
+            self.send_header("Content-Length", str(len(response.body)))
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        if response.status == HTTPStatus.METHOD_NOT_ALLOWED:
+            self.send_header("Allow", "GET, HEAD")
+        self.end_headers()
+        if include_body and response.status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s " + format, self.address_string(), *args)
+
+
+def make_server(api: Optional[StateAPI] = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """Bound (not yet serving) server; ``port=0`` picks a free port."""
+    handler = type("StateAPIHandler", (_Handler,), {"api": api or StateAPI()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve_in_thread(api: Optional[StateAPI] = None, host: str = DEFAULT_HOST, port: int = 0) -> ThreadingHTTPServer:
+    """Start a server on a daemon thread; stop it with ``server.shutdown()``."""
+    server = make_server(api, host, port)
+    threading.Thread(target=server.serve_forever, name="state-api", daemon=True).start()
+    return server
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve daily/history state over local HTTP (read-only).")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    server = make_server(host=args.host, port=args.port)
+    print(f"Serving state API on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,147 @@
+"""Background watcher that pre-loads new state generations for the dashboard.
+
+One daemon thread per process polls ``signals/state_manifest.json`` (a
+``stat`` per tick; the manifest is re-read only when it changes). When the
+updater publishes a new generation, the watcher parses the changed state
+files into the shared ``UI.data_layer`` cache before any session asks for
+them. This is the double buffer: sessions keep reading the previous parsed
+copy until the new one is complete, and then the swap is one dict
+assignment. Only then does the watcher advance ``generation``, which the
+dashboard's live-refresh fragment compares against what each session last
+rendered.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from Signals import state_paths
+from Signals.state_manifest import load_manifest
+from UI.data_layer import load_state, state_generation
+
+
+logger = logging.getLogger("UI.state_watcher")
+
+POLL_SECONDS = 1.0
+# How often each session's live-refresh fragment compares generations (in memory, no I/O).
+REFRESH_SECONDS = 2.0
+KEEP_CHANGES = 32
+HISTORY = "history_state"
+
+
+@dataclass
+class Change:
+    generation: int
+    daily_blocks: Set[str] = field(default_factory=set)
+    history: bool = False
+
+
+class ManifestWatcher:
+    def __init__(self, path: Path | str = state_paths.STATE_MANIFEST_PATH, interval: float = POLL_SECONDS) -> None:
+        self.path = Path(path)
+        self.interval = interval
+        self.generation: Optional[int] = None
+        self.published_at: Optional[str] = None
+        self._stat: Optional[Tuple[int, int]] = None
+        self._changes: Deque[Change] = deque(maxlen=KEEP_CHANGES)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "ManifestWatcher":
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="state-manifest-watcher", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:  # keep watching; a bad tick must not end live refresh
+                logger.exception("state manifest poll failed")
+            self._stop.wait(self.interval)
+
+    def poll(self) -> bool:
+        """One tick: True when a new generation was loaded."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._stat:
+            return False
+        manifest = load_manifest(self.path)
+        generation = manifest.get("generation") if manifest else None
+        if not isinstance(generation, int) or (self.generation is not None and generation <= self.generation):
+            self._stat = key
+            return False
+        started = time.perf_counter()
+        files: Dict[str, Any] = manifest.get("files", {}) if isinstance(manifest.get("files"), dict) else {}
+        for entry in files.values():
+            if not isinstance(entry, dict) or not entry.get("path"):
+                continue
+            load_state(entry["path"])
+            if state_generation(entry["path"]) != entry.get("digest"):
+                # The updater is already rewriting this file; try again next tick.
+                return False
+        changed = manifest.get("changed", {}) if isinstance(manifest.get("changed"), dict) else {}
+        with self._lock:
+            self._changes.append(
+                Change(generation, set(changed.get("daily_state") or []), bool(changed.get(HISTORY)))
+            )
+            self.generation = generation
+            self.published_at = manifest.get("published_at")
+            self._stat = key
+        logger.info("state generation %s pre-loaded in %.1f ms", generation, (time.perf_counter() - started) * 1000)
+        return True
+
+    def changes_since(self, seen: Optional[int]) -> Optional[Change]:
+        """Blocks changed after generation ``seen``; None means unknown (treat as everything)."""
+        with self._lock:
+            if seen is None or not self._changes or self._changes[0].generation > seen + 1:
+                return None
+            merged = Change(self.generation or seen)
+            for change in self._changes:
+                if change.generation > seen:
+                    merged.daily_blocks |= change.daily_blocks
+                    merged.history = merged.history or change.history
+            return merged
+
+
+def affects(change: Optional[Change], daily_blocks: Set[str], uses_history: bool) -> bool:
+    """Whether a panel reading ``daily_blocks`` (and history, if ``uses_history``) must rerun."""
+    if change is None:
+        return True
+    if "*" in daily_blocks:
+        return bool(change.daily_blocks) or (uses_history and change.history)
+    return bool(change.daily_blocks & daily_blocks) or (uses_history and change.history)
+
+
+_WATCHER: Optional[ManifestWatcher] = None
+_WATCHER_LOCK = threading.Lock()
+
+
+def get_watcher(path: Path | str = state_paths.STATE_MANIFEST_PATH) -> ManifestWatcher:
+    """The process-wide watcher (started on first use), shared by all sessions."""
+    global _WATCHER
+    with _WATCHER_LOCK:
+        target = Path(path).absolute()
+        if _WATCHER is None or _WATCHER.path != target:
+            if _WATCHER is not None:
+                _WATCHER.stop()
+            _WATCHER = ManifestWatcher(target)
+            _WATCHER.poll()
+        return _WATCHER.start()
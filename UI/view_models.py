@@ -0,0 +1,120 @@
+"""Chart view-models memoised per state generation.
+
+A generation is the content-hash prefix the data layer assigns to a state
+file (``UI.data_layer.state_generation``). Chart-ready frames (parsed
+``Date``, numeric ``Value``, ``Series``) and finished Altair charts are built
+once per ``(generation, panel, window, ...)`` key and shared by every rerun
+and session until the updater writes new state. Then the next lookup
+under the new generation drops the stale entries. Without a generation
+(state file missing) nothing is cached. Each memo follows one state file,
+so charts read from another file (``source``) get a memo of their own;
+sharing one would make the two generations evict each other on every rerun.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import pandas as pd
+
+
+MAX_FRAMES = 512
+MAX_CHARTS = 256
+FRAME_COLUMNS = ["Date", "Value", "Series"]
+
+
+class GenerationMemo:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+        self._generation: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, generation: Optional[str], key: Hashable, builder: Callable[[], Any]) -> Any:
+        if generation is None:
+            return builder()
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            cache_key = (generation, key)
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return self._entries[cache_key]
+        value = builder()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[cache_key] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self.misses += 1
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return {"generation": self._generation, "entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self.hits = self.misses = 0
+
+
+_FRAMES = GenerationMemo(MAX_FRAMES)
+_CHARTS = GenerationMemo(MAX_CHARTS)
+_SOURCE_CHARTS: Dict[str, GenerationMemo] = {}
+_SOURCE_LOCK = threading.Lock()
+
+
+def rows_to_frame(rows: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """Chart-ready frame: parsed dates, numeric values, unparseable rows dropped."""
+    frame = pd.DataFrame(list(rows), columns=FRAME_COLUMNS)
+    if frame.empty:
+        return frame
+    frame["Date"] = pd.to_datetime(frame["Date"], errors="coerce")
+    frame["Value"] = pd.to_numeric(frame["Value"], errors="coerce")
+    return frame.dropna(subset=["Date"]).reset_index(drop=True)
+
+
+def series_frame(generation: Optional[str], key: Hashable, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """Memoised chart-ready frame for one windowed series. Treat the result as read-only."""
+    return _FRAMES.get(generation, key, build)
+
+
+def view_model(generation: Optional[str], key: Hashable, builder: Callable[[], Any]) -> Any:
+    """Memoised derived object (e.g. a ``YieldCurveHistory``) for one generation."""
+    return _FRAMES.get(generation, ("view_model", key), builder)
+
+
+def chart_spec(
+    generation: Optional[str],
+    key: Hashable,
+    builder: Callable[[], Any],
+    source: Optional[str] = None,
+) -> Any:
+    """Memoised chart (or None) for ``key``, typically ``(panel, window, resolution)``.
+
+    ``generation`` is history_state's unless ``source`` names the other file it belongs to.
+    """
+    if source is None:
+        return _CHARTS.get(generation, key, builder)
+    with _SOURCE_LOCK:
+        memo = _SOURCE_CHARTS.setdefault(source, GenerationMemo(MAX_CHARTS))
+    return memo.get(generation, key, builder)
+
+
+def memo_stats() -> Dict[str, Dict[str, Any]]:
+    stats = {"frames": _FRAMES.stats(), "charts": _CHARTS.stats()}
+    stats.update({f"charts:{source}": memo.stats() for source, memo in sorted(_SOURCE_CHARTS.items())})
+    return stats
+
+
+def clear_memos() -> None:
+    _FRAMES.clear()
+    _CHARTS.clear()
+    with _SOURCE_LOCK:
+        _SOURCE_CHARTS.clear()
@@ -0,0 +1,103 @@
+"""Trailing-window slicing on sorted date arrays.
+
+History blocks store ISO date strings in ascending order. ``DatedSeries``
+parses them once into a ``datetime64[D]`` index (the dashboard keeps one
+per state generation). A 1Y/3Y/5Y window is then a single
+``searchsorted`` on that index, and the result is a pair of numpy views
+(no copy, no per-row parsing). It matches the old DataFrame-based filter:
+every point dated on or after ``last_date - days``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+WINDOW_DAYS = {"1y": 365, "3y": 1095, "5y": 1825}
+
+
+def as_dates(dates: Sequence[Any]) -> np.ndarray:
+    try:
+        return np.asarray(dates, dtype="datetime64[D]")
+    except ValueError:
+        # Odd entries (unparseable strings) become NaT and are dropped below.
+        return pd.to_datetime(pd.Series(list(dates)), errors="coerce").to_numpy(dtype="datetime64[D]")
+
+
+def date_slice(
+    dates: np.ndarray,
+    days: Optional[int] = None,
+    start: Optional[np.datetime64] = None,
+    end: Optional[np.datetime64] = None,
+) -> slice:
+    """Positions of ascending ``dates`` in the trailing ``days`` window and within ``[start, end]``."""
+    lo, hi = 0, len(dates)
+    if not hi:
+        return slice(0, 0)
+    if days is not None:
+        lo = int(np.searchsorted(dates, dates[-1] - np.timedelta64(days, "D"), side="left"))
+    if start is not None:
+        lo = max(lo, int(np.searchsorted(dates, start, side="left")))
+    if end is not None:
+        hi = int(np.searchsorted(dates, end, side="right"))
+    return slice(lo, max(lo, hi))
+
+
+@dataclass(frozen=True)
+class DatedSeries:
+    dates: np.ndarray  # datetime64[D], ascending
+    values: np.ndarray  # float64, NaN where missing
+
+    @classmethod
+    def from_lists(cls, dates: Sequence[Any], values: Sequence[Any]) -> "DatedSeries":
+        size = min(len(dates), len(values))
+        days = as_dates(dates[:size])
+        vals = np.array([np.nan if v is None else v for v in values[:size]], dtype="float64")
+        valid = ~np.isnat(days)
+        if not valid.all():
+            days, vals = days[valid], vals[valid]
+        if len(days) > 1 and (days[1:] < days[:-1]).any():
+            order = np.argsort(days, kind="stable")
+            days, vals = days[order], vals[order]
+        return cls(days, vals)
+
+    @classmethod
+    def from_block(cls, block: Any) -> "DatedSeries":
+        dates = block.get("dates", []) if isinstance(block, dict) else []
+        values = block.get("values", []) if isinstance(block, dict) else []
+        if not isinstance(dates, list) or not isinstance(values, list):
+            return cls.empty()
+        return cls.from_lists(dates, values)
+
+    @classmethod
+    def empty(cls) -> "DatedSeries":
+        return cls(np.array([], dtype="datetime64[D]"), np.array([], dtype="float64"))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def window_start(self, days: Optional[int]) -> int:
+        return date_slice(self.dates, days).start
+
+    def window(self, days: Optional[int]) -> "DatedSeries":
+        """Trailing ``days`` calendar days as views onto this series' arrays."""
+        start = self.window_start(days)
+        return self if start == 0 else DatedSeries(self.dates[start:], self.values[start:])
+
+    def to_rows(self, label: str) -> List[Dict[str, Any]]:
+        return [
+            {"Date": str(day), "Value": None if np.isnan(value) else float(value), "Series": label}
+            for day, value in zip(self.dates, self.values)
+        ]
+
+    def to_frame(self, label: str) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "Date": self.dates.astype("datetime64[ns]"),
+                "Value": self.values,
+                "Series": pd.Series([label] * len(self.dates), dtype="object"),
+            }
+        )
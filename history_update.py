@@ -1,6 +1,68 @@
 """Write signals/history_state.json for UI historical charts."""
+import argparse
+
+from History.curve_fit_history import write_curve_fit_history
 from History.history_state import write_history_state
+from History.history_stream import stream_history_state
+from History.regime_backfill import write_regime_backfill
+from History.zq_strip import write_zq_strip
+from Signals import stage_profile, tracing
+from update import write_report_step
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=None,
+        help="Threads used for provider fetches (0/1 = sequential).",
+    )
+    parser.add_argument(
+        "--transform-workers",
+        type=int,
+        default=None,
+        help="Processes used for per-series transforms (0/1 = in-process).",
+    )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Build the whole document before writing it (default: stream one series at a time).",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DIR",
+        help="Profile each stage with cProfile and tracemalloc (reports under signals/profiles/ unless DIR is given).",
+    )
+    parser.add_argument("--profile-top", type=int, default=stage_profile.TOP_FUNCTIONS, help="Functions listed per stage.")
+    parser.add_argument(
+        "--profile-allocations",
+        action="store_true",
+        help="Also list each stage's top allocation sites (slower).",
+    )
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    write_history_state()
+    args = _parse_args()
+    profiling = stage_profile.session_for("history_update", args.profile, args.profile_top, args.profile_allocations)
+    with tracing.session_from_env("history_update"), profiling as profile:
+        with tracing.span("write_history_state"):
+            writer = write_history_state if args.in_memory else stream_history_state
+            writer(fetch_workers=args.fetch_workers, transform_workers=args.transform_workers)
+        with stage_profile.stage("write_zq_strip"):
+            write_zq_strip()
+        with stage_profile.stage("write_curve_fit_history"):
+            write_curve_fit_history()
+        with stage_profile.stage("write_regime_backfill"):
+            write_regime_backfill()
+        from Signals.state_manifest import publish_manifest
+
+        with stage_profile.stage("publish_manifest"):
+            publish_manifest()
+        write_report_step()
+    if profile is not None:
+        print(f"stage profiles: {profile.directory}")
@@ -0,0 +1,28 @@
+from tools import benchmark
+
+
+def test_run_suite_reports_time_and_memory_per_case_and_scale(monkeypatch):
+    monkeypatch.setattr(benchmark, "BASE_DAYS", 120)
+    cases = ["select_snapshots", "build_fx_panel", "dashboard_prep"]
+    results = benchmark.run_suite(scales={"tiny": (1, 1), "wide": (2, 1)}, cases=cases, repeat=1)
+
+    rows = results["results"]
+    assert [(row["case"], row["scale"]) for row in rows] == [
+        (name, scale) for scale in ("tiny", "wide") for name in cases
+    ]
+    assert all(row["seconds_median"] > 0 and row["peak_mib"] >= 0 for row in rows)
+    tiny, wide = rows[0], rows[3]
+    assert wide["series"] == 2 * tiny["series"]
+    assert tiny["points_per_series"] == 120
+    assert results["meta"]["scales"]["wide"] == [2, 1]
+
+
+def test_compare_reports_ratios_for_matching_rows():
+    old = {"results": [{"case": "a", "scale": "1x", "seconds_median": 2.0, "peak_mib": 4.0}]}
+    new = {
+        "results": [
+            {"case": "a", "scale": "1x", "seconds_median": 1.0, "peak_mib": 6.0},
+            {"case": "b", "scale": "1x", "seconds_median": 1.0, "peak_mib": 1.0},
+        ]
+    }
+    assert benchmark.compare(new, old) == [{"case": "a", "scale": "1x", "time_ratio": 0.5, "memory_ratio": 1.5}]
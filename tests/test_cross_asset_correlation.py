@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from History.cross_asset_correlation import (
+    compute_rolling_correlations,
+    correlation_summary,
+    latest_matrix,
+    load_correlations,
+    save_correlations,
+)
+
+
+def _mixed_calendar_series():
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2021-01-01", periods=320)
+    out = {}
+    for idx, key in enumerate(("vix", "move", "walcl", "eurusd")):
+        keep = rng.random(len(dates)) > 0.12 * (idx + 1) / 2
+        level = 7e6 if key == "walcl" else 20.0
+        values = level + np.cumsum(rng.normal(size=len(dates)))
+        out[key] = ([str(day.date()) for day in dates[keep]], values[keep].tolist())
+    return out
+
+
+def test_pairs_match_pandas_on_mixed_calendars():
+    series = _mixed_calendar_series()
+    result = compute_rolling_correlations(series, windows=(20, 60))
+    for a in series:
+        for b in series:
+            if result.keys.index(a) >= result.keys.index(b):
+                continue
+            frame = pd.DataFrame(
+                {"a": pd.Series(series[a][1], index=series[a][0]), "b": pd.Series(series[b][1], index=series[b][0])}
+            ).dropna()
+            for window in (20, 60):
+                expected = frame["a"].rolling(window, min_periods=window).corr(frame["b"]).dropna()
+                dates, values = result.pair_series(a, b, window)
+                assert [str(day) for day in dates] == list(expected.index)
+                np.testing.assert_allclose(values, expected.values, atol=1e-6)
+
+
+def test_changes_basis_and_latest_lookup(tmp_path):
+    series = _mixed_calendar_series()
+    result = compute_rolling_correlations(series, windows=(60,), basis="changes")
+    summary = correlation_summary(result)
+    matrix = latest_matrix(summary, "60d")
+    assert len(matrix) == 4 and matrix[0][0] == 1.0
+    assert matrix[0][1] == matrix[1][0] == summary["windows"]["60d"]["upper"][0]
+
+    path = tmp_path / "history_correlations.npz"
+    save_correlations(path, result)
+    loaded = load_correlations(path)
+    assert loaded.keys == result.keys
+    np.testing.assert_allclose(
+        loaded.matrix_at(None, 60), result.matrix_at(None, 60), atol=1e-6, equal_nan=True
+    )
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_short_or_empty_series_yield_no_values():
+    result = compute_rolling_correlations({"a": (["2024-01-01"], [1.0]), "b": ([], [])}, windows=(60,))
+    summary = correlation_summary(result)
+    assert summary["windows"]["60d"]["upper"] == [None]
+    assert summary["windows"]["60d"]["as_of"] == [None]
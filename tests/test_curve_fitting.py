@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from Analytics import curve_fitting
+from Analytics.curve_fitting import (
+    TENOR_YEARS,
+    _loadings,
+    build_yield_curve_fit_block,
+    fit_nelson_siegel,
+    fit_spline,
+    fit_svensson,
+)
+from History.curve_fit_history import build_curve_fit_history
+
+
+TAU = np.array(list(TENOR_YEARS.values()))
+
+
+def _ns_yields(count=200, seed=3):
+    rng = np.random.default_rng(seed)
+    betas = np.stack([4 + rng.normal(0, 0.5, count), -1 + rng.normal(0, 0.5, count), rng.normal(0, 1, count)], axis=1)
+    lambdas = rng.uniform(0.8, 3.0, count)[:, None]
+    return np.einsum("dtk,dk->dt", _loadings("nelson_siegel", TAU, lambdas), betas)
+
+
+def test_nelson_siegel_recovers_exact_curves_with_missing_tenors():
+    yields = _ns_yields()
+    yields[::7, 3] = np.nan
+    fit = fit_nelson_siegel(TAU, yields)
+    assert np.median(fit.rmse_bps) < 0.01
+    assert np.nanmax(np.abs(fit.zero(TAU) - yields)) < 0.01
+    warm = fit_nelson_siegel(TAU, yields, initial_lambda=fit.lambdas[:, 0])
+    assert np.all(warm.rmse_bps <= fit.rmse_bps + 0.05)
+
+
+def test_svensson_and_spline_fit_and_flat_curve_identities():
+    yields = _ns_yields(50)
+    assert np.nanmax(fit_svensson(TAU, yields).rmse_bps) < 1.0
+    spline = fit_spline(TAU, yields)
+    np.testing.assert_allclose(spline.zero(TAU), yields, atol=1e-10)
+
+    flat = np.full((1, len(TAU)), 4.0)
+    for fit in (fit_nelson_siegel(TAU, flat), fit_spline(TAU, flat)):
+        np.testing.assert_allclose(fit.forward([1.0, 7.5, 30.0]), 4.0, atol=1e-6)
+        # Continuous 4% is 4.0403% with semi-annual compounding.
+        np.testing.assert_allclose(fit.par([2.0, 10.0]), 2 * np.expm1(0.02) * 100, atol=1e-6)
+
+
+def test_daily_block_fits_anchor_curves():
+    duration = {}
+    for tenor, key in [("3M", "y3m_nominal"), ("2Y", "y2y_nominal"), ("5Y", "y5y_nominal"),
+                       ("10Y", "y10_nominal"), ("30Y", "y30y_nominal")]:
+        level = 4.0 + TENOR_YEARS[tenor] / 30
+        duration[key] = {"value": level, "meta": {"current": level, "last_week": level - 0.1}}
+    block = build_yield_curve_fit_block({"duration": duration})
+    current = block["models"]["nelson_siegel"]["current"]
+    assert current["rmse_bps"] is not None
+    assert len(current["zero"]) == len(block["maturities_years"])
+    assert block["models"]["svensson"]["current"]["zero"] is None  # only 5 tenors
+    assert block["models"]["nelson_siegel"]["last_month"]["params"] is None
+
+
+def test_curve_fit_history_covers_every_date():
+    yields = _ns_yields(30)
+    history = {
+        "yield_curve": {
+            "tenors": list(TENOR_YEARS),
+            "dates": [f"2024-01-{day:02d}" for day in range(1, 31)],
+            "values": yields.T.tolist(),
+        }
+    }
+    out = build_curve_fit_history(history)
+    assert len(out["dates"]) == 30
+    assert len(out["params"]["beta0"]) == 30
+    assert max(out["rmse_bps"]) < 0.5
+    assert build_curve_fit_history({})["dates"] == []
+
+
+def test_curve_fit_history_warm_starts_from_previous_run(monkeypatch):
+    yields = _ns_yields(30)
+    dates = [f"2024-01-{day:02d}" for day in range(1, 31)]
+
+    def history(days):
+        return {"yield_curve": {"tenors": list(TENOR_YEARS), "dates": dates[:days], "values": yields[:days].T.tolist()}}
+
+    first = build_curve_fit_history(history(20))
+    assert first["warm_started"] == 0
+
+    grid_rows = []
+    real_sse = curve_fitting._sse
+
+    def _counting_sse(model, tau, lambdas, values, weights):
+        if lambdas.shape[0] != 30:
+            grid_rows.append(lambdas.shape[0])
+        return real_sse(model, tau, lambdas, values, weights)
+
+    monkeypatch.setattr(curve_fitting, "_sse", _counting_sse)
+    second = build_curve_fit_history(history(30), previous=first)
+    assert second["warm_started"] == 30 and grid_rows == []
+    assert max(second["rmse_bps"][:20]) < 0.5
+    assert all(value is not None for value in second["rmse_bps"][20:])
+    assert build_curve_fit_history(history(30), model="svensson", previous=first)["warm_started"] == 0
+
+
+def test_curve_fit_base_is_abstract():
+    with pytest.raises(TypeError):
+        curve_fitting._CurveFit()
@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+DASHBOARD = str(Path(__file__).resolve().parents[1] / "UI" / "dashboard.py")
+
+
+def test_only_active_tab_renders(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "signals").mkdir()
+    (tmp_path / "signals" / "daily_state.json").write_text(
+        json.dumps({"system_health": {"blocks": {}, "generated_at": "2026-01-02T00:00:00+00:00"}})
+    )
+    at = AppTest.from_file(DASHBOARD, default_timeout=60)
+    at.run()
+    assert not at.exception
+    assert [header.value for header in at.header] == ["Yield Curve"]
+
+    at.radio(key="active_tab").set_value("⚡ Volatility & Risk")
+    at.run()
+    assert [header.value for header in at.header] == ["Volatility", "Credit Detail (Evidence-Only)"]
+    assert set(at.session_state["panel_timings_ms"]) >= {
+        "render_yield_curve_panel",
+        "render_volatility_panel",
+        "render_credit_panel",
+    }
+    assert "render_fx_panel" not in at.session_state["panel_timings_ms"]
+
+
+def test_policy_and_liquidity_charts_hit_the_memo_on_rerun(tmp_path, monkeypatch):
+    from UI.view_models import clear_memos, memo_stats
+
+    monkeypatch.chdir(tmp_path)
+    signals = tmp_path / "signals"
+    signals.mkdir()
+    (signals / "daily_state.json").write_text(
+        json.dumps(
+            {
+                "system_health": {"blocks": {}, "generated_at": "2026-01-02T00:00:00+00:00"},
+                "policy_futures_curve": {"curve_lines": {"tenors": ["ZQF26"], "current": [96.3]}},
+                "liquidity_analytics": {"rrp": {"level": 3.0}},
+            }
+        )
+    )
+    dates = ["2025-12-29", "2025-12-30", "2025-12-31"]
+    (signals / "history_state.json").write_text(
+        json.dumps({"series": {"rrp": {"dates": dates, "values": [1.0, 2.0, 3.0]}}})
+    )
+    (signals / "zq_constant_maturity.json").write_text(
+        json.dumps({"series": {"3M": {"dates": dates, "values": [3.6, 3.7, 3.8]}}})
+    )
+    clear_memos()
+    at = AppTest.from_file(DASHBOARD, default_timeout=60)
+    at.run()
+    at.radio(key="active_tab").set_value("🏦 Policy & Liquidity")
+    for _ in range(3):
+        at.run()
+        assert not at.exception
+
+    stats = memo_stats()
+    # One build per chart; the history and ZQ charts no longer evict each other.
+    assert stats["charts"]["misses"] == 1 and stats["charts"]["hits"] == 2
+    assert stats["charts:zq_constant_maturity"]["misses"] == 1
+    assert stats["charts:zq_constant_maturity"]["hits"] == 2
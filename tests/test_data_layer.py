@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+
+from UI.data_layer import EMPTY, StateCache, thaw
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_hits_until_file_changes(tmp_path):
+    path = tmp_path / "daily_state.json"
+    _write(path, {"a": {"values": [1, 2]}}, mtime_ns=1_000_000_000)
+    cache = StateCache()
+    first = cache.load(path)
+    assert cache.load(path) is first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    generation = cache.generation(path)
+
+    _write(path, {"a": {"values": [1, 2]}}, mtime_ns=2_000_000_000)
+    assert cache.load(path) is first
+    assert cache.stats.revalidations == 1
+
+    _write(path, {"a": {"values": [3]}}, mtime_ns=3_000_000_000)
+    second = cache.load(path)
+    assert second["a"]["values"] == [3]
+    assert cache.generation(path) != generation
+    assert cache.stats.as_dict()["files"][str(path)]["bytes"] == path.stat().st_size
+
+
+def test_views_are_read_only_but_look_like_plain_json(tmp_path):
+    path = tmp_path / "history_state.json"
+    _write(path, {"series": {"x": {"dates": ["2024-01-02"], "values": [[1.0, None]]}}})
+    data = StateCache().load(path)
+    series = data["series"]["x"]
+    assert isinstance(data, dict) and isinstance(series["values"], list)
+    assert json.loads(json.dumps(data)) == thaw(data)
+    with pytest.raises(TypeError):
+        data["series"] = {}
+    with pytest.raises(TypeError):
+        series["dates"].append("2024-01-03")
+    with pytest.raises(TypeError):
+        series["values"][0][0] = 2.0
+    copy = thaw(data)
+    copy["series"]["x"]["dates"].append("2024-01-03")
+    assert data["series"]["x"]["dates"] == ["2024-01-02"]
+
+
+def test_missing_or_partial_files(tmp_path):
+    path = tmp_path / "daily_state.json"
+    cache = StateCache()
+    assert cache.load(path) is EMPTY
+    _write(path, {"ok": True}, mtime_ns=1_000_000_000)
+    good = cache.load(path)
+    path.write_text('{"ok": tr', encoding="utf-8")
+    assert cache.load(path) is good
+    path.unlink()
+    assert cache.load(path) is EMPTY
@@ -0,0 +1,140 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from Analytics.yield_curve_analytics import TENOR_ORDER
+from Data import fetch_engine
+from Signals import series_registry
+from Signals.series_registry import SeriesSpec, parse
+
+
+def _prices(ticker, period="1y", start_date=None, end_date=None):
+    if ticker.startswith("BAD"):
+        raise ValueError(f"no history for {ticker}")
+    dates = pd.date_range("2024-01-01", periods=40, freq="D")
+    return pd.DataFrame({"date": dates, "close": [100.0 + i for i in range(40)]})
+
+
+def _fred(series_id, start_date=None, end_date=None, api_key=None):
+    dates = pd.date_range("2023-01-01", periods=24, freq="MS")
+    return pd.DataFrame({"date": dates.strftime("%Y-%m-%d"), "value": [300.0 + i for i in range(24)]})
+
+
+def test_shipped_registry_covers_raw_state_and_history():
+    registry = series_registry.registry()
+    assert [section.name for section in registry.sections if section.health] == [
+        "policy",
+        "duration",
+        "volatility",
+        "liquidity",
+    ]
+    assert registry.spec("fx", "usdcnh").fallbacks == (("yfinance", "CNY=X"),)
+    assert registry.spec("labor_market", "eci").cadence == "quarterly"
+    assert registry.find("fred", "CPILFESL").label == "inflation_witnesses.cpi_core"
+    assert [spec.key for spec in registry.history][:2] == ["rrp", "tga"]
+    # The history curve follows the daily panel's tenors and raw_state's duration ids.
+    assert [(spec.key, spec.series_id) for spec in registry.curve] == [
+        (tenor, registry.spec("duration", key).series_id) for tenor, key in TENOR_ORDER
+    ]
+
+
+@pytest.mark.parametrize(
+    "entry, message",
+    [
+        ({"key": "x", "provider": "bloomberg", "id": "X"}, "provider"),
+        ({"key": "x", "provider": "manual"}, "need a fetcher"),
+        ({"key": "x", "provider": "fred", "id": "X", "cadence": "hourly"}, "cadence"),
+        ({"key": "x", "provider": "fred", "id": "X", "fallbacks": [{"id": "Y"}]}, "fallbacks"),
+    ],
+)
+def test_parse_rejects_bad_entries(entry, message):
+    with pytest.raises(ValueError, match=message):
+        parse({"raw_state": [{"section": "extra", "series": [entry]}]})
+
+
+def test_config_only_series_fetch_with_fallback(monkeypatch):
+    monkeypatch.setattr("Data.yfinance_provider.fetch_price_history", _prices)
+    spec = SeriesSpec("pair", "yfinance", "BAD=X", section="fx", fallbacks=(("yfinance", "GOOD=X"),))
+    out = fetch_engine.fetch_series(spec)
+    assert out["status"] == "OK" and out["source"] == "yfinance"
+    assert out["meta"]["series_id"] == "GOOD=X"
+    assert out["meta"]["current"] == 139.0 and out["meta"]["year_high"] == 139.0
+    assert out["error"] == "BAD=X unavailable; used GOOD=X proxy"
+
+    failed = fetch_engine.fetch_series(SeriesSpec("pair", "yfinance", "BAD1=X", fallbacks=(("yfinance", "BAD2=X"),)))
+    assert failed["status"] == "FAILED" and failed["value"] is None
+    assert failed["error"].startswith("BAD1=X fetch failed") and "BAD2=X fetch failed" in failed["error"]
+
+    missing = fetch_engine.fetch_series(SeriesSpec("gbp", "fred", None, section="policy_rates"))
+    assert missing["status"] == "FAILED" and missing["error"] == "policy_rates.gbp series_id not configured"
+
+
+def test_monthly_cadence_adds_year_ago(monkeypatch):
+    monkeypatch.setattr("Data.utils.fred_provider._try_openbb_fred", _fred)
+    cpi = series_registry.registry().spec("policy", "cpi_level")
+    value, meta, status, source = fetch_engine.fred_snapshot("CPIAUCSL", spec=cpi)
+    assert (value, status, source) == (323.0, "OK", "openbb:fred")
+    assert meta["year_ago"] == 311.0 and meta["as_of_year_ago"] == "2023-12-01"
+    _, daily, _, _ = fetch_engine.fred_snapshot("CPIAUCSL", spec=SeriesSpec("cpi", "fred", "CPIAUCSL"))
+    assert "year_ago" not in daily
+
+
+def test_lookback_follows_the_spec_being_fetched(monkeypatch):
+    starts = []
+
+    def _fred_from(series_id, start_date=None, end_date=None, api_key=None):
+        starts.append((series_id, start_date))
+        if series_id == "BAD":
+            raise ValueError("down")
+        return _fred(series_id)
+
+    monkeypatch.setattr("Data.utils.fred_provider._try_openbb_fred", _fred_from)
+    monkeypatch.setattr("Data.utils.fred_provider._try_fred_http", _fred_from)
+    # Same id, different cadence: each spec sizes its own window.
+    monthly = fetch_engine.fetch_series(SeriesSpec("a", "fred", "SAME", cadence="monthly"))
+    daily = fetch_engine.fetch_series(SeriesSpec("b", "fred", "SAME"))
+    assert "year_ago" in monthly["meta"] and "year_ago" not in daily["meta"]
+    assert starts[0][1] < starts[1][1]
+
+    # A fallback id is fetched with its primary's cadence, as are module snapshot callables.
+    proxied = fetch_engine.fetch_series(SeriesSpec("c", "fred", "BAD", cadence="quarterly", fallbacks=(("fred", "PROXY"),)))
+    assert proxied["meta"]["series_id"] == "PROXY" and "year_ago" in proxied["meta"]
+    wrapped = fetch_engine.fetch_series(SeriesSpec("d", "fred", "X", cadence="monthly"), lambda sid: fetch_engine.fred_snapshot(sid))
+    assert "year_ago" in wrapped["meta"]
+
+
+def test_fetch_sections_batches_by_provider(monkeypatch):
+    monkeypatch.setattr("Data.yfinance_provider.fetch_price_history", _prices)
+    monkeypatch.setattr("Data.utils.fred_provider._try_openbb_fred", _fred)
+    registry = parse(
+        {
+            "raw_state": [
+                {
+                    "section": "extra",
+                    "series": [
+                        {"key": "cpi", "provider": "fred", "id": "CPIAUCSL", "cadence": "monthly"},
+                        {"key": "spx", "provider": "yfinance", "id": "^GSPC"},
+                        {"key": "curve", "provider": "custom", "fetcher": "fetch_policy_curve.fetch_policy_curve"},
+                        {"key": "zq", "provider": "yfinance", "id": None, "expand": "contracts"},
+                    ],
+                }
+            ]
+        }
+    )
+    threads = {}
+
+    def _call(fn):
+        threads.setdefault(fn.__name__, threading.current_thread().name)
+        return fn()
+
+    sections = fetch_engine.fetch_sections(registry, _call, {"contracts": lambda: ["ZQZ25.CBT", "BADZ5.CBT"]})
+    extra = sections["extra"]
+    assert list(extra) == ["cpi", "spx", "curve", "zq"]
+    assert extra["cpi"]["status"] == "OK" and extra["spx"]["meta"]["series_id"] == "^GSPC"
+    assert extra["curve"]["status"] == "FAILED"
+    assert extra["zq"]["ZQZ25.CBT"]["status"] == "OK" and extra["zq"]["BADZ5.CBT"]["status"] == "FAILED"
+    assert threads["extra.spx"] == threads["extra.zq"] != threads["extra.cpi"]
+
+    inline = fetch_engine.fetch_sections(registry, _call, {"contracts": lambda: []}, workers=0)
+    assert inline["extra"]["zq"] == {} and inline["extra"]["cpi"]["value"] == 323.0
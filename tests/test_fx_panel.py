@@ -167,3 +167,34 @@ def test_writer_preserves_other_blocks(tmp_path):
     data = json.loads(daily_path.read_text())
     assert "fx" in data
     assert data["policy"]["spot_stance"] == "Neutral"
+
+
+def test_matrices_cover_all_anchors_and_currencies():
+    raw_state = {
+        "global_policy": {},
+        "fx": {
+            "eurusd": _entry(1.10, last_week=1.08, last_month=1.00, last_6m=1.05, start_of_year=1.12),
+            "usdjpy": _entry(150.0, last_week=148.0, last_month=140.0, last_6m=None, start_of_year=141.0),
+            "usdmxn": _entry(17.0, last_week=17.5, last_month=18.0, last_6m=17.2, start_of_year=16.9),
+        },
+        "policy": {"effr": _policy_entry(5.25)},
+        "policy_rates": {},
+    }
+    out = build_fx_panel(raw_state)
+    matrices = out["matrices_pct"]
+    assert set(matrices) == {"1W", "1M", "6M", "SOY"}
+    one_month = matrices["1M"]
+    assert len(one_month["currencies"]) == 12
+    ccys = one_month["currencies"]
+    eur, jpy, mxn, usd = (ccys.index(c) for c in ("EUR", "JPY", "MXN", "USD"))
+    assert one_month["values_pct"][eur][usd] == pytest.approx((1.10 / 1.00 - 1) * 100)
+    eur_mxn_now = 1.10 * 17.0
+    eur_mxn_1m = 1.00 * 18.0
+    assert one_month["values_pct"][eur][mxn] == pytest.approx((eur_mxn_now / eur_mxn_1m - 1) * 100)
+    assert matrices["6M"]["values_pct"][jpy][usd] is None
+    assert one_month["data_quality"] == "PARTIAL"
+
+    legacy = out["matrix_1m_pct"]
+    for i, base in enumerate(legacy["currencies"]):
+        for j, quote in enumerate(legacy["currencies"]):
+            assert legacy["values_pct"][i][j] == one_month["values_pct"][ccys.index(base)][ccys.index(quote)]
@@ -1,5 +1,5 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from math import inf, nan
 
 from History import history_state
@@ -35,3 +35,72 @@ def test_history_state_sanitizes_nan_inf(tmp_path, monkeypatch):
     series_entry = data["series"].get("vix", {})
     assert "dates" in series_entry
     assert "values" in series_entry
+
+
+def _synthetic_records(seed, count=300):
+    start = datetime(2020, 1, 1)
+    return [
+        (start + timedelta(days=idx), 100.0 + seed + ((idx * 7 + seed) % 13) - idx * 0.01)
+        for idx in range(count)
+    ]
+
+
+def test_parallel_build_matches_sequential(monkeypatch):
+    def _fred(series_id, years=5):
+        return _synthetic_records(len(series_id)), "fred_http", "OK"
+
+    def _yf(ticker, years=5):
+        return _synthetic_records(len(ticker) * 3), "yfinance", "OK"
+
+    monkeypatch.setattr(history_state, "_fetch_fred_history", _fred)
+    monkeypatch.setattr(history_state, "_fetch_yfinance_history", _yf)
+    monkeypatch.setattr(history_state, "_now_iso", lambda: "2024-01-01T00:00:00+00:00")
+
+    sequential = history_state.build_history_state(fetch_workers=1, transform_workers=1)
+    parallel = history_state.build_history_state(fetch_workers=6, transform_workers=3)
+    assert list(parallel["series"]) == list(sequential["series"])
+    assert list(parallel["transforms"]) == list(sequential["transforms"])
+    assert json.dumps(parallel, sort_keys=True) == json.dumps(sequential, sort_keys=True)
+
+
+def test_parallel_build_keeps_fallbacks(monkeypatch):
+    def _fred(series_id, years=5):
+        return _synthetic_records(1), "fred_http", "OK"
+
+    def _yf(ticker, years=5):
+        if ticker in ("DX-Y.NYB", "CNH=X"):
+            raise ValueError("no history")
+        return _synthetic_records(2), "yfinance", "OK"
+
+    monkeypatch.setattr(history_state, "_fetch_fred_history", _fred)
+    monkeypatch.setattr(history_state, "_fetch_yfinance_history", _yf)
+
+    state = history_state.build_history_state(fetch_workers=4, transform_workers=0)
+    assert state["series"]["dxy"]["series_id"] == "DTWEXBGS"
+    assert state["series"]["dxy"]["source"] == "fred_http"
+    assert state["series"]["usdcnh"]["series_id"] == "CNY=X"
+    assert state["series"]["usdcnh"]["status"] == "OK"
+
+
+def test_yield_curve_matrix_is_columnar_by_tenor(monkeypatch):
+    def _fred(series_id, years=5):
+        if series_id == "DGS30":
+            return [], "fred_http", "FAILED"
+        offset = len(series_id) / 10
+        return [(datetime(2024, 1, day), 4.0 + offset + day / 100) for day in (2, 3, 4)], "fred_http", "OK"
+
+    def _yf(ticker, years=5):
+        return _synthetic_records(2), "yfinance", "OK"
+
+    monkeypatch.setattr(history_state, "_fetch_fred_history", _fred)
+    monkeypatch.setattr(history_state, "_fetch_yfinance_history", _yf)
+
+    state = history_state.build_history_state(fetch_workers=2, transform_workers=0)
+    curve = state["yield_curve"]
+    assert curve["tenors"][0] == "3M" and curve["tenors"][-1] == "30Y"
+    assert curve["dates"] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert len(curve["values"]) == 10
+    assert curve["values"][curve["tenors"].index("10Y")] == [4.52, 4.53, 4.54]
+    assert curve["values"][-1] == [None, None, None]
+    assert curve["status"][-1] == "FAILED"
+    assert "DGS10" not in state["series"]
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+from math import inf, nan
+
+from History import history_state, history_stream
+from Signals.json_utils import write_json
+
+
+def _records(seed, count=400):
+    start = datetime(2020, 1, 1)
+    records = [(start + timedelta(days=idx), 100.0 + seed + ((idx * 7 + seed) % 13) - idx * 0.01) for idx in range(count)]
+    records[seed % count] = (records[seed % count][0], nan)
+    return records
+
+
+def _patch(monkeypatch):
+    def _fred(series_id, years=5):
+        if series_id == "DGS30":
+            raise RuntimeError("down")
+        return _records(len(series_id)), "fred_http", "OK"
+
+    def _yf(ticker, years=5):
+        return _records(len(ticker) * 3) + [(datetime(2021, 6, 1), inf)], "yfinance", "OK"
+
+    monkeypatch.setattr(history_state, "_fetch_fred_history", _fred)
+    monkeypatch.setattr(history_state, "_fetch_yfinance_history", _yf)
+    monkeypatch.setattr(history_state, "_now_iso", lambda: "2024-01-01T00:00:00+00:00")
+
+
+def test_streamed_file_matches_in_memory_build(tmp_path, monkeypatch):
+    _patch(monkeypatch)
+    expected = tmp_path / "expected" / "history_state.json"
+    expected.parent.mkdir()
+    write_json(expected, history_state.build_history_state(fetch_workers=1, transform_workers=1))
+
+    streamed = tmp_path / "history_state.json"
+    summary = history_stream.stream_history_state(streamed, fetch_workers=3, transform_workers=1)
+    assert streamed.read_bytes() == expected.read_bytes()
+    assert summary["bytes"] == streamed.stat().st_size
+    assert summary["series"] == len(history_state._history_plan())
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["expected", "history_correlations.npz", "history_state.json"]
+
+
+def test_empty_objects_match_json_dumps(tmp_path, monkeypatch):
+    _patch(monkeypatch)
+    monkeypatch.setattr(history_state, "_fetch_fred_history", lambda series_id, years=5: ([], "fred_http", "FAILED"))
+    monkeypatch.setattr(history_state, "_fetch_yfinance_history", lambda ticker, years=5: ([], "yfinance", "FAILED"))
+    expected = tmp_path / "expected.json"
+    write_json(expected, history_state.build_history_state(fetch_workers=0, transform_workers=0))
+    streamed = tmp_path / "history_state.json"
+    history_stream.stream_history_state(streamed, fetch_workers=0, transform_workers=0)
+    assert streamed.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
@@ -20,3 +20,9 @@ def test_no_history_state_in_analytics_or_resolvers():
     for path in Path("Analytics").glob("*.py"):
         content = path.read_text(encoding="utf-8")
         assert "history_state.json" not in content
+
+
+def test_resolvers_do_not_import_analytics():
+    for path in Path("Signals").glob("resolve_*.py"):
+        content = path.read_text(encoding="utf-8")
+        assert "from Analytics" not in content and "import Analytics" not in content, path.name
@@ -70,3 +70,46 @@ def test_missing_inputs(tmp_path):
     data = json.loads(path.read_text())
     assert data["policy_curve"]["expected_direction"] == "Hold"
     assert "missing" in data["policy_curve"]["explanation"].lower()
+
+
+def test_futures_implied_path_sets_direction(tmp_path):
+    data = _daily_state(breakeven_change=0.2, sofr=4.0)
+    data["policy_futures_curve"] = {
+        "policy_pricing_proxy": 3.4,
+        "implied_change_12m_bps": -50.0,
+        "direction_threshold_bps": 12.5,
+    }
+    path = tmp_path / "daily_state.json"
+    path.write_text(json.dumps(data))
+    resolve_policy_curve(path)
+    out = json.loads(path.read_text())["policy_curve"]
+    assert out["expected_direction"] == "Easing"
+    assert out["futures_coverage"]["implied_path"] is True
+    assert "futures" in out["explanation"].lower()
+    assert "partial" not in out["explanation"]
+
+
+def test_complete_inputs_without_futures_are_not_missing(tmp_path):
+    path = tmp_path / "daily_state.json"
+    path.write_text(json.dumps(_daily_state(breakeven_change=0.1, proxy=4.2, sofr=4.0, stress="Mixed")))
+    resolve_policy_curve(path)
+    out = json.loads(path.read_text())["policy_curve"]
+    assert set(out["inputs_used"]) == {"inflation_expectations", "policy_pricing", "volatility"}
+    assert "missing" not in out["explanation"].lower()
+    assert out["futures_coverage"]["implied_path"] is False
+
+
+def test_partial_futures_horizon_is_flagged(tmp_path):
+    data = _daily_state(breakeven_change=0.2, sofr=4.0)
+    data["policy_futures_curve"] = {
+        "implied_change_12m_bps": 20.0,
+        "implied_change_horizon_months": 3,
+        "implied_change_partial": True,
+    }
+    path = tmp_path / "daily_state.json"
+    path.write_text(json.dumps(data))
+    resolve_policy_curve(path)
+    out = json.loads(path.read_text())["policy_curve"]
+    assert out["expected_direction"] == "Tightening"
+    assert out["futures_coverage"] == {"implied_path": True, "horizon_months": 3, "partial_horizon": True}
+    assert "next 3 months" in out["explanation"]
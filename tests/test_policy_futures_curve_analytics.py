@@ -1,6 +1,6 @@
 import json
 
-from Analytics.policy_futures_curve import build_policy_futures_curve, write_daily_state
+from Analytics.policy_futures_curve import build_implied_path, build_policy_futures_curve, write_daily_state
 
 
 def _entry(current, start_of_year=None, last_week=None, last_month=None, last_6m=None, status="OK"):
@@ -50,3 +50,27 @@ def test_writer_merges_blocks(tmp_path):
     data = json.loads(daily_path.read_text())
     assert "policy_futures_curve" in data
     assert data["policy"]["spot_stance"] == "Neutral"
+
+
+def test_implied_path_feeds_policy_proxy(tmp_path):
+    zq = {}
+    for ticker, rate in (("ZQF26.CBT", 3.75), ("ZQG26.CBT", 3.75), ("ZQM26.CBT", 3.5), ("ZQN26.CBT", 3.5),
+                         ("ZQQ26.CBT", 3.5), ("ZQU26.CBT", 3.5), ("ZQV26.CBT", 3.25), ("ZQX26.CBT", 3.25)):
+        zq[ticker] = _entry(100 - rate, last_week=100 - rate)
+    raw_state = {
+        "policy_futures": {"zq": zq},
+        "policy": {"effr": {"value": 3.75, "meta": {"current": 3.75, "last_week": 3.75}}},
+    }
+    out = build_policy_futures_curve(raw_state)
+    implied = out["implied_path"]
+    assert implied["anchors"]["current"]["implied_rates"][0] == 3.75
+    assert implied["anchors"]["start_of_year"]["implied_rates"][0] is None
+    assert out["policy_pricing_proxy"] is not None and out["policy_pricing_proxy"] < 3.75
+    assert out["implied_change_12m_bps"] < -12.5
+    # The strip stops at Nov 26, one month short of a full year.
+    assert out["implied_change_horizon_months"] == 11 and out["implied_change_partial"] is True
+    short_calendar = tmp_path / "fomc.json"
+    short_calendar.write_text(json.dumps({"decision_dates": ["2026-01-28", "2026-03-18"]}))
+    implied = build_implied_path(raw_state, out["curve_lines"], short_calendar)
+    assert implied["implied_change_horizon_months"] == 3
+    assert implied["fomc_calendar_ends"] == "2026-03-18"
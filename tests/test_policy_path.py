@@ -0,0 +1,72 @@
+import calendar
+from datetime import date, timedelta
+
+import numpy as np
+
+from Analytics.policy_path import contract_month, implied_path, load_fomc_calendar
+
+
+MEETINGS = [date(2025, 12, 10), date(2026, 1, 28), date(2026, 3, 18), date(2026, 4, 29), date(2026, 6, 17)]
+MONTHS = [(2025, 12), (2026, 1), (2026, 2), (2026, 3), (2026, 4), (2026, 5), (2026, 6)]
+
+
+def _average(month, pre, post, effective_day=None):
+    days = calendar.monthrange(*month)[1]
+    if effective_day is None:
+        return pre
+    before = effective_day - 1
+    return (before * pre + (days - before) * post) / days
+
+
+def _prices():
+    averages = [
+        _average((2025, 12), 4.0, 3.75, 11),
+        3.75,
+        3.75,
+        _average((2026, 3), 3.75, 3.5, 19),
+        3.5,
+        3.5,
+        3.5,
+    ]
+    return 100 - np.array(averages)
+
+
+def test_path_recovers_meeting_changes_for_all_rows():
+    prices = np.stack([_prices(), _prices()])
+    out = implied_path(prices, MONTHS, MEETINGS, spot=np.array([4.0, np.nan]))
+    assert out["meetings"] == [meeting.isoformat() for meeting in MEETINGS]
+    np.testing.assert_allclose(out["change_bps"][0], [-25, 0, -25, 0, 0], atol=1e-9)
+    np.testing.assert_allclose(out["cumulative_bps"][0], [-25, -25, -50, -50, -50], atol=1e-9)
+    np.testing.assert_allclose(out["cut_probability"][0], [1, 0, 1, 0, 0], atol=1e-9)
+    # Without a spot rate the first meeting is unknown; the chain recovers from February.
+    assert np.isnan(out["change_bps"][1][0])
+    np.testing.assert_allclose(out["change_bps"][1][1:], [0, -25, 0, 0], atol=1e-9)
+
+
+def test_partial_pricing_gives_probability_and_unsorted_contracts():
+    half_cut = _average((2026, 3), 3.75, 3.625, 19)
+    months = [(2026, 4), (2026, 2), (2026, 3)]
+    prices = 100 - np.array([[3.625, 3.75, half_cut]])
+    out = implied_path(prices, months, MEETINGS)
+    assert out["months"] == ["2026-02", "2026-03", "2026-04"]
+    np.testing.assert_allclose(out["change_bps"][0][0], -12.5, atol=1e-9)
+    np.testing.assert_allclose(out["cut_probability"][0][0], 0.5, atol=1e-9)
+    assert out["hike_probability"][0][0] == 0.0
+
+
+def test_contract_month_and_calendar(tmp_path):
+    assert contract_month("ZQZ25.CBT") == (2025, 12)
+    assert contract_month("ZQF26.CBT") == (2026, 1)
+    assert contract_month("ESZ25") is None
+    path = tmp_path / "fomc.json"
+    path.write_text('{"decision_dates": ["2026-03-18", "bad", "2026-01-28"]}')
+    assert load_fomc_calendar(path) == [date(2026, 1, 28), date(2026, 3, 18)]
+    assert load_fomc_calendar(tmp_path / "missing.json") == []
+    assert len(load_fomc_calendar()) >= 8
+
+
+def test_shipped_calendar_covers_the_implied_change_horizon():
+    # implied_change_12m_bps needs decision dates a year out; extend config/fomc_calendar.json when this fails.
+    meetings = load_fomc_calendar()
+    assert meetings == sorted(meetings)
+    assert meetings[-1] >= date.today() + timedelta(days=365)
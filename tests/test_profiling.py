@@ -0,0 +1,56 @@
+import json
+import time
+
+import altair as alt
+import pandas as pd
+
+from UI.profiling import log_slow_panel, phase, phase_timed, profile_panel, record_chart
+
+
+def _chart(title):
+    frame = pd.DataFrame({"x": range(20), "y": range(20)})
+    return alt.Chart(frame).mark_line().encode(x="x", y="y").properties(title=title)
+
+
+def test_nested_phases_are_exclusive():
+    @phase_timed("charts")
+    def build_chart():
+        time.sleep(0.02)
+        return _chart("Spec")
+
+    with profile_panel("render_demo_panel", enabled=True) as profile:
+        with phase("frames"):
+            time.sleep(0.02)
+            chart = build_chart()
+        record_chart(chart)
+
+    assert profile.phases_ms["charts"] >= 15
+    # Time inside the nested chart phase is not double-counted as frames.
+    assert profile.phases_ms["frames"] >= 15
+    assert profile.phases_ms["frames"] < 35
+    assert profile.total_ms >= profile.phases_ms["frames"] + profile.phases_ms["charts"]
+    assert profile.charts == 1
+    assert profile.chart_payloads["Spec"] == profile.payload_bytes == len(chart.to_json(indent=None).encode("utf-8"))
+
+
+def test_disabled_profiling_records_nothing():
+    with profile_panel("render_demo_panel", enabled=False) as profile:
+        with phase("frames"):
+            record_chart(_chart("Spec"))
+    assert profile is None
+
+
+def test_only_slow_panels_are_logged(tmp_path, monkeypatch):
+    monkeypatch.setenv("DASHBOARD_RELEASE", "v1.2.0")
+    path = tmp_path / "ui_panel_profile.jsonl"
+    with profile_panel("render_fast_panel", enabled=True) as fast:
+        pass
+    with profile_panel("render_slow_panel", enabled=True) as slow:
+        time.sleep(0.02)
+
+    assert not log_slow_panel(fast, path=path, threshold_ms=10)
+    assert log_slow_panel(slow, path=path, threshold_ms=10)
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [entry["panel"] for entry in entries] == ["render_slow_panel"]
+    assert entries[0]["release"] == "v1.2.0"
+    assert entries[0]["threshold_ms"] == 10
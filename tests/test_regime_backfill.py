@@ -0,0 +1,213 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+from Analytics import credit_transmission, inflation_real_rates, liquidity_analytics, policy_witnesses
+from Analytics import volatility_analytics, yield_curve_analytics
+from Data import fetch_engine
+from History import regime_backfill
+from History.volatility_regime import _classify_regime, _joint_regime
+from Signals.resolve_liquidity_curve import _expected_liquidity, resolve_liquidity_curve
+from Signals.resolve_policy import _apply_funding_tilt, _base_stance, resolve_policy
+from Signals.resolve_vol_credit_cross import _resolve_label, resolve_vol_credit_cross
+from Signals.resolve_yield_curve import _determine_regime, resolve_yield_curve
+from Signals.series_registry import registry
+
+
+def _opt(value):
+    return None if math.isnan(value) else float(value)
+
+
+def _values(rng, size, edges):
+    values = rng.normal(0.0, 1.5, size)
+    values[::7] = rng.choice(edges, size=len(values[::7]))
+    values[::11] = np.nan
+    return values
+
+
+def test_vectorized_rules_match_scalar_rules():
+    rng = np.random.default_rng(7)
+    size = 2000
+    edges = [-0.6, -0.5, -0.4, 0.0, 0.4, 0.5, 0.6, 1.0, 1.4, 1.5, 1.6, 10.0, -5.0, 0.75, 0.25, -0.1, 0.1]
+
+    y3m, y2y, y10y = (rng.uniform(0.0, 5.0, size) for _ in range(3))
+    y10y[::5] = y3m[::5] + rng.choice([-0.1, 0.1, 0.75, 0.0], size=len(y10y[::5]))
+    curve = regime_backfill.yield_curve_labels(y3m, y2y, y10y)
+    for i in range(size):
+        slopes = {"s3m_10y": y10y[i] - y3m[i], "s2y_10y": y10y[i] - y2y[i]}
+        assert curve[i] == _determine_regime(slopes)
+
+    vix, move = _values(rng, size, edges), _values(rng, size, edges)
+    eq, eq_b = regime_backfill.volatility_labels(vix)
+    rt, rt_b = regime_backfill.volatility_labels(move)
+    joint = regime_backfill.joint_volatility_labels(vix, move, eq_b, rt_b)
+    for i in range(size):
+        label_v, boundary_v, _ = _classify_regime(_opt(vix[i]))
+        label_m, boundary_m, _ = _classify_regime(_opt(move[i]))
+        assert (eq[i], bool(eq_b[i])) == (label_v, boundary_v)
+        assert (rt[i], bool(rt_b[i])) == (label_m, boundary_m)
+        assert joint[i] == _joint_regime(_opt(vix[i]), _opt(move[i]), boundary_v, boundary_m)
+
+    real, spread = _values(rng, size, edges), _values(rng, size, [-6.0, -5.0, 10.0, 11.0, 0.0]) * 8
+    stance = regime_backfill.policy_stance_labels(real, spread)
+    liquidity = regime_backfill.expected_liquidity_labels(spread)
+    cross = regime_backfill.vol_credit_cross_labels(vix, move)
+    for i in range(size):
+        expected = _apply_funding_tilt(_base_stance(_opt(real[i])), _opt(real[i]), _opt(spread[i]))
+        assert stance[i] == expected
+        assert liquidity[i] == _expected_liquidity(_opt(spread[i]))
+        assert cross[i] == _resolve_label(_opt(vix[i]), _opt(move[i]))[0]
+
+
+def test_backfill_labels_history_store_as_of():
+    dates = [f"2024-01-{day:02d}" for day in range(1, 21)]
+    rrp = [100.0 - day for day in range(20)]
+    hy = [3.0 + 0.01 * day for day in range(20)]
+    vix = [15.0 + (day % 4) for day in range(20)]
+    history_state = {
+        "series": {
+            "rrp": {"dates": dates, "values": rrp},
+            "hy_oas": {"dates": dates, "values": hy},
+            "vix": {"dates": dates, "values": vix},
+            "real_10y": {"dates": dates[::2], "values": [0.5 + 0.1 * i for i in range(10)]},
+        },
+        "transforms": {
+            "vix": {"zscore_3y": {"dates": dates, "values": [None] * 10 + [1.7] * 10}},
+            "move": {"zscore_3y": {"dates": dates, "values": [None] * 10 + [0.2] * 10}},
+        },
+    }
+    out = regime_backfill.build_regime_backfill(history_state)
+    assert out["dates"] == dates
+    labels = out["labels"]
+    assert labels["liquidity_expected"][:5] == ["Neutral"] * 5
+    assert labels["liquidity_expected"][5:] == ["Injecting"] * 15
+    assert labels["vol_credit_cross"][5] in ("CREDIT_LED", "UNAVAILABLE")
+    assert labels["volatility_joint"][:10] == ["UNAVAILABLE"] * 10
+    assert labels["volatility_joint"][10:] == ["Equity-led stress"] * 10
+    # real_10y observed every other day; odd days carry the prior observation.
+    assert labels["policy_spot_stance"][1] == labels["policy_spot_stance"][0] == "Neutral"
+    assert labels["policy_spot_stance"][-1] == "Restrictive"
+    assert labels["yield_curve"] == [None] * 20
+    assert out["flips"]["volatility_joint"] == 1
+
+
+# (section, key) of every raw_state entry the compared resolvers read, and its history_state source.
+_RAW_INPUTS = {
+    ("duration", "y3m_nominal"): ("curve", "3M"),
+    ("duration", "y2y_nominal"): ("curve", "2Y"),
+    ("duration", "y10_nominal"): ("curve", "10Y"),
+    ("duration", "y10_real"): ("series", "real_10y"),
+    ("policy", "effr"): ("series", "effr"),
+    ("policy_witnesses", "sofr"): ("series", "sofr"),
+    ("liquidity", "rrp_level"): ("series", "rrp"),
+    ("credit_spreads", "hy_oas"): ("series", "hy_oas"),
+    ("volatility", "vix"): ("series", "vix"),
+}
+
+
+def _history_fixture(rng):
+    days = pd.bdate_range("2024-01-01", periods=70)
+    dates = [day.date().isoformat() for day in days]
+    n = len(dates)
+
+    def walk(level, step):
+        return np.round(level + np.cumsum(rng.normal(0.0, step, n)), 4)
+
+    effr = np.round(4.33 + rng.choice([0.0, 0.0, -0.25], n).cumsum() * 0.1, 4)
+    series = {
+        "real_10y": walk(0.6, 0.15),
+        "effr": effr,
+        "sofr": np.round(effr + rng.choice([-0.12, -0.02, 0.0, 0.03, 0.08], n), 4),
+        "rrp": walk(400.0, 15.0),
+        "hy_oas": walk(3.5, 0.05),
+        "vix": walk(16.0, 1.2),
+    }
+    sparse = {"real_10y": 3, "sofr": 4}
+    history = {
+        key: {"dates": dates[:: sparse.get(key, 1)], "values": values[:: sparse.get(key, 1)].tolist()}
+        for key, values in series.items()
+    }
+    short = walk(4.5, 0.05)
+    curve = {"3M": short, "2Y": short + walk(-0.2, 0.08), "10Y": short + walk(0.0, 0.1)}
+    history_state = {
+        "series": history,
+        "yield_curve": {
+            "tenors": list(curve),
+            "dates": dates,
+            "values": [values.tolist() for values in curve.values()],
+        },
+    }
+    return history_state
+
+
+def _scalar_labels(history_state, day, tmp_path, monkeypatch):
+    """Fetch -> analytics -> resolvers on the history truncated at ``day``."""
+    curve = history_state["yield_curve"]
+    frames = {}
+    for (section, key), (kind, name) in _RAW_INPUTS.items():
+        if kind == "curve":
+            dates, values = curve["dates"], curve["values"][curve["tenors"].index(name)]
+        else:
+            dates, values = history_state["series"][name]["dates"], history_state["series"][name]["values"]
+        kept = [(d, v) for d, v in zip(dates, values) if d <= day]
+        frames[registry().spec(section, key).series_id] = pd.DataFrame(
+            {"date": [d for d, _ in kept], "value": [v for _, v in kept], "close": [v for _, v in kept]}
+        )
+    monkeypatch.setattr("Data.utils.fred_provider._try_openbb_fred", lambda series_id, **_: frames[series_id])
+    monkeypatch.setattr("Data.yfinance_provider.fetch_price_history", lambda ticker, **_: frames[ticker])
+
+    raw_state = {}
+    for section, key in _RAW_INPUTS:
+        raw_state.setdefault(section, {})[key] = fetch_engine.fetch_series(registry().spec(section, key))
+    raw_path, daily_path = tmp_path / "raw_state.json", tmp_path / "daily_state.json"
+    raw_path.write_text(json.dumps(raw_state))
+    daily_path.write_text("{}")
+    for module in (
+        yield_curve_analytics,
+        policy_witnesses,
+        inflation_real_rates,
+        liquidity_analytics,
+        volatility_analytics,
+        credit_transmission,
+    ):
+        module.write_daily_state(raw_path, daily_path)
+    for resolver in (resolve_policy, resolve_liquidity_curve, resolve_vol_credit_cross, resolve_yield_curve):
+        daily_state = resolver(daily_path)
+    return {
+        "yield_curve": daily_state["yield_curve"]["regime"],
+        "policy_spot_stance": daily_state["policy"]["spot_stance"],
+        "liquidity_expected": daily_state["liquidity_curve"]["expected_liquidity"],
+        "vol_credit_cross": daily_state["vol_credit_cross"]["label"],
+    }
+
+
+def test_backfill_matches_scalar_pipeline_on_sampled_dates(tmp_path, monkeypatch):
+    history_state = _history_fixture(np.random.default_rng(11))
+    out = regime_backfill.build_regime_backfill(history_state)
+    assert out["inputs_available"]["effr"] and out["inputs_available"]["sofr"]
+
+    compared = set()
+    for index in range(2, len(out["dates"]), 3):
+        expected = _scalar_labels(history_state, out["dates"][index], tmp_path, monkeypatch)
+        for name, label in expected.items():
+            assert out["labels"][name][index] == label, (out["dates"][index], name)
+            compared.add((name, label))
+    # The fixture exercises the funding tilt and both liquidity directions.
+    labels = {label for _, label in compared}
+    assert {"Injecting", "Draining"} <= labels
+    assert {"Restrictive", "Accommodative"} & labels
+
+
+def test_curve_falls_back_to_duration_series():
+    dates = ["2024-01-02", "2024-01-03"]
+    history_state = {
+        "series": {
+            "y3m_nominal": {"dates": dates, "values": [5.0, 4.0]},
+            "y2y_nominal": {"dates": dates, "values": [4.5, 4.2]},
+            "y10_nominal": {"dates": dates, "values": [4.0, 5.0]},
+        }
+    }
+    out = regime_backfill.build_regime_backfill(history_state)
+    assert out["labels"]["yield_curve"] == ["INVERTED", "STEEP"]
@@ -0,0 +1,45 @@
+import json
+
+from UI.report import build_report, write_report
+
+
+def _write_state(root, history=None):
+    signals = root / "signals"
+    signals.mkdir()
+    daily = {
+        "system_health": {"blocks": {"fx": {"status": "OK", "failed": 0, "total": 3}}, "generated_at": "2026-01-02T00:00:00+00:00"},
+        "labor_market": {"unrate_current": 4.1},
+    }
+    (signals / "daily_state.json").write_text(json.dumps(daily))
+    if history is not None:
+        (signals / "history_state.json").write_text(json.dumps(history))
+
+
+def test_report_renders_every_section_statically(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dates = [f"2025-{month:02d}-01" for month in range(1, 13)]
+    _write_state(tmp_path, {"series": {"unrate": {"dates": dates, "values": [4.0] * 12}}})
+
+    html = build_report("1y")
+
+    for anchor in ["rates-inflation", "policy-liquidity", "labor-market", "fx-conditions", "system-health"]:
+        assert f'<section id="{anchor}">' in html
+    assert "could not be rendered" not in html
+    assert "<h2>Yield Curve</h2>" in html and "<h2>Labor Market (Evidence-Only)</h2>" in html
+    # Charts are embedded as Vega-Lite specs with their data inline.
+    specs = json.loads(html.split("const SPECS = ", 1)[1].split(";for (", 1)[0].replace("<\\/", "</"))
+    assert any("2025-12-01" in json.dumps(spec) for spec in specs.values())
+    assert all(f'id="{chart_id}"' in html for chart_id in specs)
+    assert "Raw JSON" not in html
+
+
+def test_write_report_replaces_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_state(tmp_path)
+    target = tmp_path / "out" / "report.html"
+    target.parent.mkdir()
+    target.write_text("stale")
+
+    assert write_report(target) == target
+    assert target.read_text().startswith("<!DOCTYPE html>")
+    assert not list(target.parent.glob(".*.tmp"))
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+import json
+
+import numpy as np
+
+from History import history_state
+from History.series_pyramid import build_levels, build_pyramids, fidelity, lttb_indices, pick_level
+
+
+def _walk(days=1300, seed=3):
+    rng = np.random.default_rng(seed)
+    dates = np.arange(np.datetime64("2021-01-04"), np.datetime64("2021-01-04") + days)
+    values = 4 + np.cumsum(rng.normal(0, 0.04, days))
+    return {"dates": [str(d) for d in dates], "values": [round(float(v), 6) for v in values]}
+
+
+def test_weekly_and_monthly_take_last_observation():
+    block = {
+        "dates": ["2024-01-29", "2024-01-31", "2024-02-01", "2024-02-02", "2024-02-05"],
+        "values": [1.0, 2.0, None, 3.0, 4.0],
+    }
+    levels = build_levels(block)
+    assert levels["weekly"] == {"dates": ["2024-02-02", "2024-02-05"], "values": [3.0, 4.0]}
+    assert levels["monthly"] == {"dates": ["2024-01-31", "2024-02-05"], "values": [2.0, 4.0]}
+    assert build_levels({"dates": [], "values": []})["lttb"] == {"dates": [], "values": []}
+
+
+def test_lttb_keeps_budget_endpoints_and_shape():
+    block = _walk()
+    levels = build_levels(block, points=400)
+    reduced = levels["lttb"]
+    assert len(reduced["dates"]) == 400
+    assert reduced["dates"][0] == block["dates"][0] and reduced["dates"][-1] == block["dates"][-1]
+
+    # Fidelity budget, as a share of the series' vertical range.
+    lttb = fidelity(block, reduced)
+    assert lttb["nrmse"] < 0.01
+    assert lttb["max_error"] < 0.05
+    assert lttb["extreme_error"] < 0.005
+    assert fidelity(block, levels["weekly"])["nrmse"] < 0.03
+    assert fidelity(block, levels["monthly"])["nrmse"] < 0.06
+
+    # LTTB beats naive decimation at the same point count.
+    stride = np.linspace(0, len(block["dates"]) - 1, 400).astype(int)
+    naive = {"dates": [block["dates"][i] for i in stride], "values": [block["values"][i] for i in stride]}
+    assert lttb["nrmse"] < fidelity(block, naive)["nrmse"]
+    assert lttb["extreme_error"] < fidelity(block, naive)["extreme_error"]
+
+
+def test_lttb_short_inputs_pass_through():
+    x = np.arange(5, dtype=float)
+    assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_pick_level_fits_window_budget():
+    block = _walk(days=1900)
+    levels = build_levels(block, points=500)
+    assert pick_level(block, levels, 365)[0] == "daily"
+    assert pick_level(block, levels, 1095)[0] == "lttb"
+    assert pick_level(block, levels, 1825)[0] == "lttb"
+    assert pick_level(block, levels, 1825, budget=100)[0] == "monthly"
+    assert pick_level(block, {}, 1825)[0] == "daily"
+
+
+def test_build_pyramids_mirrors_history_layout():
+    block = _walk(days=50)
+    out = build_pyramids(
+        {"vix": {**block, "status": "OK"}},
+        {"vix": {"zscore_3y": block}, "broken": None},
+        {"move_vix_z_spread": block, "correlations": {"latest": {}}},
+        points=20,
+    )
+    assert set(out["series"]["vix"]) == {"weekly", "monthly", "lttb"}
+    assert len(out["transforms"]["vix"]["zscore_3y"]["lttb"]["dates"]) == 20
+    assert list(out["cross_asset"]) == ["move_vix_z_spread"]
+    assert "broken" not in out["transforms"]
+
+
+def test_history_state_writes_pyramids(tmp_path, monkeypatch):
+    def _records(provider):
+        def fetch(series_id, years=5):
+            start = datetime(2024, 1, 1)
+            return [(start + timedelta(days=idx), 100.0 + idx % 7) for idx in range(40)], provider, "OK"
+
+        return fetch
+
+    monkeypatch.setattr(history_state, "_fetch_fred_history", _records("fred_http"))
+    monkeypatch.setattr(history_state, "_fetch_yfinance_history", _records("yfinance"))
+    out_path = tmp_path / "history_state.json"
+    history_state.write_history_state(path=out_path)
+    pyramids = json.loads(out_path.read_text(encoding="utf-8"))["pyramids"]
+    assert set(pyramids["series"]["vix"]) == {"weekly", "monthly", "lttb"}
+    assert pyramids["series"]["vix"]["weekly"]["dates"][-1] == "2024-02-09"
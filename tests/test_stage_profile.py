@@ -0,0 +1,69 @@
+import json
+import threading
+
+import pytest
+
+from Signals import stage_profile
+from Signals.json_utils import sanitize_data
+
+
+def _work(n):
+    return sanitize_data({"values": [float(i) for i in range(n)]})
+
+
+def _in_stage(name):
+    with stage_profile.stage(name):
+        _work(10)
+
+
+def test_stage_outside_a_session_just_runs():
+    with stage_profile.stage("alone") as span:
+        span.set(rows=1)
+        assert _work(10)["values"][-1] == 9.0
+
+
+def test_session_profiles_each_outermost_stage(tmp_path):
+    with stage_profile.session(tmp_path, "update", top=5) as profile:
+        with stage_profile.stage("history.transform_all"):
+            _work(20000)
+            with stage_profile.stage("nested"):
+                _work(100)
+        with pytest.raises(ValueError):
+            with stage_profile.stage("fails"):
+                raise ValueError("boom")
+        worker = threading.Thread(target=_in_stage, args=("other-thread",))
+        worker.start()
+        worker.join()
+    assert not stage_profile._SESSION
+
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    stages = {entry["stage"]: entry for entry in summary["stages"]}
+    assert list(stages) == ["history.transform_all", "fails"]
+    transform = stages["history.transform_all"]
+    assert (tmp_path / transform["pstats"]).exists()
+    assert transform["peak_mib"] > 0 and transform["seconds"] > 0
+    assert 0 < len(transform["top_functions"]) <= 5
+    assert any("sanitize_data" in row["function"] for row in transform["top_functions"])
+    assert transform["top_allocations"] == []
+    assert stages["fails"]["error"] == "ValueError: boom"
+    assert any("sanitize_data" in row["function"] for row in summary["hot_functions"])
+    report = (tmp_path / "report.txt").read_text(encoding="utf-8")
+    assert "history.transform_all" in report and "Hottest functions" in report
+    assert profile.stages == summary["stages"]
+
+
+def test_allocation_sites_are_opt_in(tmp_path):
+    with stage_profile.session(tmp_path, allocations=True):
+        with stage_profile.stage("alloc"):
+            kept = _work(50000)
+    entry = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))["stages"][0]
+    assert entry["top_allocations"] and entry["net_mib"] > 0
+    assert len(kept["values"]) == 50000
+
+
+def test_session_for_maps_the_cli_flag(tmp_path):
+    with stage_profile.session_for("update", None) as profile:
+        assert profile is None
+    with stage_profile.session_for("update", str(tmp_path / "out")) as profile:
+        assert profile.directory == tmp_path / "out"
+    assert (tmp_path / "out" / "report.txt").exists()
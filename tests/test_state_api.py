@@ -0,0 +1,90 @@
+import gzip
+import io
+import json
+import os
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from UI.state_api import StateAPI, serve_in_thread
+
+
+DATES = [f"2024-{month:02d}-01" for month in range(1, 13)] + [f"2025-{month:02d}-01" for month in range(1, 13)]
+
+
+@pytest.fixture()
+def api_server(tmp_path):
+    daily = tmp_path / "daily_state.json"
+    history = tmp_path / "history_state.json"
+    daily.write_text(json.dumps({"fx": {"matrix_1m_pct": {"anchor": "1M", "currencies": ["USD", "EUR"]}}}))
+    history.write_text(
+        json.dumps(
+            {
+                "series": {"dxy": {"series_id": "DX-Y.NYB", "dates": DATES, "values": list(range(24))}},
+                "yield_curve": {"tenors": ["2Y", "10Y"], "dates": DATES, "values": [[1.0] * 24, [2.0] * 24]},
+                "pyramids": {"series": {"dxy": {"monthly": {"dates": DATES[::3], "values": list(range(0, 24, 3))}}}},
+            }
+        )
+    )
+    server = serve_in_thread(StateAPI(daily, history))
+    yield f"http://127.0.0.1:{server.server_address[1]}", daily
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url, **headers):
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers, exc.read()
+
+
+def test_blocks_and_windowed_series(api_server):
+    base, _ = api_server
+    status, _, body = _get(f"{base}/daily/fx/matrix_1m_pct")
+    assert status == 200 and json.loads(body)["currencies"] == ["USD", "EUR"]
+
+    status, _, body = _get(f"{base}/history/series/dxy?window=1y")
+    series = json.loads(body)
+    assert series["dates"] == DATES[11:] and series["values"] == list(range(11, 24))
+    assert series["series_id"] == "DX-Y.NYB"
+
+    _, _, body = _get(f"{base}/history/yield_curve?start=2025-06-01&end=2025-08-01")
+    curve = json.loads(body)
+    assert curve["dates"] == ["2025-06-01", "2025-07-01", "2025-08-01"]
+    assert curve["values"] == [[1.0] * 3, [2.0] * 3]
+
+    _, _, body = _get(f"{base}/history/series/dxy?level=monthly&days=200")
+    assert json.loads(body)["dates"] == ["2025-04-01", "2025-07-01", "2025-10-01"]
+
+    status, headers, body = _get(f"{base}/history/series/dxy?format=npz&window=1y")
+    arrays = np.load(io.BytesIO(body))
+    assert headers["Content-Type"] == "application/x-npz"
+    assert str(arrays["dates"][0]) == "2024-12-01" and arrays["values"].tolist() == list(range(11, 24))
+
+    assert _get(f"{base}/history/series/missing")[0] == 404
+    assert _get(f"{base}/history/series/dxy?window=2y")[0] == 400
+    assert _get(f"{base}/daily/fx?days=5")[0] == 400
+
+
+def test_etag_gzip_and_reload(api_server, monkeypatch):
+    monkeypatch.setattr("UI.state_api.GZIP_MIN_BYTES", 64)
+    base, daily = api_server
+    status, headers, body = _get(f"{base}/history/series/dxy", **{"Accept-Encoding": "gzip"})
+    assert status == 200 and headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body))["values"] == list(range(24))
+
+    etag = headers["ETag"]
+    status, _, body = _get(f"{base}/history/series/dxy", **{"If-None-Match": etag})
+    assert status == 304 and body == b""
+
+    first = _get(f"{base}/daily/fx/matrix_1m_pct")[1]["ETag"]
+    daily.write_text(json.dumps({"fx": {"matrix_1m_pct": {"anchor": "1M", "currencies": ["USD", "JPY"]}}}))
+    os.utime(daily, ns=(1, 1))  # a new generation even if written within the same mtime tick
+    status, headers, body = _get(f"{base}/daily/fx/matrix_1m_pct", **{"If-None-Match": first})
+    assert status == 200 and headers["ETag"] != first
+    assert json.loads(body)["currencies"] == ["USD", "JPY"]
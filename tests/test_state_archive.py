@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from Signals.state_archive import StateArchive, archive_run
+
+
+def _run(idx, vix):
+    raw = {
+        "meta": {"generated_at": f"2024-01-02T{idx:02d}:00:00+00:00"},
+        "volatility": {"vix": {"value": vix, "status": "OK", "meta": {"current": vix}}},
+        "fx": {"eurusd": {"value": 1.08, "status": "OK", "meta": {"current": 1.08}}},
+    }
+    daily = {
+        "volatility_regime": {"equity": "Stress" if vix > 20 else "Calm", "computed_at": f"t{idx}"},
+        "fx": {"matrix_1m_pct": {"currencies": ["USD", "EUR"], "values_pct": [[0.0, -1.0], [1.0, 0.0]]}},
+    }
+    if idx % 3 == 0:
+        daily["disagreements"] = {"policy_vs_liquidity": {"flag": True}}
+    return raw, daily
+
+
+def test_archive_round_trips_every_run(tmp_path):
+    archive = StateArchive(tmp_path / "archive", keyframe_interval=4)
+    runs = [_run(idx, 15.0 + idx) for idx in range(11)]
+    for raw, daily in runs:
+        archive.append(raw, daily)
+
+    reopened = StateArchive(tmp_path / "archive", keyframe_interval=4)
+    assert len(reopened) == 11
+    for idx, (raw, daily) in enumerate(runs):
+        snap = reopened.snapshot(raw["meta"]["generated_at"])
+        assert snap["raw"] == raw
+        assert snap["daily"] == daily
+        assert reopened.block("daily", "volatility_regime", raw["meta"]["generated_at"]) == daily["volatility_regime"]
+        expected_flags = daily.get("disagreements")
+        assert reopened.block("daily", "disagreements", raw["meta"]["generated_at"]) == expected_flags
+
+
+def test_archive_lookup_is_as_of_and_rejects_older_runs(tmp_path):
+    archive = StateArchive(tmp_path / "archive")
+    for idx in (1, 5):
+        archive.append(*_run(idx, 18.0 + idx))
+    snap = archive.snapshot("2024-01-02T03:30:00+00:00")
+    assert snap["generated_at"] == "2024-01-02T01:00:00+00:00"
+    with pytest.raises(LookupError):
+        archive.snapshot("2023-12-31T00:00:00+00:00")
+    with pytest.raises(ValueError):
+        archive.append(*_run(2, 10.0))
+
+
+def test_unchanged_blocks_are_not_rewritten(tmp_path):
+    archive = StateArchive(tmp_path / "archive")
+    raw, daily = _run(1, 12.0)
+    archive.append(raw, daily)
+    first_size, _ = archive.size_bytes()
+    raw2 = json.loads(json.dumps(raw))
+    raw2["meta"]["generated_at"] = "2024-01-02T02:00:00+00:00"
+    entry = archive.append(raw2, daily)
+    assert set(entry["blocks"]) == {"raw/meta"}
+    assert archive.size_bytes()[0] - first_size < 100
+
+
+def test_archive_run_reads_state_files(tmp_path):
+    raw, daily = _run(1, 22.0)
+    (tmp_path / "raw_state.json").write_text(json.dumps(raw))
+    (tmp_path / "daily_state.json").write_text(json.dumps(daily))
+    archive_run(tmp_path / "raw_state.json", tmp_path / "daily_state.json", tmp_path / "archive")
+    assert StateArchive(tmp_path / "archive").block("daily", "fx") == daily["fx"]
+
+
+def test_legacy_index_is_caught_up_and_bisected(tmp_path):
+    archive = StateArchive(tmp_path / "archive", keyframe_interval=3)
+    runs = [_run(idx, 15.0 + idx) for idx in range(7)]
+    for raw, daily in runs:
+        archive.append(raw, daily)
+    # An archive written before index.pos existed, with a torn trailing line.
+    (tmp_path / "archive" / "index.pos").unlink()
+    with (tmp_path / "archive" / "index.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"generated_at": "2024-01-0')
+
+    reopened = StateArchive(tmp_path / "archive", keyframe_interval=3)
+    assert reopened.timestamps() == [raw["meta"]["generated_at"] for raw, _ in runs]
+    assert reopened.locate("2024-01-02T04:30:00+00:00") == 4
+    assert reopened.snapshot("2024-01-02T05:00:00+00:00")["raw"] == runs[5][0]
+    assert StateArchive(tmp_path / "archive").locate() == 6
+
+    # The next append drops the torn bytes instead of gluing its line onto them.
+    raw, daily = _run(7, 22.0)
+    reopened.append(raw, daily)
+    (tmp_path / "archive" / "index.pos").unlink()  # rebuilt from index.jsonl lines alone
+    again = StateArchive(tmp_path / "archive", keyframe_interval=3)
+    assert len(again) == 8 and again.snapshot()["raw"] == raw
+    assert (tmp_path / "archive" / "index.jsonl").read_bytes().endswith(b"}\n")
@@ -0,0 +1,35 @@
+import json
+
+from Signals.state_manifest import file_digest, load_manifest, publish_manifest
+
+
+def test_manifest_bumps_only_on_change_and_lists_changed_blocks(tmp_path):
+    daily = tmp_path / "daily_state.json"
+    history = tmp_path / "history_state.json"
+    manifest_path = tmp_path / "state_manifest.json"
+    sources = {"daily_state": daily, "history_state": history}
+    daily.write_text(json.dumps({"fx": {"dxy": 1}, "labor_market": {"unrate": 4.0}}))
+    history.write_text(json.dumps({"series": {}}))
+
+    first = publish_manifest(manifest_path, sources)
+    assert first["generation"] == 1
+    assert first["files"]["daily_state"]["digest"] == file_digest(daily.read_bytes())
+    assert first["changed"] == {"daily_state": ["fx", "labor_market"], "history_state": True}
+
+    # Same content: nothing is rewritten and the generation holds.
+    mtime = manifest_path.stat().st_mtime_ns
+    assert publish_manifest(manifest_path, sources)["generation"] == 1
+    assert manifest_path.stat().st_mtime_ns == mtime
+
+    daily.write_text(json.dumps({"fx": {"dxy": 2}, "labor_market": {"unrate": 4.0}}))
+    second = publish_manifest(manifest_path, sources)
+    assert second["generation"] == 2
+    assert second["changed"] == {"daily_state": ["fx"], "history_state": False}
+    assert load_manifest(manifest_path) == second
+
+    # The ZQ constant-maturity file counts as history for watchers.
+    strip = tmp_path / "zq_constant_maturity.json"
+    strip.write_text(json.dumps({"series": {}}))
+    third = publish_manifest(manifest_path, {**sources, "zq_constant_maturity": strip})
+    assert third["changed"] == {"daily_state": [], "history_state": True}
+    assert not list(tmp_path.glob(".*.tmp"))
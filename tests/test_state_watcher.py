@@ -0,0 +1,59 @@
+import json
+
+from Signals.state_manifest import publish_manifest
+from UI.data_layer import clear_cache, state_generation
+from UI.state_watcher import Change, ManifestWatcher, affects
+
+
+def test_watcher_preloads_new_generations_and_merges_changes(tmp_path):
+    clear_cache()
+    daily = tmp_path / "daily_state.json"
+    history = tmp_path / "history_state.json"
+    manifest_path = tmp_path / "state_manifest.json"
+    sources = {"daily_state": daily, "history_state": history}
+    daily.write_text(json.dumps({"fx": {"dxy": 1}, "labor_market": {"unrate": 4.0}}))
+    history.write_text(json.dumps({"series": {}}))
+    watcher = ManifestWatcher(manifest_path)
+
+    assert not watcher.poll() and watcher.generation is None  # no manifest yet
+    publish_manifest(manifest_path, sources)
+    assert watcher.poll() and watcher.generation == 1
+    # Parsed into the shared cache before any session asks for it.
+    assert state_generation(daily) is not None
+    assert not watcher.poll()
+
+    daily.write_text(json.dumps({"fx": {"dxy": 2}, "labor_market": {"unrate": 4.0}}))
+    publish_manifest(manifest_path, sources)
+    assert watcher.poll()
+    daily.write_text(json.dumps({"fx": {"dxy": 2}, "labor_market": {"unrate": 4.2}}))
+    publish_manifest(manifest_path, sources)
+    assert watcher.poll() and watcher.generation == 3
+
+    change = watcher.changes_since(2)
+    assert change.daily_blocks == {"labor_market"} and not change.history
+    merged = watcher.changes_since(1)
+    assert merged.daily_blocks == {"fx", "labor_market"}
+    assert watcher.changes_since(None) is None
+
+
+def test_watcher_waits_for_a_file_still_being_rewritten(tmp_path):
+    clear_cache()
+    daily = tmp_path / "daily_state.json"
+    manifest_path = tmp_path / "state_manifest.json"
+    daily.write_text(json.dumps({"fx": {"dxy": 1}}))
+    publish_manifest(manifest_path, {"daily_state": daily})
+    daily.write_text(json.dumps({"fx": {"dxy": 99}}))  # newer than the manifest
+
+    watcher = ManifestWatcher(manifest_path)
+    assert not watcher.poll() and watcher.generation is None
+    publish_manifest(manifest_path, {"daily_state": daily})
+    assert watcher.poll() and watcher.generation == 2
+
+
+def test_affects_by_panel_dependencies():
+    change = Change(5, {"fx"}, history=False)
+    assert affects(None, {"fx"}, False)
+    assert affects(change, {"fx", "fx_volatility"}, True)
+    assert not affects(change, {"yield_curve"}, True)
+    assert affects(Change(5, set(), history=True), {"yield_curve"}, True)
+    assert not affects(Change(5, set(), history=True), {"*"}, False)
@@ -0,0 +1,68 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from Data import fetch_fx, fetch_inflation, yfinance_provider
+from Data.providers import synthetic
+from Data.providers.synthetic import SyntheticConfig, generate_series, install
+from Data.utils import fred_provider
+
+
+END = date(2026, 3, 13)
+# conftest replaces the provider function outright; these tests need the real one and its hook.
+REAL_PRICE_HISTORY = yfinance_provider.fetch_price_history
+
+
+@pytest.fixture(autouse=True)
+def _real_price_history(monkeypatch):
+    monkeypatch.setattr(yfinance_provider, "fetch_price_history", REAL_PRICE_HISTORY)
+
+
+def test_series_are_deterministic_and_shaped_by_kind():
+    config = SyntheticConfig(end=END, years=3)
+    vix = generate_series("^VIX", config)
+    assert vix.equals(generate_series("^VIX", config))
+    assert not vix["value"].equals(generate_series("^VIX", SyntheticConfig(end=END, years=3, seed=1))["value"])
+    assert (vix["value"] > 0).all()
+    assert vix["date"].dt.dayofweek.max() < 5
+
+    cpi = generate_series("CPIAUCSL", config)
+    assert (cpi["date"].dt.day == 1).all()
+    # February's print is not out yet on 13 March with the default 45-day lag.
+    assert cpi["date"].iloc[-1] == np.datetime64("2026-01-01")
+    assert cpi["value"].diff().dropna().mean() > 0
+
+    effr = generate_series("EFFR", config)["value"].to_numpy()
+    zq = generate_series("ZQH26.CBT", config)
+    assert zq["date"].iloc[-1] == np.datetime64("2026-03-13")
+    assert abs((100 - zq["value"].iloc[-1]) - effr[-1]) < 0.5
+
+
+def test_gaps_and_missing_values():
+    dense = generate_series("DGS10", SyntheticConfig(end=END, years=2))
+    sparse = generate_series("DGS10", SyntheticConfig(end=END, years=2, gap_rate=0.1, missing_rate=0.1))
+    assert len(sparse) < len(dense)
+    assert sparse["value"].isna().any() and not dense["value"].isna().any()
+
+
+def test_install_swaps_providers_and_restores_them():
+    originals = (yfinance_provider.fetch_price_history, fetch_inflation._try_fred_http, fred_provider._try_openbb_fred)
+    assert not yfinance_provider.STAND_INS and not fred_provider.STAND_INS
+    with install(SyntheticConfig(years=2)) as providers:
+        assert fetch_fx.fetch_eurusd()["status"] == "OK"
+        assert fetch_inflation.fetch_cpi_level()["status"] == "OK"
+        assert providers.calls["yfinance"] == 1 and providers.calls["openbb"] >= 1
+    assert (yfinance_provider.fetch_price_history, fetch_inflation._try_fred_http, fred_provider._try_openbb_fred) == originals
+    assert not yfinance_provider.STAND_INS and not fred_provider.STAND_INS
+
+
+def test_failure_rate_fails_fetches_and_fred_falls_back():
+    with install(SyntheticConfig(years=2, failure_rate=1.0)) as providers:
+        assert fetch_fx.fetch_eurusd()["status"] == "FAILED"
+        assert fetch_inflation.fetch_cpi_level()["status"] == "FAILED"
+    assert providers.failures["openbb"] == providers.failures["fred_http"] >= 1
+
+
+def test_synthetic_fx_tickers():
+    assert synthetic.synthetic_fx_tickers(2) == {"fx_syn001": "SYN001=X", "fx_syn002": "SYN002=X"}
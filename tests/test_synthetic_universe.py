@@ -0,0 +1,27 @@
+import pytest
+
+from Data import yfinance_provider
+from Data.providers.synthetic import SyntheticConfig
+from History import history_state
+from tools.synthetic_universe import install
+
+# conftest replaces the provider function outright; the synthetic hook sits inside the real one.
+REAL_PRICE_HISTORY = yfinance_provider.fetch_price_history
+
+
+@pytest.fixture(autouse=True)
+def _real_price_history(monkeypatch):
+    monkeypatch.setattr(yfinance_provider, "fetch_price_history", REAL_PRICE_HISTORY)
+
+
+def test_install_widens_the_history_universe():
+    series_before = history_state.HISTORY_SERIES
+    with install(SyntheticConfig(years=1), fx_pairs=3):
+        assert history_state.HISTORY_YEARS == 1
+        plan = history_state._history_plan()
+        assert ("fx_syn003", "yfinance", "SYN003=X") in plan
+        records, _, status = history_state._fetch_yfinance_history("SYN003=X")
+        assert status == "OK" and len(records) > 200
+    assert history_state.HISTORY_SERIES == series_before
+    assert "fx_syn003" not in history_state.REALIZED_VOL_KEYS
+    assert history_state.HISTORY_YEARS == 5
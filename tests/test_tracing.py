@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import json
+import os
+
+import pytest
+
+from Signals import state_paths, tracing
+from Signals.json_utils import write_json
+
+
+def _traced_work(index):
+    with tracing.span("work", index=index):
+        return os.getpid()
+
+
+def _complete(trace_path):
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    return [event for event in events if event["ph"] == "X"], events
+
+
+def test_disabled_spans_are_a_shared_noop():
+    assert not tracing.enabled()
+    first = tracing.span("a", key="x")
+    with first as span:
+        span.set(rows=1)
+    assert first is tracing.span("b")
+
+
+def test_session_records_nested_spans_across_threads(tmp_path):
+    path = tmp_path / "run.trace.json"
+    with tracing.session(path, "update"):
+        with tracing.span("outer", series_id="DGS10") as outer:
+            outer.set(rows=3)
+            write_json(tmp_path / "state.json", {"a": 1})
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch") as pool:
+            list(pool.map(_traced_work, range(4)))
+        with pytest.raises(ValueError):
+            with tracing.span("fails"):
+                raise ValueError("boom")
+    assert not tracing.enabled()
+
+    spans, events = _complete(path)
+    by_name = {event["name"]: event for event in spans}
+    assert by_name["outer"]["args"] == {"series_id": "DGS10", "rows": 3}
+    inner = by_name["write_json"]
+    assert inner["args"]["bytes"] > 0
+    assert by_name["outer"]["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= by_name["outer"]["ts"] + by_name["outer"]["dur"]
+    assert by_name["fails"]["args"]["error"] == "ValueError: boom"
+    assert by_name["update"]["dur"] >= by_name["outer"]["dur"]
+    assert len([event for event in spans if event["name"] == "work"]) == 4
+    thread_names = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+    assert any(name.startswith("fetch") for name in thread_names)
+
+
+def test_session_merges_worker_process_spans(tmp_path):
+    path = tmp_path / "run.trace.json"
+    try:
+        with tracing.session(path):
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                worker_pids = set(pool.map(_traced_work, range(4)))
+    except (BrokenProcessPool, OSError, PermissionError):
+        pytest.skip("worker processes are not available here")
+    spans, _ = _complete(path)
+    work = [event for event in spans if event["name"] == "work"]
+    assert sorted(event["args"]["index"] for event in work) == [0, 1, 2, 3]
+    assert {event["pid"] for event in work} == worker_pids
+    assert os.environ.get(tracing.SPOOL_ENV) is None
+
+
+def test_trace_path_from_env(monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_ENV, raising=False)
+    assert tracing.trace_path("update") is None
+    monkeypatch.setenv(tracing.TRACE_ENV, "1")
+    default = tracing.trace_path("update")
+    assert default.parent == state_paths.TRACE_DIR and default.name.startswith("update-")
+    monkeypatch.setenv(tracing.TRACE_ENV, "/tmp/x.json")
+    assert str(tracing.trace_path("update")) == "/tmp/x.json"
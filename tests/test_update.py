@@ -3,7 +3,6 @@ from datetime import datetime
 
 import pytest
 
-import update
 from Data import (
     fetch_credit_spreads,
     fetch_global_policy,
@@ -130,7 +129,7 @@ def test_write_raw_state_handles_failures(tmp_path, monkeypatch):
     def _boom():
         raise RuntimeError("fail")
 
-    monkeypatch.setattr(update.fetch_vol, "fetch_vix", _boom)
+    monkeypatch.setattr(fetch_vol, "fetch_vix", _boom)
     path = tmp_path / "raw_state.json"
     write_raw_state(str(path))
     assert path.exists()
@@ -157,3 +156,32 @@ def test_output_is_pretty_and_stable(tmp_path):
     data = json.loads(content)
     expected = json.dumps(data, indent=2, sort_keys=True)
     assert content.rstrip("\n") == expected
+
+
+def test_write_raw_state_survives_archive_errors(tmp_path):
+    from Signals.state_archive import StateArchive
+
+    StateArchive(tmp_path / "archive").append({"meta": {"generated_at": "2999-01-01T00:00:00+00:00"}}, {})
+    path = tmp_path / "raw_state.json"
+    write_raw_state(str(path))
+    assert path.exists()
+    assert len(StateArchive(tmp_path / "archive")) == 1
+
+
+def test_archive_reads_the_daily_state_next_to_raw_state(tmp_path):
+    from Signals.state_archive import StateArchive
+
+    (tmp_path / "daily_state.json").write_text(json.dumps({"marker": {"run": "scratch"}}))
+    write_raw_state(str(tmp_path / "raw_state.json"))
+    assert StateArchive(tmp_path / "archive").block("daily", "marker") == {"run": "scratch"}
+
+
+def test_report_failures_do_not_fail_the_run(monkeypatch, caplog):
+    import update
+
+    def _broken():
+        raise RuntimeError("renderer unavailable")
+
+    monkeypatch.setattr("UI.report.write_report", _broken)
+    update.write_report_step()
+    assert "dashboard report not written" in caplog.text
@@ -0,0 +1,47 @@
+from UI.view_models import GenerationMemo, rows_to_frame
+
+
+def test_memo_builds_once_per_generation():
+    memo = GenerationMemo(max_entries=2)
+    calls = []
+
+    def build(tag):
+        calls.append(tag)
+        return tag
+
+    assert memo.get("g1", ("vol", "1y"), lambda: build("a")) == "a"
+    assert memo.get("g1", ("vol", "1y"), lambda: build("b")) == "a"
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    # A new generation drops every entry from the old one.
+    assert memo.get("g2", ("vol", "1y"), lambda: build("c")) == "c"
+    assert memo.stats()["entries"] == 1
+
+    # No generation (state file missing): always rebuild, never store.
+    memo.get(None, ("vol", "1y"), lambda: build("d"))
+    memo.get(None, ("vol", "1y"), lambda: build("e"))
+    assert calls == ["a", "c", "d", "e"]
+
+
+def test_memo_is_bounded_lru():
+    memo = GenerationMemo(max_entries=2)
+    memo.get("g", 1, lambda: 1)
+    memo.get("g", 2, lambda: 2)
+    memo.get("g", 1, lambda: 0)
+    memo.get("g", 3, lambda: 3)
+    assert memo.get("g", 1, lambda: -1) == 1
+    assert memo.get("g", 2, lambda: -2) == -2
+
+
+def test_rows_to_frame_is_chart_ready():
+    frame = rows_to_frame(
+        [
+            {"Date": "2024-01-02", "Value": 1.5, "Series": "VIX"},
+            {"Date": "bad", "Value": 2.0, "Series": "VIX"},
+            {"Date": "2024-01-03", "Value": None, "Series": "VIX"},
+        ]
+    )
+    assert list(frame.columns) == ["Date", "Value", "Series"]
+    assert len(frame) == 2
+    assert str(frame["Date"].dtype).startswith("datetime64")
+    assert rows_to_frame([]).empty
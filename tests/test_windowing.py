@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from UI.windowing import DatedSeries
+
+
+def _legacy_window(dates, values, days):
+    df = pd.DataFrame({"Date": pd.to_datetime(dates, errors="coerce"), "Value": values}).dropna(subset=["Date"])
+    df = df[df["Date"] >= df["Date"].max() - pd.Timedelta(days=days)]
+    return [str(day.date()) for day in df["Date"]], df["Value"].tolist()
+
+
+def test_window_matches_dataframe_filter_and_is_a_view():
+    dates = [str(np.datetime64("2020-01-01") + offset) for offset in range(0, 2000, 3)]
+    values = [float(idx) if idx % 7 else None for idx in range(len(dates))]
+    series = DatedSeries.from_block({"dates": dates, "values": values})
+    for days in (365, 1095, 1825):
+        window = series.window(days)
+        expected_dates, expected_values = _legacy_window(dates, values, days)
+        assert [str(day) for day in window.dates] == expected_dates
+        np.testing.assert_array_equal(window.values, np.array(expected_values, dtype="float64"))
+        assert np.shares_memory(window.values, series.values)
+    assert series.window(None) is series
+
+
+def test_cutoff_is_inclusive_and_rows_keep_gaps():
+    series = DatedSeries.from_block({"dates": ["2023-01-01", "2023-12-31", "2024-01-01"], "values": [1, None, 3]})
+    assert series.window(365).to_rows("X") == [
+        {"Date": "2023-01-01", "Value": 1.0, "Series": "X"},
+        {"Date": "2023-12-31", "Value": None, "Series": "X"},
+        {"Date": "2024-01-01", "Value": 3.0, "Series": "X"},
+    ]
+    frame = series.window(1).to_frame("X")
+    assert list(frame.columns) == ["Date", "Value", "Series"]
+    assert len(frame) == 2
+
+
+def test_malformed_blocks():
+    assert len(DatedSeries.from_block({"dates": "x", "values": []})) == 0
+    assert len(DatedSeries.from_block(None).window(365)) == 0
+    odd = DatedSeries.from_block({"dates": ["2024-01-03", "bad", "2024-01-02"], "values": [3, 9, 2]})
+    assert [str(day) for day in odd.dates] == ["2024-01-02", "2024-01-03"]
+    assert odd.values.tolist() == [2.0, 3.0]
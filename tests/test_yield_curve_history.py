@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import numpy as np
+
+from History.yield_curve_history import YieldCurveHistory, build_curve_block
+
+
+def _block():
+    records = {
+        "3M": [(datetime(2024, 1, 2), 5.40), (datetime(2024, 1, 3), 5.41)],
+        "2Y": [(datetime(2024, 1, 2), 4.30), (datetime(2024, 1, 3), 4.35), (datetime(2024, 1, 4), 4.40)],
+        "5Y": [(datetime(2024, 1, 2), 4.00), (datetime(2024, 1, 3), 4.02)],
+        "10Y": [(datetime(2024, 1, 2), 4.10), (datetime(2024, 1, 3), 4.15), (datetime(2024, 1, 4), float("nan"))],
+    }
+    return build_curve_block(records, {tenor: "OK" for tenor in records})
+
+
+def test_spreads_and_butterflies_are_derived_lazily():
+    curve = YieldCurveHistory(_block())
+    assert len(curve) == 3
+    assert not curve._cache
+    np.testing.assert_allclose(curve.derived("2s10s")[:2], [-20.0, -20.0])
+    assert np.isnan(curve.derived("2s10s")[2])
+    assert curve.derived("2s10s") is curve.spread("2Y", "10Y")
+    np.testing.assert_allclose(curve.derived("2Y-5Y-10Y")[:2], [-40.0, -46.0])
+    dates, values = curve.points("3m10y")
+    assert dates == ["2024-01-02", "2024-01-03"]
+    np.testing.assert_allclose(values, [-130.0, -126.0])
+
+
+def test_missing_block_is_empty():
+    curve = YieldCurveHistory.from_history_state({})
+    assert len(curve) == 0
+    assert curve.points("2s10s") == ([], [])
@@ -0,0 +1,95 @@
+import json
+
+import numpy as np
+
+from History.yield_curve_pca import (
+    FACTOR_NAMES,
+    build_yield_curve_factors,
+    decompose,
+    update_state,
+    write_daily_state,
+)
+
+
+TENORS = ["3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y", "20Y", "30Y"]
+
+
+def _history(days, seed=11):
+    rng = np.random.default_rng(seed)
+    maturity = np.array([0.25, 0.5, 1, 2, 3, 5, 7, 10, 20, 30])
+    level = np.cumsum(rng.normal(0, 0.05, days))
+    slope = np.cumsum(rng.normal(0, 0.03, days))
+    curv = np.cumsum(rng.normal(0, 0.01, days))
+    shape = np.exp(-maturity / 2)
+    values = 4 + level[:, None] - slope[:, None] * shape + curv[:, None] * (maturity * np.exp(-maturity / 5))
+    values += rng.normal(0, 0.002, values.shape)
+    dates = [str(np.datetime64("2020-01-01") + day) for day in range(days)]
+    values[17, 4] = np.nan  # one incomplete day is skipped
+    return {"yield_curve": {"tenors": TENORS, "dates": dates, "values": values.T.tolist()}}
+
+
+def _truncate(history, days):
+    curve = history["yield_curve"]
+    return {"yield_curve": {**curve, "dates": curve["dates"][:days], "values": [c[:days] for c in curve["values"]]}}
+
+
+def test_incremental_updates_match_full_rebuild():
+    history = _history(420)
+    _, state = build_yield_curve_factors(_truncate(history, 300), window=120)
+    for days in (301, 305, 360, 420):
+        block, state = build_yield_curve_factors(_truncate(history, days), state, window=120)
+    _, fresh = build_yield_curve_factors(history, None, window=120)
+    assert state["updates_since_rebase"] == 4 and fresh["updates_since_rebase"] == 0
+    assert state["count"] == fresh["count"] == 120
+    np.testing.assert_allclose(state["cross"], fresh["cross"], rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(np.abs(state["loadings"]), np.abs(fresh["loadings"]), atol=1e-8)
+    assert set(block["loadings"]) == set(FACTOR_NAMES)
+    assert block["explained_variance_ratio"]["level"] > 0.5
+
+
+def test_revised_history_inside_the_window_forces_a_rebuild():
+    history = _history(420)
+    _, state = build_yield_curve_factors(_truncate(history, 400), window=120)
+    revised = _history(420)
+    revised["yield_curve"]["values"][3][350] += 0.25  # a revised print inside the stored window
+    revised["yield_curve"]["values"][4][17] = 4.0  # and an old incomplete day now complete
+    _, state = build_yield_curve_factors(_truncate(revised, 405), state, window=120)
+    _, fresh = build_yield_curve_factors(_truncate(revised, 405), None, window=120)
+    assert state["updates_since_rebase"] == 0
+    np.testing.assert_allclose(state["cross"], fresh["cross"], rtol=1e-12)
+    assert state["window_digest"] == fresh["window_digest"]
+
+
+def test_loadings_match_svd_and_stay_sign_consistent():
+    history = _history(300)
+    block, state = build_yield_curve_factors(history, window=200)
+    level = np.array(block["loadings"]["level"])
+    slope = np.array(block["loadings"]["slope"])
+    assert level.sum() > 0 and slope[-1] > slope[0]
+
+    curve = history["yield_curve"]
+    values = np.array(curve["values"]).T
+    complete = values[~np.isnan(values).any(axis=1)]
+    changes = np.diff(complete, axis=0)[-200:] * 100
+    _, _, vt = np.linalg.svd(changes - changes.mean(axis=0), full_matrices=False)
+    np.testing.assert_allclose(np.abs(vt[:3].T), np.abs(np.array(state["loadings"])), atol=1e-6)
+
+    # Flipped stored loadings are tracked rather than reset to the convention.
+    flipped = dict(state, loadings=(-np.array(state["loadings"])).tolist())
+    _, loadings, _ = decompose(flipped)
+    np.testing.assert_allclose(loadings, -np.array(state["loadings"]), atol=1e-10)
+
+
+def test_writer_persists_state_and_handles_missing_history(tmp_path):
+    history_path = tmp_path / "history_state.json"
+    daily_path = tmp_path / "daily_state.json"
+    pca_path = tmp_path / "pca_state.json"
+    history_path.write_text(json.dumps(_history(320)))
+    daily = write_daily_state(history_path, daily_path, pca_path)
+    assert daily["yield_curve_factors"]["status"] == "OK"
+    assert json.loads(pca_path.read_text())["last_date"] == daily["yield_curve_factors"]["as_of"]
+
+    daily = write_daily_state(tmp_path / "missing.json", daily_path, tmp_path / "other_state.json")
+    assert daily["yield_curve_factors"]["status"] == "UNAVAILABLE"
+    assert not (tmp_path / "other_state.json").exists()
+    assert update_state(None, TENORS, [], np.empty((0, 10)))["count"] == 0
@@ -0,0 +1,90 @@
+import json
+from datetime import date
+import time
+
+import numpy as np
+import pandas as pd
+
+from Analytics.policy_path import generate_zq_tickers
+from History.zq_strip import ZQStrip, update_zq_strip, write_zq_strip
+
+
+def _points(days, prices):
+    return np.array(days, dtype="datetime64[D]"), np.array(prices, dtype="float64")
+
+
+def test_generate_zq_tickers_rolls_with_calendar():
+    assert generate_zq_tickers(date(2025, 11, 20), months_ahead=3) == [
+        "ZQX25.CBT",
+        "ZQZ25.CBT",
+        "ZQF26.CBT",
+        "ZQG26.CBT",
+    ]
+    assert generate_zq_tickers(date(2026, 1, 5), months_ahead=0, months_back=1) == ["ZQZ25.CBT", "ZQF26.CBT"]
+
+
+def test_merge_retains_expired_contracts_across_rolls(tmp_path):
+    path = tmp_path / "zq_strip.npz"
+    first = {
+        "ZQZ25.CBT": _points(["2025-12-01", "2025-12-02"], [96.1, 96.2]),
+        "ZQF26.CBT": _points(["2025-12-01", "2025-12-02"], [96.3, np.nan]),
+    }
+    update_zq_strip(path, today=date(2025, 12, 2), months_ahead=1, fetcher=lambda t: first.get(t, _points([], [])))
+
+    calls = []
+
+    def fetcher(ticker):
+        calls.append(ticker)
+        return _points(["2026-01-05"], [96.5]) if ticker == "ZQF26.CBT" else _points([], [])
+
+    strip = update_zq_strip(path, today=date(2026, 1, 5), months_ahead=1, fetcher=fetcher)
+    assert "ZQZ25.CBT" not in calls
+    assert strip.contracts == ["ZQZ25.CBT", "ZQF26.CBT"]
+    assert [str(day) for day in strip.dates] == ["2025-12-01", "2025-12-02", "2026-01-05"]
+    np.testing.assert_allclose(strip.prices[0, :2], [96.1, 96.2], atol=1e-5)
+    assert np.isnan(strip.prices[1, 1])
+    np.testing.assert_allclose(strip.prices[1, 2], 96.5, atol=1e-5)
+    reloaded = ZQStrip.load(path)
+    assert reloaded.contracts == strip.contracts
+    np.testing.assert_allclose(reloaded.prices, strip.prices, atol=1e-5)
+
+
+def test_constant_maturity_interpolates_across_expiries(tmp_path):
+    rates = {"ZQF26.CBT": 4.0, "ZQG26.CBT": 3.9, "ZQH26.CBT": 3.8, "ZQJ26.CBT": 3.6, "ZQK26.CBT": 3.5}
+    strip = ZQStrip.empty().merge({t: _points(["2026-01-01"], [100 - r]) for t, r in rates.items()})
+    out = strip.constant_maturity({"1M": 1, "3M": 3, "6M": 6})
+    # Jan 1 + 1M sits half a month before February's mid-point.
+    np.testing.assert_allclose(out["1M"], [3.95], atol=1e-9)
+    np.testing.assert_allclose(out["3M"], [3.7], atol=1e-9)
+    assert np.isnan(out["6M"][0])
+
+    # A missing quote is bridged by the nearest valid contracts either side.
+    gapped = strip.merge({})
+    gapped.prices[2, 0] = np.nan
+    np.testing.assert_allclose(gapped.constant_maturity({"2M": 2})["2M"], [3.825], atol=1e-9)
+
+    history = tmp_path / "history_state.json"
+    history.write_text(json.dumps({"series": {}}))
+    before = history.stat().st_mtime_ns
+    out = tmp_path / "zq_constant_maturity.json"
+    quotes = {t: _points(["2026-01-01"], [100 - r]) for t, r in rates.items()}
+    write_zq_strip(tmp_path / "zq.npz", out, today=date(2026, 1, 1), fetcher=lambda t: quotes.get(t, _points([], [])))
+    assert json.loads(out.read_text())["series"]["3M"]["values"] == [3.7]
+    assert history.stat().st_mtime_ns == before
+
+
+def test_strip_fetches_one_contract_at_a_time_through_the_engine(tmp_path, monkeypatch):
+    in_flight, peak, order = [0], [0], []
+
+    def _prices(ticker, period="1y", start_date=None, end_date=None):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        order.append(ticker)
+        in_flight[0] -= 1
+        return pd.DataFrame({"date": [pd.Timestamp("2026-01-02")], "close": [96.0]})
+
+    monkeypatch.setattr("Data.yfinance_provider.fetch_price_history", _prices)
+    strip = update_zq_strip(tmp_path / "zq.npz", today=date(2026, 1, 2), months_ahead=5)
+    assert peak[0] == 1
+    assert order == generate_zq_tickers(date(2026, 1, 2), 5) == strip.contracts
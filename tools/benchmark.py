@@ -0,0 +1,403 @@
+"""Benchmarks for the pipeline's hot paths on synthetic inputs at 1x/10x/100x scale.
+
+Scale multiplies today's shape, 26 history series x ~5 years of business
+days. Each scale is a (series, length) multiplier pair whose product is the
+headline factor: 1x = 1 x 1, 10x = 5 x 2, 100x = 20 x 5.
+
+Cases:
+
+- ``select_snapshots``: anchor selection over every synthetic series.
+- ``transforms_for_series``: History rolling/z-score/ROC transforms per series.
+- ``cross_asset_transforms``: the MOVE/VIX block, once per 26 series.
+- ``build_fx_panel``: the FX universe is fixed by ``FX_ORDER``, so scale is
+  the number of (perturbed) raw-state snapshots processed.
+- ``sanitize_data`` / ``write_json``: the scaled history_state.
+- ``write_raw_state_chain``: ``update.write_raw_state`` (every analytics
+  writer and resolver) with fetches replaced by a replayed raw_state, against
+  the scaled history_state, in a scratch directory.
+- ``dashboard_prep``: pyramid level choice, date parsing, 1Y/3Y/5Y windowing
+  and chart frames for every history block, as the dashboard does.
+
+Setup (input generation) is never timed. Time is the min/median of
+``--repeat`` untraced runs. Peak memory comes from one extra run under
+``tracemalloc`` (tracing slows code down, so it is kept out of the timings).
+Results are JSON, and ``--compare OLD.json`` prints new/old time ratios per
+case.
+
+    python tools/benchmark.py --output bench.json
+    python tools/benchmark.py --scales 1x,10x --cases transforms_for_series
+    python tools/benchmark.py --raw-state signals/raw_state.json --compare bench.json
+"""
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import copy
+from datetime import datetime, timezone
+import gc
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import zlib
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np
+import pandas as pd
+
+from Analytics.fx_panel import build_fx_panel
+from Data.providers import synthetic
+from Data.utils.snapshot_selection import select_snapshots
+from History import history_state as hs
+from History.series_pyramid import pick_level
+from Signals import state_paths
+from Signals.json_utils import sanitize_data, write_json
+from UI.windowing import WINDOW_DAYS, DatedSeries
+
+
+SCALES: Dict[str, Tuple[int, int]] = {"1x": (1, 1), "10x": (5, 2), "100x": (20, 5)}
+BASE_DAYS = 5 * 261
+END_DATE = datetime(2026, 1, 2)
+DEFAULT_REPEAT = 3
+
+Scale = Tuple[int, int]
+Runner = Callable[[], Any]
+CASES: Dict[str, Callable[["Inputs"], Runner]] = {}
+
+
+def case(name: str) -> Callable[[Callable[["Inputs"], Runner]], Callable[["Inputs"], Runner]]:
+    def register(setup: Callable[["Inputs"], Runner]) -> Callable[["Inputs"], Runner]:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+# -- synthetic inputs ---------------------------------------------------------
+
+
+def _business_days(length: int) -> pd.DatetimeIndex:
+    return pd.bdate_range(end=END_DATE, periods=length)
+
+
+def _walk(key: str, length: int, level: float = 50.0) -> np.ndarray:
+    rng = np.random.default_rng(zlib.crc32(key.encode("utf-8")))
+    return level * np.exp(np.cumsum(rng.normal(0, 0.01, length)))
+
+
+def synthetic_records(key: str, length: int) -> List[Tuple[datetime, float]]:
+    days = _business_days(length)
+    return [(day.to_pydatetime(), float(value)) for day, value in zip(days, _walk(key, length))]
+
+
+class Inputs:
+    """Synthetic inputs for one scale, built lazily and shared by the cases."""
+
+    def __init__(self, name: str, scale: Scale, raw_state: Dict[str, Any]) -> None:
+        self.name = name
+        self.series_mult, self.length_mult = scale
+        self.length = BASE_DAYS * self.length_mult
+        self.base_plan = hs._history_plan()
+        self.series_count = len(self.base_plan) * self.series_mult
+        self.raw_state = raw_state
+        self._records: Optional[Dict[str, List[Tuple[datetime, float]]]] = None
+        self._history: Optional[Dict[str, Any]] = None
+
+    def plan(self) -> List[Tuple[str, str, str]]:
+        plan = list(self.base_plan)
+        for copy_index in range(1, self.series_mult):
+            plan += [(f"{key}_{copy_index}", provider, f"{sid}#{copy_index}") for key, provider, sid in self.base_plan]
+        return plan
+
+    @property
+    def records(self) -> Dict[str, List[Tuple[datetime, float]]]:
+        if self._records is None:
+            self._records = {key: synthetic_records(key, self.length) for key, _, _ in self.plan()}
+        return self._records
+
+    @property
+    def history(self) -> Dict[str, Any]:
+        """A history_state built by the real builder from synthetic fetch results."""
+        if self._history is None:
+            records = {sid: synthetic_records(sid, self.length) for _, _, sid in self.plan()}
+            for tenor, series_id in hs.CURVE_TENORS:
+                records[series_id] = synthetic_records(series_id, self.length)
+
+            def fake_fetch(provider: str, series_id: str) -> hs.FetchResult:
+                return records.get(series_id, []), provider, "OK", series_id
+
+            with _patched(hs, _fetch_from_provider=fake_fetch, _history_plan=self.plan):
+                self._history = hs.build_history_state(fetch_workers=1, transform_workers=1)
+        return self._history
+
+
+@contextmanager
+def _patched(target: Any, **attrs: Any) -> Iterator[None]:
+    originals = {name: getattr(target, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(target, name, value)
+
+
+@contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def offline_raw_state() -> Dict[str, Any]:
+    """``update.build_raw_state()`` with every provider call answered by the synthetic stand-ins."""
+    import update
+
+    with synthetic.install(synthetic.SyntheticConfig(years=2)):
+        return update.build_raw_state()
+
+
+# -- cases -------------------------------------------------------------------
+
+
+@case("select_snapshots")
+def _select_snapshots(inputs: Inputs) -> Runner:
+    records = list(inputs.records.values())
+    return lambda: [select_snapshots(points) for points in records]
+
+
+@case("transforms_for_series")
+def _transforms(inputs: Inputs) -> Runner:
+    series = {key: hs._series_from_records(points) for key, points in inputs.records.items()}
+    return lambda: {
+        key: hs._transforms_for_series(values, include_realized_vol=key.split("_")[0] in hs.REALIZED_VOL_KEYS)
+        for key, values in series.items()
+    }
+
+
+@case("cross_asset_transforms")
+def _cross_asset(inputs: Inputs) -> Runner:
+    pairs = [
+        (
+            hs._series_from_records(synthetic_records(f"vix_{index}", inputs.length)),
+            hs._series_from_records(synthetic_records(f"move_{index}", inputs.length)),
+        )
+        for index in range(inputs.series_mult)
+    ]
+    return lambda: [hs._cross_asset_transforms(vix, move) for vix, move in pairs]
+
+
+@case("build_fx_panel")
+def _fx_panel(inputs: Inputs) -> Runner:
+    rng = np.random.default_rng(7)
+    snapshots = []
+    for _ in range(inputs.series_mult * inputs.length_mult):
+        raw = copy.deepcopy(inputs.raw_state)
+        for entry in (raw.get("fx") or {}).values():
+            meta = entry.get("meta") if isinstance(entry, dict) else None
+            for key, value in (meta or {}).items():
+                if isinstance(value, float):
+                    meta[key] = value * (1 + rng.normal(0, 0.001))
+        snapshots.append(raw)
+    return lambda: [build_fx_panel(raw) for raw in snapshots]
+
+
+@case("sanitize_data")
+def _sanitize(inputs: Inputs) -> Runner:
+    history = inputs.history
+    return lambda: sanitize_data(history)
+
+
+@case("write_json")
+def _write_json(inputs: Inputs) -> Runner:
+    history = inputs.history
+    target = Path(tempfile.mkdtemp(prefix="bench-json-")) / "history_state.json"
+    return lambda: write_json(target, history)
+
+
+@case("write_raw_state_chain")
+def _chain(inputs: Inputs) -> Runner:
+    import update
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench-chain-"))
+    write_json(workdir / state_paths.HISTORY_STATE_PATH, inputs.history)
+    replay = inputs.raw_state
+
+    def run() -> None:
+        with _chdir(workdir), _patched(update, build_raw_state=lambda: copy.deepcopy(replay)):
+            update.write_raw_state(state_paths.RAW_STATE_PATH)
+
+    return run
+
+
+@case("dashboard_prep")
+def _dashboard_prep(inputs: Inputs) -> Runner:
+    from History.yield_curve_history import NAMED_SPREADS, YieldCurveHistory
+
+    history = json.loads(json.dumps(inputs.history))  # as parsed from disk
+    pyramids = history.get("pyramids", {})
+    blocks: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    for key, block in history["series"].items():
+        blocks.append((block, pyramids.get("series", {}).get(key, {})))
+    for key, transforms in history["transforms"].items():
+        for name, block in transforms.items():
+            blocks.append((block, pyramids.get("transforms", {}).get(key, {}).get(name, {})))
+
+    def run() -> None:
+        for full, levels in blocks:
+            for window, days in WINDOW_DAYS.items():
+                _, block = pick_level(full, levels, days)
+                DatedSeries.from_block(block).window(days).to_frame(window)
+        curve = YieldCurveHistory.from_history_state(history)
+        for name in NAMED_SPREADS:
+            values = curve.derived(name)
+            keep = ~np.isnan(values)
+            for days in WINDOW_DAYS.values():
+                DatedSeries(curve.dates[keep], values[keep]).window(days).to_frame(name)
+
+    return run
+
+
+# -- runner ------------------------------------------------------------------
+
+
+def measure(runner: Runner, repeat: int) -> Dict[str, Any]:
+    timings = []
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        runner()
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        runner()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds_min": round(min(timings), 6),
+        "seconds_median": round(statistics.median(timings), 6),
+        "seconds_all": [round(value, 6) for value in timings],
+        "peak_mib": round(peak / 2**20, 3),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    scales: Optional[Dict[str, Scale]] = None,
+    cases: Optional[List[str]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    raw_state: Optional[Dict[str, Any]] = None,
+    log: Callable[[str], None] = lambda line: None,
+) -> Dict[str, Any]:
+    scales = scales or SCALES
+    names = cases or list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(f"unknown benchmark cases: {', '.join(unknown)}")
+    raw_state = raw_state if raw_state is not None else offline_raw_state()
+    results = []
+    for scale_name, scale in scales.items():
+        inputs = Inputs(scale_name, scale, raw_state)
+        for name in names:
+            runner = CASES[name](inputs)
+            stats = measure(runner, repeat)
+            results.append(
+                {
+                    "case": name,
+                    "scale": scale_name,
+                    "series": inputs.series_count,
+                    "points_per_series": inputs.length,
+                    **stats,
+                }
+            )
+            log(f"{name:<24} {scale_name:>5}  {stats['seconds_median'] * 1000:10.1f} ms  {stats['peak_mib']:9.1f} MiB")
+    return {
+        "meta": {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "scales": {name: list(scale) for name, scale in scales.items()},
+        },
+        "results": results,
+    }
+
+
+def compare(new: Dict[str, Any], old: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per (case, scale): new/old median time and peak-memory ratios."""
+    previous = {(row["case"], row["scale"]): row for row in old.get("results", [])}
+    rows = []
+    for row in new.get("results", []):
+        before = previous.get((row["case"], row["scale"]))
+        if before is None:
+            continue
+        rows.append(
+            {
+                "case": row["case"],
+                "scale": row["scale"],
+                "time_ratio": round(row["seconds_median"] / before["seconds_median"], 3) if before["seconds_median"] else None,
+                "memory_ratio": round(row["peak_mib"] / before["peak_mib"], 3) if before["peak_mib"] else None,
+            }
+        )
+    return rows
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark pipeline hot paths at scaled data sizes.")
+    parser.add_argument("--scales", default=",".join(SCALES), help=f"Comma-separated subset of {', '.join(SCALES)}.")
+    parser.add_argument("--cases", default=None, help=f"Comma-separated subset of: {', '.join(CASES)}.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--raw-state", default=None, help="raw_state.json to replay (default: built offline).")
+    parser.add_argument("--output", default=None, help="Write results JSON here (default: stdout).")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to compare against.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    scales = {name: SCALES[name] for name in args.scales.split(",") if name}
+    cases = args.cases.split(",") if args.cases else None
+    raw_state = json.loads(Path(args.raw_state).read_text(encoding="utf-8")) if args.raw_state else None
+    results = run_suite(scales, cases, args.repeat, raw_state, log=lambda line: print(line, file=sys.stderr))
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.compare:
+        for row in compare(results, json.loads(Path(args.compare).read_text(encoding="utf-8"))):
+            print(
+                f"{row['case']:<24} {row['scale']:>5}  time x{row['time_ratio']}  memory x{row['memory_ratio']}",
+                file=sys.stderr,
+            )
+
+
+if __name__ == "__main__":
+    main()
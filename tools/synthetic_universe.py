@@ -0,0 +1,76 @@
+"""Widen the pipeline's universe for synthetic load runs.
+
+``scaled_universe`` patches, for the duration of a block, the history plan
+(extra synthetic FX pairs, history length) and the ZQ strip length used by
+``History/`` and ``update.py``. ``install`` combines it with the offline
+providers from ``Data.providers.synthetic``:
+
+    with install(SyntheticConfig(years=30), fx_pairs=300, zq_months_ahead=36) as providers:
+        write_history_state()
+    print(providers.calls)
+"""
+from __future__ import annotations
+
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+import sys
+from typing import Any, Iterator, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from Analytics.policy_path import generate_zq_tickers
+from Data.providers import synthetic
+from Data.providers.synthetic import SyntheticConfig, SyntheticProviders, synthetic_fx_tickers
+from History import history_state, zq_strip
+from Signals.series_registry import SeriesSpec
+import update
+
+
+@contextmanager
+def _attributes(target: Any, **attrs: Any) -> Iterator[None]:
+    previous = {name: getattr(target, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(target, name, value)
+
+
+@contextmanager
+def scaled_universe(years: int, fx_pairs: int = 0, zq_months_ahead: Optional[int] = None) -> Iterator[None]:
+    """``years`` of history, ``fx_pairs`` extra FX series and an optional longer ZQ strip."""
+    extra_fx = [
+        SeriesSpec(key, "yfinance", ticker, attrs={"transforms": ["realized_vol"]})
+        for key, ticker in synthetic_fx_tickers(fx_pairs).items()
+    ]
+    with ExitStack() as stack:
+        stack.enter_context(
+            _attributes(
+                history_state,
+                HISTORY_YEARS=years,
+                HISTORY_SERIES=history_state.HISTORY_SERIES + tuple(extra_fx),
+                REALIZED_VOL_KEYS=history_state.REALIZED_VOL_KEYS | {spec.key for spec in extra_fx},
+            )
+        )
+        if zq_months_ahead is not None:
+            stack.enter_context(_attributes(zq_strip, STRIP_MONTHS_AHEAD=zq_months_ahead))
+            stack.enter_context(
+                _attributes(update, _load_zq_contracts=lambda *_: generate_zq_tickers(months_ahead=zq_months_ahead))
+            )
+        yield
+
+
+@contextmanager
+def install(
+    config: Optional[SyntheticConfig] = None,
+    fx_pairs: int = 0,
+    zq_months_ahead: Optional[int] = None,
+) -> Iterator[SyntheticProviders]:
+    """Synthetic providers plus a universe scaled to ``config.years``, ``fx_pairs`` and ``zq_months_ahead``."""
+    config = config or SyntheticConfig()
+    with synthetic.install(config) as providers, scaled_universe(config.years, fx_pairs, zq_months_ahead):
+        yield providers